@@ -0,0 +1,37 @@
+"""
+Aggregation Kernels
+Tight numeric loops over LedgerRecords columns used by the statistics service
+
+Author: Rickey
+Date: 2026.10.15
+"""
+
+
+def category_totals(indices, cents, codes, categories: list) -> tuple:
+    """
+    单次遍历选中的记录，以整数分累加总额与各类别金额（结果精确，无需再四舍五入）
+    类别按编码直接写入列表槽位（即 bincount），不做字符串哈希
+
+    参数:
+        indices: 要统计的记录下标；类别字典的顺序跟随此处的下标顺序，
+                 调用方应按文件顺序传入（range 或 LedgerRecords.indices_between 的结果，
+                 后者会把按日期二分得到的下标重新排序为文件顺序）
+        cents: 金额列（整数分）
+        codes: 类别编码列
+        categories: 类别名称列表（按编码索引）
+
+    返回:
+        (总额, 类别 -> 金额字典)，单位为分，字典按类别在 indices 中首次出现的顺序排列
+    """
+    total = 0
+    sums = [0] * len(categories)
+
+    # 与 bincount 相同：按编码直接累加到槽位，循环内没有分支
+    for i in indices:
+        amount = cents[i]
+        total += amount
+        sums[codes[i]] += amount
+
+    # 在 C 层按 indices 中的首次出现顺序对编码去重，金额为 0 的类别也会保留
+    order = dict.fromkeys(map(codes.__getitem__, indices))
+    return total, {categories[code]: sums[code] for code in order}
@@ -6,6 +6,8 @@ Author: Rickey
 Date: 2025.10.22
 """
 
+import sys
+import threading
 from datetime import datetime
 
 
@@ -30,6 +32,35 @@ class CurrencyService:
         """初始化 CurrencyService"""
         self.base_currency = 'AUD'
         self.last_updated = datetime.now()
+        # 格式化后的更新时间，随 last_updated 一起更新，显示时无需再调用 strftime
+        self.last_updated_str = self.last_updated.strftime("%Y-%m-%d %H:%M:%S")
+        self._pair_rates = {}
+        self._update_lock = threading.Lock()
+        # 货币代码 -> 汇率信息字典，汇率更新时清空
+        self._rate_info_cache = {}
+        # 全部货币的 (rate_to_aud, rate_from_aud) 映射，汇率更新时清空
+        self._all_rates_cache = None
+        self._build_pair_rates()
+        # 原始输入 -> 规范化货币代码，仅缓存受支持的代码
+        self._canon_codes = {code: code for code in self.EXCHANGE_RATES}
+    
+    def _canon(self, code: str) -> str:
+        """将货币代码规范化为大写，已见过的受支持代码直接查表返回"""
+        canon = self._canon_codes.get(code)
+        if canon is None:
+            canon = sys.intern(code.upper())
+            if canon in self.EXCHANGE_RATES:
+                self._canon_codes[code] = canon
+        return canon
+    
+    def _build_pair_rates(self):
+        """预先计算所有货币对的汇率表 (from, to) -> rate"""
+        rates = self.EXCHANGE_RATES
+        self._pair_rates = {
+            (from_currency, to_currency): rates[to_currency] / rates[from_currency]
+            for from_currency in rates
+            for to_currency in rates
+        }
     
     def get_exchange_rate(self, from_currency: str, to_currency: str) -> float:
         """
@@ -45,8 +76,8 @@ class CurrencyService:
         抛出:
             ValueError: 如果货币代码不受支持
         """
-        from_currency = from_currency.upper()
-        to_currency = to_currency.upper()
+        from_currency = self._canon(from_currency)
+        to_currency = self._canon(to_currency)
         
         if from_currency not in self.EXCHANGE_RATES:
             raise ValueError(f"不支持的源货币: {from_currency}")
@@ -54,15 +85,9 @@ class CurrencyService:
         if to_currency not in self.EXCHANGE_RATES:
             raise ValueError(f"不支持的目标货币: {to_currency}")
         
-        # 通过基础货币 (AUD) 转换
-        # 汇率 = (1单位源货币的AUD值) / (1单位目标货币的AUD值)
-        from_rate = self.EXCHANGE_RATES[from_currency]
-        to_rate = self.EXCHANGE_RATES[to_currency]
-        
+        # 汇率表已通过基础货币 (AUD) 预先计算
         # 汇率: 每1单位源货币可兑换多少单位目标货币
-        exchange_rate = to_rate / from_rate
-        
-        return exchange_rate
+        return self._pair_rates[(from_currency, to_currency)]
     
     def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
         """
@@ -82,7 +107,7 @@ class CurrencyService:
         if amount < 0:
             raise ValueError("金额不能为负数")
         
-        if from_currency.upper() == to_currency.upper():
+        if self._canon(from_currency) == self._canon(to_currency):
             return amount
         
         exchange_rate = self.get_exchange_rate(from_currency, to_currency)
@@ -109,7 +134,7 @@ class CurrencyService:
         返回:
             支持返回 True，否则返回 False
         """
-        return currency.upper() in self.EXCHANGE_RATES
+        return self._canon(currency) in self.EXCHANGE_RATES
     
     def update_exchange_rate(self, currency: str, rate_to_aud: float):
         """
@@ -122,7 +147,7 @@ class CurrencyService:
         抛出:
             ValueError: 如果货币代码不受支持
         """
-        currency = currency.upper()
+        currency = self._canon(currency)
         
         if currency == 'AUD':
             raise ValueError("无法更新 AUD 汇率（基础货币）")
@@ -133,8 +158,14 @@ class CurrencyService:
         if rate_to_aud <= 0:
             raise ValueError("汇率必须为正数")
         
-        self.EXCHANGE_RATES[currency] = rate_to_aud
-        self.last_updated = datetime.now()
+        # 共享实例可能被多处同时更新，汇率与汇率表需一起替换
+        with self._update_lock:
+            self.EXCHANGE_RATES[currency] = rate_to_aud
+            self._build_pair_rates()
+            self._rate_info_cache = {}
+            self._all_rates_cache = None
+            self.last_updated = datetime.now()
+            self.last_updated_str = self.last_updated.strftime("%Y-%m-%d %H:%M:%S")
     
     def get_rate_info(self, currency: str) -> dict:
         """
@@ -149,18 +180,41 @@ class CurrencyService:
         抛出:
             ValueError: 如果货币代码不受支持
         """
-        if not self.is_currency_supported(currency):
-            raise ValueError(f"不支持的货币: {currency}")
+        currency = self._canon(currency)
         
-        currency = currency.upper()
-        rate_to_aud = self.EXCHANGE_RATES[currency]
+        info = self._rate_info_cache.get(currency)
+        if info is None:
+            if currency not in self.EXCHANGE_RATES:
+                raise ValueError(f"不支持的货币: {currency}")
+            
+            rate_to_aud = self.EXCHANGE_RATES[currency]
+            info = {
+                'currency': currency,
+                'rate_to_aud': rate_to_aud,
+                'rate_from_aud': round(1.0 / rate_to_aud, 4) if currency != 'AUD' else 1.0,
+                'last_updated': self.last_updated_str
+            }
+            self._rate_info_cache[currency] = info
         
-        return {
-            'currency': currency,
-            'rate_to_aud': rate_to_aud,
-            'rate_from_aud': round(1.0 / rate_to_aud, 4) if currency != 'AUD' else 1.0,
-            'last_updated': self.last_updated.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        # 返回副本，避免调用方修改缓存内容
+        return dict(info)
+    
+    def get_all_rate_infos(self) -> dict:
+        """
+        一次性获取所有支持货币的汇率信息
+        
+        返回:
+            货币代码到 (rate_to_aud, rate_from_aud) 元组的字典，按支持货币的顺序排列
+            （返回缓存对象，调用方不应修改）
+        """
+        rates = self._all_rates_cache
+        if rates is None:
+            rates = {
+                currency: (rate_to_aud, round(1.0 / rate_to_aud, 4) if currency != 'AUD' else 1.0)
+                for currency, rate_to_aud in self.EXCHANGE_RATES.items()
+            }
+            self._all_rates_cache = rates
+        return rates
     
     def convert_multiple(self, amounts: dict, to_currency: str) -> dict:
         """
@@ -177,23 +231,44 @@ class CurrencyService:
         抛出:
             ValueError: 如果任何货币代码不受支持
         """
-        if not self.is_currency_supported(to_currency):
+        to_currency = self._canon(to_currency)
+        
+        if to_currency not in self.EXCHANGE_RATES:
             raise ValueError(f"不支持的目标货币: {to_currency}")
         
+        pair_rates = self._pair_rates
         converted = {}
-        total = 0.0
+        # 总计按整数分累加，结果精确且无需最后再四舍五入
+        total_cents = 0
         
+        # 单次遍历直接查汇率表，不再逐项调用 convert()
         for currency, amount in amounts.items():
             if amount == 0:
                 converted[currency] = 0.0
                 continue
             
-            converted_amount = self.convert(amount, currency, to_currency)
+            if amount < 0:
+                raise ValueError("金额不能为负数")
+            
+            from_currency = self._canon(currency)
+            if from_currency not in self.EXCHANGE_RATES:
+                raise ValueError(f"不支持的源货币: {from_currency}")
+            
+            if from_currency == to_currency:
+                converted_amount = amount
+            else:
+                converted_amount = round(amount * pair_rates[(from_currency, to_currency)], 2)
+            
             converted[currency] = converted_amount
-            total += converted_amount
+            total_cents += round(converted_amount * 100)
         
         return {
             'converted_amounts': converted,
-            'total': round(total, 2),
-            'target_currency': to_currency.upper()
+            'total': total_cents / 100,
+            'target_currency': to_currency
         }
+
+
+# 全局共享的 CurrencyService 实例，视图层应直接使用它而不是各自创建
+# （汇率表和更新时间只需构建一份）
+default_service = CurrencyService()
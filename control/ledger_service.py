@@ -7,9 +7,22 @@ Date: 2025.10.19
 """
 
 import os
+import re
 import csv
-from datetime import datetime
+import io
+import json
+import shutil
+import sys
+import itertools
+import calendar
+import tempfile
 from model.ledger import Ledger
+from model.ledger_records import LedgerRecords
+from control.ledger_writer import LedgerWriter
+
+
+# YYYY-MM-DD 日期格式（月、日允许一位数字，与 strptime 的 %m/%d 一致）
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
 
 
 class LedgerService:
@@ -26,16 +39,37 @@ class LedgerService:
         'CAD': 'Canadian Dollar',
         'HKD': 'Hong Kong Dollar'
     }
+    # CSV 表头字段
+    FIELDNAMES = ('year', 'month', 'day', 'amount', 'category', 'description')
+    
+    # 仅用于成员检查的货币代码集合，显示名称仍从上面的字典获取
+    _SUPPORTED = frozenset(SUPPORTED_CURRENCIES)
+    
+    # 视图层共享的实例，由 instance() 首次调用时创建
+    _INSTANCE = None
     
     def __init__(self):
         """初始化 LedgerService"""
         self.base_path = "data/ledgers"
+        # 已解析记录缓存: 文件路径 -> ((修改时间, 大小, inode), 记录列表, 列式记录或 None)
+        self._row_cache = {}
         self._ensure_base_directory()
     
+    @classmethod
+    def instance(cls) -> 'LedgerService':
+        """
+        获取共享的 LedgerService 实例（首次调用时创建）
+        
+        返回:
+            进程内共享的 LedgerService 对象，各视图共用同一份记录缓存
+        """
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls()
+        return cls._INSTANCE
+    
     def _ensure_base_directory(self):
         """确保基础账本目录存在"""
-        if not os.path.exists(self.base_path):
-            os.makedirs(self.base_path)
+        os.makedirs(self.base_path, exist_ok=True)
     
     def create_default_ledger(self, username: str = None, currency: str = "AUD") -> Ledger:
         """
@@ -59,12 +93,7 @@ class LedgerService:
                 folder_path = f"{self.base_path}/local-default"
             
             # 从现有文件读取货币信息
-            expenses_path = f"{folder_path}/expenses.csv"
-            if os.path.exists(expenses_path):
-                with open(expenses_path, 'r', encoding='utf-8') as f:
-                    first_line = f.readline()
-                    if first_line.startswith("# Currency:"):
-                        currency = first_line.split(":")[1].strip()
+            currency = self._read_currency(folder_path, currency)
             
             return Ledger("default", currency, username)
         except Exception as e:
@@ -84,21 +113,20 @@ class LedgerService:
             创建成功返回账本对象，否则返回 None
         """
         # 验证货币
-        if currency.upper() not in self.SUPPORTED_CURRENCIES:
+        if currency.upper() not in self._SUPPORTED:
             raise ValueError(f"不支持的货币: {currency}。支持的货币: {list(self.SUPPORTED_CURRENCIES.keys())}")
         
         # 创建账本对象
         ledger = Ledger(ledger_name, currency.upper(), username)
         folder_path = ledger.get_folder_path()
         
-        # 检查账本是否已存在
-        if os.path.exists(folder_path):
-            raise FileExistsError(f"账本 '{ledger_name}' 已存在！")
-        
+        # 创建账本文件夹，已存在时 makedirs 会原子地抛出 FileExistsError
         try:
-            # 创建账本文件夹
             os.makedirs(folder_path)
-            
+        except FileExistsError:
+            raise FileExistsError(f"账本 '{ledger_name}' 已存在！") from None
+        
+        try:
             # 创建支出 CSV 文件并写入表头
             expenses_path = ledger.get_expenses_file_path()
             with open(expenses_path, 'w', newline='', encoding='utf-8') as f:
@@ -106,7 +134,7 @@ class LedgerService:
                 f.write(f"# Currency: {currency.upper()}\n")
                 # 写入 CSV 表头
                 writer = csv.writer(f)
-                writer.writerow(['year', 'month', 'day', 'amount', 'category', 'description'])
+                writer.writerow(self.FIELDNAMES)
             
             # 创建收入 CSV 文件并写入表头
             income_path = ledger.get_income_file_path()
@@ -115,14 +143,17 @@ class LedgerService:
                 f.write(f"# Currency: {currency.upper()}\n")
                 # 写入 CSV 表头
                 writer = csv.writer(f)
-                writer.writerow(['year', 'month', 'day', 'amount', 'category', 'description'])
+                writer.writerow(self.FIELDNAMES)
+            
+            # 货币信息另存一份到 meta.json，列出账本时无需打开 CSV
+            with open(ledger.get_meta_file_path(), 'w', encoding='utf-8') as f:
+                json.dump({'currency': currency.upper()}, f)
             
             return ledger
             
         except Exception as e:
             # 如果创建失败则清理
             if os.path.exists(folder_path):
-                import shutil
                 shutil.rmtree(folder_path)
             raise Exception(f"创建账本失败: {e}")
     
@@ -143,18 +174,7 @@ class LedgerService:
         try:
             expenses_path = ledger.get_expenses_file_path()
             
-            # 解析日期获取年、月、日
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            day = date_obj.day
-            
-            # 追加到 CSV
-            with open(expenses_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([year, month, day, amount, category, description])
-            
-            return True
+            return self._append_records(expenses_path, [(date, amount, category, description)])
         except Exception as e:
             print(f"添加支出时出错: {e}")
             return False
@@ -176,22 +196,181 @@ class LedgerService:
         try:
             income_path = ledger.get_income_file_path()
             
-            # 解析日期获取年、月、日
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            day = date_obj.day
+            return self._append_records(income_path, [(date, amount, category, description)])
+        except Exception as e:
+            print(f"添加收入时出错: {e}")
+            return False
+    
+    def add_expenses_bulk(self, ledger: Ledger, records: list) -> bool:
+        """
+        批量向账本添加支出记录，整批只打开一次文件
+        
+        参数:
+            ledger: 账本对象
+            records: (日期, 金额, 类别, 描述) 元组列表，日期为 YYYY-MM-DD 格式
             
-            # 追加到 CSV
-            with open(income_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([year, month, day, amount, category, description])
+        返回:
+            全部添加成功返回 True，否则返回 False（此时不写入任何记录）
+        """
+        try:
+            return self._append_records(ledger.get_expenses_file_path(), records)
+        except Exception as e:
+            print(f"批量添加支出时出错: {e}")
+            return False
+    
+    def add_income_bulk(self, ledger: Ledger, records: list) -> bool:
+        """
+        批量向账本添加收入记录，整批只打开一次文件
+        
+        参数:
+            ledger: 账本对象
+            records: (日期, 金额, 类别, 描述) 元组列表，日期为 YYYY-MM-DD 格式
             
-            return True
+        返回:
+            全部添加成功返回 True，否则返回 False（此时不写入任何记录）
+        """
+        try:
+            return self._append_records(ledger.get_income_file_path(), records)
         except Exception as e:
-            print(f"添加收入时出错: {e}")
+            print(f"批量添加收入时出错: {e}")
             return False
     
+    def writer(self, ledger: Ledger) -> LedgerWriter:
+        """
+        获取账本的批量写入器，在 with 块内保持文件打开，退出时统一刷新
+        与 add_*_bulk 不同，写入器逐条写入：某条记录日期无效时，之前的记录仍会保留在文件中
+        
+        示例:
+            with ledger_service.writer(ledger) as w:
+                w.add_expense("2025-01-15", 50.0, "food", "Lunch")
+        
+        参数:
+            ledger: 账本对象
+            
+        返回:
+            LedgerWriter 对象
+        """
+        return LedgerWriter(self, ledger)
+    
+    def _append_records(self, file_path: str, records: list) -> bool:
+        """
+        将多条记录一次性追加到 CSV 文件
+        
+        参数:
+            file_path: CSV 文件路径
+            records: (日期, 金额, 类别, 描述) 元组列表
+            
+        返回:
+            追加成功返回 True
+            
+        抛出:
+            ValueError: 如果任一日期无效（先整体解析，避免写入部分记录）
+        """
+        field_rows = [
+            ['' if value is None else str(value) for value in (*self._parse_date(date), amount, category, description)]
+            for date, amount, category, description in records
+        ]
+        
+        text = ''.join(self._format_row(fields) for fields in field_rows)
+        cached = self._row_cache.get(file_path)
+        fresh = cached is not None and cached[0] == self._stat_key(file_path)
+        
+        with open(file_path, 'a', newline='', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(text)
+        
+        # 缓存与写入前的文件一致、且期间没有其他写入时，直接把新记录追加到缓存，避免下次读取重新解析整个文件
+        new_key = self._stat_key(file_path)
+        fresh = fresh and new_key[1] == cached[0][1] + len(text.encode('utf-8'))
+        if fresh and (not cached[1] or tuple(cached[1][0]) == self.FIELDNAMES):
+            _, rows, ledger_records = cached
+            try:
+                for fields in field_rows:
+                    fields[4] = sys.intern(fields[4])  # 与读取时一致，驻留类别字符串
+                    row = dict(zip(self.FIELDNAMES, fields))
+                    rows.append(row)
+                    if ledger_records is not None:
+                        ledger_records.append_row(row)
+            except Exception:
+                # 数据已写入磁盘，缓存更新失败时只丢弃缓存（下次读取重新解析），不影响返回值
+                self._row_cache.pop(file_path, None)
+                return True
+            self._row_cache[file_path] = (new_key, rows, ledger_records)
+        else:
+            self._row_cache.pop(file_path, None)
+        return True
+    
+    def format_record(self, date: str, amount: float, category: str, description: str = "") -> str:
+        """
+        将一条记录格式化为可直接追加到账本 CSV 文件的文本
+        
+        参数:
+            date: 日期，YYYY-MM-DD 格式
+            amount: 金额
+            category: 类别
+            description: 可选描述
+            
+        返回:
+            以 \\r\\n 结尾的 CSV 行
+            
+        抛出:
+            ValueError: 如果日期无效
+        """
+        return self._format_row((*self._parse_date(date), amount, category, description))
+    
+    def invalidate(self, file_path: str):
+        """
+        丢弃某个 CSV 文件的记录缓存（绕过本服务写入文件后调用），下次读取时重新解析
+        
+        参数:
+            file_path: CSV 文件路径
+        """
+        self._row_cache.pop(file_path, None)
+    
+    @staticmethod
+    def _format_row(row) -> str:
+        """
+        将一行记录格式化为 CSV 文本，普通字段直接拼接，含逗号、引号或换行的字段交给 csv 模块转义
+        
+        参数:
+            row: 字段序列（年, 月, 日, 金额, 类别, 描述）
+            
+        返回:
+            以 \\r\\n 结尾的 CSV 行，与 csv.writer 的输出一致
+        """
+        fields = ['' if value is None else str(value) for value in row]
+        line = ','.join(fields)
+        
+        if '"' in line or '\n' in line or '\r' in line or line.count(',') != len(fields) - 1:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(fields)
+            return buffer.getvalue()
+        
+        return line + '\r\n'
+    
+    @staticmethod
+    def _parse_date(date: str) -> tuple:
+        """
+        解析 YYYY-MM-DD 格式的日期，直接切分字段，不构造 datetime 对象
+        
+        参数:
+            date: 日期字符串
+            
+        返回:
+            (年, 月, 日) 整数元组
+            
+        抛出:
+            ValueError: 如果日期格式无效或日期不存在
+        """
+        match = _DATE_RE.fullmatch(date)
+        if match is None:
+            raise ValueError(f"日期格式无效: {date}")
+        
+        year, month, day = int(match[1]), int(match[2]), int(match[3])
+        if year < 1 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+            raise ValueError(f"日期无效: {date}")
+        
+        return year, month, day
+    
     def get_expenses(self, ledger: Ledger) -> list:
         """
         从账本获取所有支出记录
@@ -200,31 +379,19 @@ class LedgerService:
             ledger: 账本对象
             
         返回:
-            支出记录字典列表
+            支出记录字典列表（新建的字典，可自由修改）
         """
-        expenses = []
         expenses_path = ledger.get_expenses_file_path()
         
         if not os.path.exists(expenses_path):
-            return expenses
+            return []
         
         try:
-            with open(expenses_path, 'r', encoding='utf-8') as f:
-                # 如果存在注释行则跳过
-                first_line = f.readline()
-                if first_line.startswith('#'):
-                    # 注释行，正常读取
-                    f.seek(0)
-                    f.readline()  # 跳过注释
-                
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('year'):  # 包含年份字段的有效行
-                        expenses.append(row)
+            # 逐行复制，调用方原地修改记录不会影响缓存
+            return [dict(row) for row in self._load_rows(expenses_path)]
         except Exception as e:
             print(f"读取支出时出错: {e}")
-        
-        return expenses
+            return []
     
     def get_income(self, ledger: Ledger) -> list:
         """
@@ -234,31 +401,126 @@ class LedgerService:
             ledger: 账本对象
             
         返回:
-            收入记录字典列表
+            收入记录字典列表（新建的字典，可自由修改）
         """
-        income = []
         income_path = ledger.get_income_file_path()
         
         if not os.path.exists(income_path):
-            return income
+            return []
         
         try:
-            with open(income_path, 'r', encoding='utf-8') as f:
-                # 如果存在注释行则跳过
-                first_line = f.readline()
-                if first_line.startswith('#'):
-                    # 注释行，正常读取
-                    f.seek(0)
-                    f.readline()  # 跳过注释
-                
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('year'):  # 包含年份字段的有效行
-                        income.append(row)
+            # 逐行复制，调用方原地修改记录不会影响缓存
+            return [dict(row) for row in self._load_rows(income_path)]
+        except Exception as e:
+            print(f"读取收入时出错: {e}")
+            return []
+    
+    def _load_rows(self, file_path: str) -> list:
+        """
+        读取 CSV 文件中的有效记录，文件未变化时直接返回缓存的解析结果
+        
+        参数:
+            file_path: CSV 文件路径
+            
+        返回:
+            记录字典列表（缓存对象，调用方不应修改）
+        """
+        key = self._stat_key(file_path)
+        
+        cached = self._row_cache.get(file_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        rows = []
+        with open(file_path, 'r', newline='', encoding='utf-8', buffering=1 << 16) as f:
+            # 如果存在注释行则跳过，否则把已读出的首行放回表头位置
+            first_line = f.readline()
+            lines = f if first_line.startswith('#') else itertools.chain([first_line], f)
+            
+            # 直接使用 C 实现的 csv.reader，再按表头组装字典，省去 DictReader 的逐行开销
+            reader = csv.reader(lines)
+            fieldnames = next(reader, None)
+            if fieldnames and 'year' in fieldnames:
+                year_index = fieldnames.index('year')
+                # 类别只有少数几种取值，驻留后各行共用同一字符串对象，字典查找可直接按身份比较
+                category_index = fieldnames.index('category') if 'category' in fieldnames else None
+                width = len(fieldnames)
+                for values in reader:
+                    if len(values) > year_index and values[year_index]:  # 包含年份字段的有效行
+                        if len(values) < width:
+                            values += [None] * (width - len(values))
+                        if category_index is not None and values[category_index] is not None:
+                            values[category_index] = sys.intern(values[category_index])
+                        rows.append(dict(zip(fieldnames, values)))
+        
+        self._row_cache[file_path] = (key, rows, None)
+        return rows
+    
+    def get_expense_records(self, ledger: Ledger) -> LedgerRecords:
+        """
+        以列式结构获取账本的所有支出记录，供统计分析使用
+        
+        参数:
+            ledger: 账本对象
+            
+        返回:
+            LedgerRecords 对象（缓存对象，调用方不应修改）
+        """
+        expenses_path = ledger.get_expenses_file_path()
+        
+        if not os.path.exists(expenses_path):
+            return LedgerRecords()
+        
+        try:
+            return self._load_records(expenses_path)
+        except Exception as e:
+            print(f"读取支出时出错: {e}")
+            return LedgerRecords()
+    
+    def get_income_records(self, ledger: Ledger) -> LedgerRecords:
+        """
+        以列式结构获取账本的所有收入记录，供统计分析使用
+        
+        参数:
+            ledger: 账本对象
+            
+        返回:
+            LedgerRecords 对象（缓存对象，调用方不应修改）
+        """
+        income_path = ledger.get_income_file_path()
+        
+        if not os.path.exists(income_path):
+            return LedgerRecords()
+        
+        try:
+            return self._load_records(income_path)
         except Exception as e:
             print(f"读取收入时出错: {e}")
+            return LedgerRecords()
+    
+    @staticmethod
+    def _stat_key(file_path: str) -> tuple:
+        """获取用于判断文件是否变化的 (修改时间, 大小, inode) 键"""
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+    
+    def _load_records(self, file_path: str) -> LedgerRecords:
+        """
+        获取 CSV 文件的列式记录，与解析结果一同缓存，文件变化后重新构建
         
-        return income
+        参数:
+            file_path: CSV 文件路径
+            
+        返回:
+            LedgerRecords 对象
+        """
+        rows = self._load_rows(file_path)
+        key, _, records = self._row_cache[file_path]
+        
+        if records is None:
+            records = LedgerRecords.from_rows(rows)
+            self._row_cache[file_path] = (key, rows, records)
+        return records
     
     def delete_expense(self, ledger: Ledger, index: int) -> bool:
         """
@@ -277,46 +539,8 @@ class LedgerService:
             if not os.path.exists(expenses_path):
                 return False
             
-            # 读取所有支出
-            expenses = []
-            currency_line = None
-            
-            with open(expenses_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline()
-                if first_line.startswith('#'):
-                    currency_line = first_line
-                    f.seek(0)
-                    f.readline()  # 跳过注释
-                
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('year'):
-                        expenses.append(row)
-            
-            # 检查索引是否有效
-            if index < 0 or index >= len(expenses):
-                return False
-            
-            # 移除索引位置的支出
-            expenses.pop(index)
-            
-            # 写回文件
-            with open(expenses_path, 'w', newline='', encoding='utf-8') as f:
-                if currency_line:
-                    f.write(currency_line)
-                writer = csv.writer(f)
-                writer.writerow(['year', 'month', 'day', 'amount', 'category', 'description'])
-                for expense in expenses:
-                    writer.writerow([
-                        expense['year'],
-                        expense['month'],
-                        expense['day'],
-                        expense['amount'],
-                        expense['category'],
-                        expense.get('description', '')
-                    ])
-            
-            return True
+            # 流式重写文件，仅跳过目标记录
+            return self._rewrite_record(expenses_path, index)
         except Exception as e:
             print(f"删除支出时出错: {e}")
             return False
@@ -338,46 +562,8 @@ class LedgerService:
             if not os.path.exists(income_path):
                 return False
             
-            # 读取所有收入
-            income = []
-            currency_line = None
-            
-            with open(income_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline()
-                if first_line.startswith('#'):
-                    currency_line = first_line
-                    f.seek(0)
-                    f.readline()  # 跳过注释
-                
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('year'):
-                        income.append(row)
-            
-            # 检查索引是否有效
-            if index < 0 or index >= len(income):
-                return False
-            
-            # 移除索引位置的收入
-            income.pop(index)
-            
-            # 写回文件
-            with open(income_path, 'w', newline='', encoding='utf-8') as f:
-                if currency_line:
-                    f.write(currency_line)
-                writer = csv.writer(f)
-                writer.writerow(['year', 'month', 'day', 'amount', 'category', 'description'])
-                for inc in income:
-                    writer.writerow([
-                        inc['year'],
-                        inc['month'],
-                        inc['day'],
-                        inc['amount'],
-                        inc['category'],
-                        inc.get('description', '')
-                    ])
-            
-            return True
+            # 流式重写文件，仅跳过目标记录
+            return self._rewrite_record(income_path, index)
         except Exception as e:
             print(f"删除收入时出错: {e}")
             return False
@@ -404,59 +590,10 @@ class LedgerService:
                 return False
             
             # 解析日期获取年、月、日
-            from datetime import datetime
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            day = date_obj.day
-            
-            # 读取所有支出
-            expenses = []
-            currency_line = None
+            year, month, day = self._parse_date(date)
             
-            with open(expenses_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline()
-                if first_line.startswith('#'):
-                    currency_line = first_line
-                    f.seek(0)
-                    f.readline()  # 跳过注释
-                
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('year'):
-                        expenses.append(row)
-            
-            # 检查索引是否有效
-            if index < 0 or index >= len(expenses):
-                return False
-            
-            # 更新索引位置的支出
-            expenses[index] = {
-                'year': str(year),
-                'month': str(month),
-                'day': str(day),
-                'amount': str(amount),
-                'category': category,
-                'description': description
-            }
-            
-            # 写回文件
-            with open(expenses_path, 'w', newline='', encoding='utf-8') as f:
-                if currency_line:
-                    f.write(currency_line)
-                writer = csv.writer(f)
-                writer.writerow(['year', 'month', 'day', 'amount', 'category', 'description'])
-                for expense in expenses:
-                    writer.writerow([
-                        expense['year'],
-                        expense['month'],
-                        expense['day'],
-                        expense['amount'],
-                        expense['category'],
-                        expense.get('description', '')
-                    ])
-            
-            return True
+            # 流式重写文件，仅替换目标记录
+            return self._rewrite_record(expenses_path, index, [year, month, day, amount, category, description])
         except Exception as e:
             print(f"更新支出时出错: {e}")
             return False
@@ -483,63 +620,92 @@ class LedgerService:
                 return False
             
             # 解析日期获取年、月、日
-            from datetime import datetime
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            day = date_obj.day
+            year, month, day = self._parse_date(date)
             
-            # 读取所有收入
-            income = []
-            currency_line = None
-            
-            with open(income_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline()
-                if first_line.startswith('#'):
-                    currency_line = first_line
-                    f.seek(0)
-                    f.readline()  # 跳过注释
-                
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('year'):
-                        income.append(row)
-            
-            # 检查索引是否有效
-            if index < 0 or index >= len(income):
-                return False
-            
-            # 更新索引位置的收入
-            income[index] = {
-                'year': str(year),
-                'month': str(month),
-                'day': str(day),
-                'amount': str(amount),
-                'category': category,
-                'description': description
-            }
-            
-            # 写回文件
-            with open(income_path, 'w', newline='', encoding='utf-8') as f:
-                if currency_line:
-                    f.write(currency_line)
-                writer = csv.writer(f)
-                writer.writerow(['year', 'month', 'day', 'amount', 'category', 'description'])
-                for inc in income:
-                    writer.writerow([
-                        inc['year'],
-                        inc['month'],
-                        inc['day'],
-                        inc['amount'],
-                        inc['category'],
-                        inc.get('description', '')
-                    ])
-            
-            return True
+            # 流式重写文件，仅替换目标记录
+            return self._rewrite_record(income_path, index, [year, month, day, amount, category, description])
         except Exception as e:
             print(f"更新收入时出错: {e}")
             return False
     
+    def _rewrite_record(self, file_path: str, index: int, new_row: list = None) -> bool:
+        """
+        流式重写 CSV 文件：仅删除或替换指定索引的记录，其余行原样复制
+        
+        参数:
+            file_path: CSV 文件路径
+            index: 目标记录的从零开始的索引
+            new_row: 替换用的新行，为 None 时删除该记录
+            
+        返回:
+            找到目标记录并写回成功返回 True，否则返回 False
+        """
+        if index < 0:
+            return False
+        
+        self._row_cache.pop(file_path, None)
+        found = False
+        tmp_path = None
+        
+        try:
+            with open(file_path, 'r', newline='', encoding='utf-8', buffering=1 << 16) as f_in, \
+                    tempfile.NamedTemporaryFile('w', newline='', encoding='utf-8', dir=os.path.dirname(file_path),
+                                                suffix='.tmp', delete=False) as f_out:
+                tmp_path = f_out.name
+                
+                # 原样复制货币注释行
+                first_line = f_in.readline()
+                if first_line.startswith('#'):
+                    f_out.write(first_line)
+                    source = f_in
+                else:
+                    source = itertools.chain([first_line], f_in)
+                
+                # 与 _load_rows 使用同一个 csv.reader 判定有效记录，同时记下每条记录对应的原始行，
+                # 这样带引号的多行描述等情况下索引仍与读取时一致，且非目标记录可原样复制
+                raw_lines = []
+                
+                def tracked_lines():
+                    for line in source:
+                        raw_lines.append(line)
+                        yield line
+                
+                reader = csv.reader(tracked_lines())
+                fieldnames = next(reader, None)
+                f_out.writelines(raw_lines)
+                raw_lines.clear()
+                
+                if fieldnames and 'year' in fieldnames:
+                    year_index = fieldnames.index('year')
+                    record_index = 0
+                    for values in reader:
+                        # 包含年份字段的有效行才计入索引
+                        if len(values) > year_index and values[year_index]:
+                            if record_index == index:
+                                found = True
+                                if new_row is not None:
+                                    f_out.write(self._format_row(new_row))
+                                break
+                            record_index += 1
+                        f_out.writelines(raw_lines)
+                        raw_lines.clear()
+                
+                # 目标记录之后的内容无需逐行检查，按块整体复制
+                if found:
+                    shutil.copyfileobj(f_in, f_out, 1 << 16)
+            
+            if found:
+                # NamedTemporaryFile 以 0600 创建，替换前沿用原文件的权限
+                shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
+            else:
+                os.remove(tmp_path)
+            return found
+        except Exception:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
     def list_user_ledgers(self, username: str = None) -> list:
         """
         列出用户的所有账本
@@ -563,21 +729,17 @@ class LedgerService:
             return ledgers
         
         try:
-            for item in os.listdir(self.base_path):
-                item_path = os.path.join(self.base_path, item)
-                if os.path.isdir(item_path) and item.startswith(prefix):
-                    # 提取账本名称
-                    ledger_name = item[len(prefix):]
+            # scandir 的目录项自带类型信息，先按前缀过滤再判断目录，避免逐项 stat
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(prefix) or not entry.is_dir():
+                        continue
                     
-                    # 从支出文件读取货币信息
-                    expenses_path = os.path.join(item_path, "expenses.csv")
-                    currency = "USD"  # 默认值
+                    # 提取账本名称
+                    ledger_name = entry.name[len(prefix):]
                     
-                    if os.path.exists(expenses_path):
-                        with open(expenses_path, 'r', encoding='utf-8') as f:
-                            first_line = f.readline()
-                            if first_line.startswith("# Currency:"):
-                                currency = first_line.split(":")[1].strip()
+                    # 读取货币信息（默认值: USD）
+                    currency = self._read_currency(entry.path, "USD")
                     
                     ledger = Ledger(ledger_name, currency, username)
                     ledgers.append(ledger)
@@ -586,6 +748,32 @@ class LedgerService:
         
         return ledgers
     
+    def _read_currency(self, folder_path: str, default: str) -> str:
+        """
+        读取账本的货币代码，优先读取 meta.json，旧账本回退到支出文件的注释行
+        
+        参数:
+            folder_path: 账本文件夹路径
+            default: 无法读取时使用的默认货币
+            
+        返回:
+            货币代码
+        """
+        try:
+            with open(os.path.join(folder_path, "meta.json"), 'r', encoding='utf-8') as f:
+                return json.load(f)['currency']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        expenses_path = os.path.join(folder_path, "expenses.csv")
+        if os.path.exists(expenses_path):
+            with open(expenses_path, 'r', encoding='utf-8') as f:
+                first_line = f.readline()
+                if first_line.startswith("# Currency:"):
+                    return first_line.split(":")[1].strip()
+        
+        return default
+    
     def ledger_exists(self, ledger_name: str, username: str = None) -> bool:
         """
         检查账本是否存在
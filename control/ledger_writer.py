@@ -0,0 +1,92 @@
+"""
+Ledger Writer Class
+Keeps a ledger's CSV files open for a batch of appended records
+
+Author: Rickey
+Date: 2026.10.15
+"""
+
+from model.ledger import Ledger
+
+
+class LedgerWriter:
+    """
+    Context manager for appending many records to one ledger
+
+    Records are written one at a time, so unlike LedgerService.add_*_bulk a batch
+    is not all-or-nothing: if a record is rejected (e.g. an invalid date), the
+    records added before it are still written when the writer closes.
+    """
+
+    def __init__(self, ledger_service, ledger: Ledger):
+        """
+        初始化 LedgerWriter，通常通过 LedgerService.writer() 获取
+
+        参数:
+            ledger_service: 所属的 LedgerService（用于格式化记录和清除缓存）
+            ledger: 账本对象
+        """
+        self.ledger_service = ledger_service
+        self.ledger = ledger
+        # 文件路径 -> 文件句柄，首次写入时才打开
+        self._handles = {}
+
+    def __enter__(self):
+        """进入 with 块，返回写入器本身"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """退出 with 块时关闭文件，不吞掉异常"""
+        self.close()
+        return False
+
+    def add_expense(self, date: str, amount: float, category: str, description: str = ""):
+        """
+        追加一条支出记录
+
+        参数:
+            date: 日期，YYYY-MM-DD 格式
+            amount: 支出金额
+            category: 支出类别
+            description: 可选描述
+
+        抛出:
+            ValueError: 如果日期无效（该条不写入，之前的记录不受影响）
+        """
+        self._write(self.ledger.get_expenses_file_path(), date, amount, category, description)
+
+    def add_income(self, date: str, amount: float, category: str, description: str = ""):
+        """
+        追加一条收入记录
+
+        参数:
+            date: 日期，YYYY-MM-DD 格式
+            amount: 收入金额
+            category: 收入类别
+            description: 可选描述
+
+        抛出:
+            ValueError: 如果日期无效（该条不写入，之前的记录不受影响）
+        """
+        self._write(self.ledger.get_income_file_path(), date, amount, category, description)
+
+    def _write(self, file_path: str, date: str, amount: float, category: str, description: str):
+        """将一条记录写入指定文件的缓冲区"""
+        # 先格式化（校验日期），无效记录不会打开文件或写入任何内容
+        text = self.ledger_service.format_record(date, amount, category, description)
+
+        f = self._handles.get(file_path)
+        if f is None:
+            f = open(file_path, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+            self._handles[file_path] = f
+
+        f.write(text)
+
+    def close(self):
+        """刷新并关闭所有已打开的文件，并使对应的记录缓存失效"""
+        handles, self._handles = self._handles, {}
+        for file_path, f in handles.items():
+            try:
+                f.close()
+            finally:
+                self.ledger_service.invalidate(file_path)
@@ -6,17 +6,192 @@ Author: Rickey
 Date: 2025.10.24
 """
 
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from control.ledger_service import LedgerService
+from control._kernels import category_totals
 from model.ledger import Ledger
 
 
 class StatisticsService:
     """Service class for handling statistics operations"""
     
-    def __init__(self):
-        """初始化 StatisticsService"""
-        self.ledger_service = LedgerService()
+    # 视图层共享的实例，由 instance() 首次调用时创建
+    _INSTANCE = None
+    
+    def __init__(self, ledger_service: LedgerService = None):
+        """
+        初始化 StatisticsService
+        
+        参数:
+            ledger_service: 可选，传入调用方的 LedgerService 以共用已解析记录缓存，
+                            避免同一账本在多个服务实例中重复解析
+        """
+        self.ledger_service = ledger_service or LedgerService()
+        # 记录对象 -> {(年, 月): (记录数, 总额, 类别金额)}
+        # 弱引用键：编辑/删除后旧的记录对象不再被使用时，其缓存随之释放
+        self._totals_cache = weakref.WeakKeyDictionary()
+    
+    @classmethod
+    def instance(cls) -> 'StatisticsService':
+        """
+        获取共享的 StatisticsService 实例（首次调用时创建）
+        
+        返回:
+            进程内共享的 StatisticsService 对象，基于共享的 LedgerService，
+            各视图共用同一份汇总缓存
+        """
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls(LedgerService.instance())
+        return cls._INSTANCE
+    
+    def _category_totals(self, records, year: int, month: int = None) -> tuple:
+        """
+        带缓存的年度/月度类别汇总，记录未变化时直接返回上次的结果
+        
+        参数:
+            records: LedgerRecords 对象
+            year: 年份，为 None 时统计全部记录
+            month: 月份，为 None 时统计全年
+            
+        返回:
+            (总额, 类别 -> 金额字典)，单位为分，字典为缓存对象（调用方不应修改）
+        """
+        # 空账本无需索引或缓存
+        if not records:
+            return 0, {}
+        
+        period_cache = self._totals_cache.get(records)
+        if period_cache is None:
+            period_cache = self._totals_cache[records] = {}
+        key = (year, month)
+        cached = period_cache.get(key)
+        
+        # 新记录会原地追加到同一个记录对象，因此还要比较记录数
+        if cached is not None and cached[0] == len(records):
+            total, by_category = cached[1], cached[2]
+        else:
+            # 按日期索引二分定位该年/该月的记录，只遍历命中的部分
+            if year is None:
+                indices = range(len(records))
+            elif month is None:
+                indices = records.indices_between((year,), (year + 1,))
+            else:
+                indices = records.indices_between((year, month), (year, month + 1))
+            total, by_category = category_totals(indices, records.cents, records.category_code, records.categories)
+            period_cache[key] = (len(records), total, by_category)
+        
+        return total, by_category
+    
+    def get_period_summary(self, ledger: Ledger, year: int = None, month: int = None) -> dict:
+        """
+        一次获取账本在某一时期的收入与支出汇总
+        
+        参数:
+            ledger: 账本对象
+            year: 年份，为 None 时统计全部记录
+            month: 月份（1-12），为 None 时统计全年
+            
+        返回:
+            包含 income、expenses 总额及 income_by_category、expenses_by_category 的字典
+        """
+        # 收入、支出各自在整数分列上单次遍历（结果带缓存），最后统一换算为金额
+        income_cents, income_cents_by_category = self._category_totals(
+            self.ledger_service.get_income_records(ledger), year, month)
+        expense_cents, expense_cents_by_category = self._category_totals(
+            self.ledger_service.get_expense_records(ledger), year, month)
+        
+        return {
+            'income': income_cents / 100,
+            'expenses': expense_cents / 100,
+            'income_by_category': {category: cents / 100 for category, cents in income_cents_by_category.items()},
+            'expenses_by_category': {category: cents / 100 for category, cents in expense_cents_by_category.items()}
+        }
+    
+    def aggregate_by_year(self, ledgers: list, year: int, rates: dict) -> tuple:
+        """
+        汇总多个账本某一年的收支，并换算为同一货币
+        
+        参数:
+            ledgers: 账本对象列表
+            year: 年份（如 2025）
+            rates: 账本货币代码 -> 目标货币汇率
+            
+        返回:
+            (总收入, 总支出, 收入类别 -> 金额, 支出类别 -> 金额, 各账本汇总列表)，
+            各账本汇总为 (账本, 收入, 支出, 结余) 元组，金额均已换算为目标货币
+            （类别金额未做舍入，显示时按两位小数格式化）
+        """
+        return self._aggregate(ledgers, year, None, rates)
+    
+    def aggregate_by_month(self, ledgers: list, year: int, month: int, rates: dict) -> tuple:
+        """
+        汇总多个账本某一月的收支，并换算为同一货币
+        
+        参数:
+            ledgers: 账本对象列表
+            year: 年份（如 2025）
+            month: 月份（1-12）
+            rates: 账本货币代码 -> 目标货币汇率
+            
+        返回:
+            与 aggregate_by_year 相同的元组
+        """
+        return self._aggregate(ledgers, year, month, rates)
+    
+    def aggregate_all(self, ledgers: list, rates: dict) -> tuple:
+        """
+        汇总多个账本的全部收支，并换算为同一货币
+        
+        参数:
+            ledgers: 账本对象列表
+            rates: 账本货币代码 -> 目标货币汇率
+            
+        返回:
+            与 aggregate_by_year 相同的元组
+        """
+        return self._aggregate(ledgers, None, None, rates)
+    
+    def _aggregate(self, ledgers: list, year: int, month: int, rates: dict) -> tuple:
+        """按年、按月或全部汇总多个账本，每个账本只取一次收支汇总"""
+        total_income = 0.0
+        total_expenses = 0.0
+        income_by_category = defaultdict(float)
+        expenses_by_category = defaultdict(float)
+        per_ledger = []
+        
+        # 读取/解析各账本文件是 I/O 密集型，多个账本时并发获取汇总，归并仍在当前线程完成
+        if len(ledgers) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(ledgers))) as executor:
+                summaries = list(executor.map(lambda ledger: self.get_period_summary(ledger, year, month), ledgers))
+        else:
+            summaries = [self.get_period_summary(ledger, year, month) for ledger in ledgers]
+        
+        for ledger, summary in zip(ledgers, summaries):
+            rate = rates[ledger.currency]
+            
+            # 与目标货币相同时金额已是两位小数，直接使用；否则按汇率换算并保留两位小数
+            same_currency = rate == 1.0
+            if same_currency:
+                converted_income = summary['income']
+                converted_expenses = summary['expenses']
+            else:
+                converted_income = round(summary['income'] * rate, 2)
+                converted_expenses = round(summary['expenses'] * rate, 2)
+            total_income += converted_income
+            total_expenses += converted_expenses
+            per_ledger.append((ledger, converted_income, converted_expenses, converted_income - converted_expenses))
+            
+            for category, amount in summary['income_by_category'].items():
+                income_by_category[category] += amount if same_currency else round(amount * rate, 2)
+            for category, amount in summary['expenses_by_category'].items():
+                expenses_by_category[category] += amount if same_currency else round(amount * rate, 2)
+        
+        # 类别合计不再逐项四舍五入，显示时的 :.2f 格式化已保留两位小数；只对总额取整
+        return (round(total_income, 2), round(total_expenses, 2),
+                dict(income_by_category), dict(expenses_by_category), per_ledger)
     
     def get_expenses_by_year(self, ledger: Ledger, year: int) -> dict:
         """
@@ -29,31 +204,13 @@ class StatisticsService:
         返回:
             包含总支出和按类别分组的支出的字典
         """
-        expenses = self.ledger_service.get_expenses(ledger)
-        
-        total = 0.0
-        by_category = {}
-        
-        for expense in expenses:
-            try:
-                expense_year = int(expense['year'])
-                if expense_year == year:
-                    amount = float(expense['amount'])
-                    category = expense['category']
-                    
-                    total += amount
-                    
-                    if category in by_category:
-                        by_category[category] += amount
-                    else:
-                        by_category[category] = amount
-            except (ValueError, KeyError):
-                continue
-        
-        # 四舍五入金额
-        total = round(total, 2)
-        for category in by_category:
-            by_category[category] = round(by_category[category], 2)
+        records = self.ledger_service.get_expense_records(ledger)
+        
+        total_cents, by_category = self._category_totals(records, year)
+        
+        # 由整数分换算为金额（生成新字典，缓存中的原始结果保持不变）
+        total = total_cents / 100
+        by_category = {category: cents / 100 for category, cents in by_category.items()}
         
         return {
             'total': total,
@@ -73,32 +230,13 @@ class StatisticsService:
         返回:
             包含总支出和按类别分组的支出的字典
         """
-        expenses = self.ledger_service.get_expenses(ledger)
-        
-        total = 0.0
-        by_category = {}
-        
-        for expense in expenses:
-            try:
-                expense_year = int(expense['year'])
-                expense_month = int(expense['month'])
-                if expense_year == year and expense_month == month:
-                    amount = float(expense['amount'])
-                    category = expense['category']
-                    
-                    total += amount
-                    
-                    if category in by_category:
-                        by_category[category] += amount
-                    else:
-                        by_category[category] = amount
-            except (ValueError, KeyError):
-                continue
-        
-        # 四舍五入金额
-        total = round(total, 2)
-        for category in by_category:
-            by_category[category] = round(by_category[category], 2)
+        records = self.ledger_service.get_expense_records(ledger)
+        
+        total_cents, by_category = self._category_totals(records, year, month)
+        
+        # 由整数分换算为金额（生成新字典，缓存中的原始结果保持不变）
+        total = total_cents / 100
+        by_category = {category: cents / 100 for category, cents in by_category.items()}
         
         return {
             'total': total,
@@ -118,23 +256,16 @@ class StatisticsService:
             day: 日期（1-31）
             
         返回:
-            该日期的支出记录列表
-        """
-        expenses = self.ledger_service.get_expenses(ledger)
-        
-        result = []
-        for expense in expenses:
-            try:
-                expense_year = int(expense['year'])
-                expense_month = int(expense['month'])
-                expense_day = int(expense['day'])
-                
-                if expense_year == year and expense_month == month and expense_day == day:
-                    result.append(expense)
-            except (ValueError, KeyError):
-                continue
-        
-        return result
+            该日期的支出记录列表（新建的字典，可自由修改）
+        """
+        records = self.ledger_service.get_expense_records(ledger)
+        
+        if not records:
+            return []
+        
+        # 通过日期索引二分查找当天的记录；返回副本，调用方修改不会影响缓存
+        rows = records.rows
+        return [dict(rows[i]) for i in records.indices_between((year, month, day), (year, month, day + 1))]
     
     def get_income_by_year(self, ledger: Ledger, year: int) -> dict:
         """
@@ -147,31 +278,13 @@ class StatisticsService:
         返回:
             包含总收入和按类别分组的收入的字典
         """
-        income = self.ledger_service.get_income(ledger)
-        
-        total = 0.0
-        by_category = {}
-        
-        for inc in income:
-            try:
-                inc_year = int(inc['year'])
-                if inc_year == year:
-                    amount = float(inc['amount'])
-                    category = inc['category']
-                    
-                    total += amount
-                    
-                    if category in by_category:
-                        by_category[category] += amount
-                    else:
-                        by_category[category] = amount
-            except (ValueError, KeyError):
-                continue
-        
-        # 四舍五入金额
-        total = round(total, 2)
-        for category in by_category:
-            by_category[category] = round(by_category[category], 2)
+        records = self.ledger_service.get_income_records(ledger)
+        
+        total_cents, by_category = self._category_totals(records, year)
+        
+        # 由整数分换算为金额（生成新字典，缓存中的原始结果保持不变）
+        total = total_cents / 100
+        by_category = {category: cents / 100 for category, cents in by_category.items()}
         
         return {
             'total': total,
@@ -191,32 +304,13 @@ class StatisticsService:
         返回:
             包含总收入和按类别分组的收入的字典
         """
-        income = self.ledger_service.get_income(ledger)
-        
-        total = 0.0
-        by_category = {}
-        
-        for inc in income:
-            try:
-                inc_year = int(inc['year'])
-                inc_month = int(inc['month'])
-                if inc_year == year and inc_month == month:
-                    amount = float(inc['amount'])
-                    category = inc['category']
-                    
-                    total += amount
-                    
-                    if category in by_category:
-                        by_category[category] += amount
-                    else:
-                        by_category[category] = amount
-            except (ValueError, KeyError):
-                continue
-        
-        # 四舍五入金额
-        total = round(total, 2)
-        for category in by_category:
-            by_category[category] = round(by_category[category], 2)
+        records = self.ledger_service.get_income_records(ledger)
+        
+        total_cents, by_category = self._category_totals(records, year, month)
+        
+        # 由整数分换算为金额（生成新字典，缓存中的原始结果保持不变）
+        total = total_cents / 100
+        by_category = {category: cents / 100 for category, cents in by_category.items()}
         
         return {
             'total': total,
@@ -236,20 +330,13 @@ class StatisticsService:
             day: 日期（1-31）
             
         返回:
-            该日期的收入记录列表
-        """
-        income = self.ledger_service.get_income(ledger)
-        
-        result = []
-        for inc in income:
-            try:
-                inc_year = int(inc['year'])
-                inc_month = int(inc['month'])
-                inc_day = int(inc['day'])
-                
-                if inc_year == year and inc_month == month and inc_day == day:
-                    result.append(inc)
-            except (ValueError, KeyError):
-                continue
-        
-        return result
+            该日期的收入记录列表（新建的字典，可自由修改）
+        """
+        records = self.ledger_service.get_income_records(ledger)
+        
+        if not records:
+            return []
+        
+        # 通过日期索引二分查找当天的记录；返回副本，调用方修改不会影响缓存
+        rows = records.rows
+        return [dict(rows[i]) for i in records.indices_between((year, month, day), (year, month, day + 1))]
@@ -7,6 +7,9 @@ Date: 2025.10.16
 """
 
 import os
+import re
+import hmac
+import hashlib
 from model.user import User
 
 
@@ -15,6 +18,11 @@ class UserService:
     
     # Reserved usernames that cannot be used
     RESERVED_USERNAMES = ['local', 'default', 'admin', 'root', 'system', 'guest']
+    # Lowercased once at class definition for O(1) case-insensitive lookups
+    _RESERVED_LOWER = frozenset(reserved.lower() for reserved in RESERVED_USERNAMES)
+    
+    # Characters not allowed in usernames (dashes, spaces, or special chars that would conflict with folder naming)
+    _INVALID_USERNAME_CHARS = re.compile(r'[- /\\:*?"<>|]')
     
     def __init__(self, users_file_path: str = "data/users/users.txt"):
         """
@@ -24,7 +32,8 @@ class UserService:
             users_file_path: Path to the users.txt file
         """
         self.users_file_path = users_file_path
-        self.users = {}  # Dictionary to store username: User mappings
+        self.users = {}  # Dictionary to store username: User mappings (User.password holds a digest)
+        self._loaded = False  # Whether the users file has been read (an empty dict is a valid state)
     
     def load_users(self) -> bool:
         """
@@ -38,27 +47,42 @@ class UserService:
                 return False
             
             with open(self.users_file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse username:password format
-                    if ':' in line:
-                        username, password = line.split(':', 1)
-                        username = username.strip()
-                        password = password.strip()
-                        
-                        if username:  # Only add if username is not empty
-                            user = User(username, password)
-                            self.users[username] = user
+                data = f.read()
+            
+            # Parse username:password format in one pass, skipping empty lines and comments
+            entries = [line.partition(':') for line in map(str.strip, data.splitlines())
+                       if line and not line.startswith('#')]
             
+            for username, separator, password in entries:
+                username = username.strip()
+                if separator and username:  # Only add lines with a separator and a non-empty username
+                    self.users[username] = User(username, self._hash_password(password.strip()))
+            
+            self._loaded = True
             return True
         except Exception as e:
             print(f"Error loading users: {e}")
             return False
     
+    def _ensure_loaded(self):
+        """Load users from file on first use only; later calls never touch the filesystem"""
+        if not self._loaded:
+            self.load_users()
+            self._loaded = True
+    
+    @staticmethod
+    def _hash_password(password: str) -> str:
+        """
+        Hash a password for in-memory storage and comparison
+        
+        Args:
+            password: Plain-text password
+            
+        Returns:
+            Hex digest of the password
+        """
+        return hashlib.blake2b(password.encode('utf-8'), digest_size=16).hexdigest()
+    
     def verify_login(self, username: str, password: str) -> bool:
         """
         Verify user login credentials
@@ -70,11 +94,10 @@ class UserService:
         Returns:
             True if credentials are valid, False otherwise
         """
-        if not self.users:
-            self.load_users()
+        self._ensure_loaded()
         
         if username in self.users:
-            return self.users[username].password == password
+            return hmac.compare_digest(self.users[username].password, self._hash_password(password))
         
         return False
     
@@ -88,8 +111,7 @@ class UserService:
         Returns:
             User object if found, None otherwise
         """
-        if not self.users:
-            self.load_users()
+        self._ensure_loaded()
         
         return self.users.get(username)
     
@@ -103,8 +125,7 @@ class UserService:
         Returns:
             True if user exists, False otherwise
         """
-        if not self.users:
-            self.load_users()
+        self._ensure_loaded()
         
         return username in self.users
     
@@ -118,7 +139,7 @@ class UserService:
         Returns:
             True if username is reserved, False otherwise
         """
-        return username.lower() in [reserved.lower() for reserved in self.RESERVED_USERNAMES]
+        return username.lower() in self._RESERVED_LOWER
     
     def validate_username(self, username: str) -> tuple:
         """
@@ -143,11 +164,10 @@ class UserService:
         if self.is_reserved_username(username):
             return (False, f"Username '{username}' is reserved and cannot be used. Please choose a different username.")
         
-        # Check for invalid characters (no dashes, spaces, or special chars that would conflict with folder naming)
-        invalid_chars = ['-', ' ', '/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        for char in invalid_chars:
-            if char in username:
-                return (False, f"Username cannot contain '{char}'. Please use only letters, numbers, and underscores.")
+        # Check for invalid characters in a single scan
+        match = self._INVALID_USERNAME_CHARS.search(username)
+        if match:
+            return (False, f"Username cannot contain '{match.group()}'. Please use only letters, numbers, and underscores.")
         
         # Check if username already exists
         if self.user_exists(username):
@@ -166,31 +186,65 @@ class UserService:
         Returns:
             True if registration successful, False if validation fails or user already exists
         """
-        if not self.users:
-            self.load_users()
-        
-        # Validate username before registration
-        is_valid, error_message = self.validate_username(username)
-        if not is_valid:
-            if error_message:
-                print(f"Registration failed: {error_message}")
-            return False
+        return self.register_users([(username, password)])
+    
+    def register_users(self, pairs: list) -> bool:
+        """
+        Register several users with a single write to the users file
         
-        # Additional check for user existence (redundant but safe)
-        if self.user_exists(username):
-            print(f"Registration failed: Username '{username}' already exists!")
-            return False
+        Args:
+            pairs: List of (username, password) tuples
+            
+        Returns:
+            True if all users were registered, False if any entry fails validation
+            (in which case no user is written)
+        """
+        self._ensure_loaded()
+        
+        # Validate every username before writing anything
+        seen = set()
+        for username, _ in pairs:
+            is_valid, error_message = self.validate_username(username)
+            if not is_valid:
+                if error_message:
+                    print(f"Registration failed: {error_message}")
+                return False
+            
+            # Duplicate within the same batch
+            if username in seen:
+                print(f"Registration failed: Username '{username}' already exists!")
+                return False
+            seen.add(username)
         
         try:
-            # Append new user to file
-            with open(self.users_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"\n{username}:{password}")
+            # Append new users to file
+            self._append_users(pairs)
             
             # Add to memory
-            user = User(username, password)
-            self.users[username] = user
+            for username, password in pairs:
+                self.users[username] = User(username, self._hash_password(password))
             
             return True
         except Exception as e:
             print(f"Error registering user: {e}")
             return False
+    
+    def _append_users(self, pairs: list):
+        """
+        Append username:password lines to the users file and flush them to disk
+        
+        Args:
+            pairs: List of (username, password) tuples
+        """
+        # Each entry ends with a newline; only add a separator if the file doesn't end with one yet
+        prefix = ""
+        if os.path.exists(self.users_file_path) and os.path.getsize(self.users_file_path) > 0:
+            with open(self.users_file_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    prefix = "\n"
+        
+        with open(self.users_file_path, 'a', encoding='utf-8') as f:
+            f.write(prefix + "".join(f"{username}:{password}\n" for username, password in pairs))
+            f.flush()
+            os.fsync(f.fileno())
@@ -7,7 +7,52 @@
 
 from control.user_service import UserService
 from control.ledger_service import LedgerService
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _to_records(entries: list) -> list:
+    """
+    将测试数据字典转换为 (日期, 金额, 类别, 描述) 元组列表
+    """
+    return [
+        (
+            f"{entry['year']}-{entry['month']:02d}-{entry['day']:02d}",
+            entry['amount'],
+            entry['category'],
+            entry['description']
+        )
+        for entry in entries
+    ]
+
+
+def _seed_ledger(ledger_service, username: str, ledger_name: str, currency: str,
+                 expense_records: list, income_records: list) -> list:
+    """
+    创建单个账本并批量写入测试数据
+    
+    返回:
+        日志消息列表（由调用方按顺序输出）
+    """
+    messages = []
+    try:
+        # 检查账本是否已存在
+        if ledger_service.ledger_exists(ledger_name, username):
+            messages.append(f"[SKIP] Ledger '{ledger_name}' ({currency}) already exists (User: {username})")
+            return messages
+        
+        # 创建账本
+        ledger = ledger_service.create_ledger(ledger_name, currency, username)
+        messages.append(f"[OK] Created ledger: {ledger_name} ({currency}) for {username}")
+        
+        # 添加测试支出和收入数据
+        ledger_service.add_expenses_bulk(ledger, expense_records)
+        ledger_service.add_income_bulk(ledger, income_records)
+        
+        messages.append(f"[OK] Added test data for {ledger_name}")
+    except Exception as e:
+        messages.append(f"[ERROR] Error creating ledger {ledger_name} for {username}: {e}")
+    
+    return messages
 
 
 def init_test_data():
@@ -36,77 +81,65 @@ def init_test_data():
     
     # 创建测试账户
     print("Creating test accounts...")
+    new_users = []
     for username, password in test_users:
+        # 检查用户是否已存在
+        if user_service.user_exists(username):
+            print(f"[SKIP] User '{username}' already exists")
+            continue
+        new_users.append((username, password))
+    
+    # 一次性注册所有新用户
+    if new_users:
         try:
-            # 检查用户是否已存在
-            if user_service.user_exists(username):
-                print(f"[SKIP] User '{username}' already exists")
-                continue
-            
-            # 注册用户
-            if user_service.register_user(username, password):
-                print(f"[OK] Created user: {username}")
+            if user_service.register_users(new_users):
+                for username, _ in new_users:
+                    print(f"[OK] Created user: {username}")
             else:
-                print(f"[FAIL] Failed to create user: {username}")
+                for username, _ in new_users:
+                    print(f"[FAIL] Failed to create user: {username}")
         except Exception as e:
-            print(f"[ERROR] Error creating user {username}: {e}")
+            print(f"[ERROR] Error creating users: {e}")
     
     print("\nCreating test ledgers and data...")
     
-    # 为每个账户创建账本并添加测试数据
-    for username, password in test_users:
-        for ledger_name, currency in ledger_configs:
-            try:
-                # 检查账本是否已存在
-                if ledger_service.ledger_exists(ledger_name, username):
-                    print(f"[SKIP] Ledger '{ledger_name}' ({currency}) already exists (User: {username})")
-                    continue
-                
-                # 创建账本
-                ledger = ledger_service.create_ledger(ledger_name, currency, username)
-                print(f"[OK] Created ledger: {ledger_name} ({currency}) for {username}")
-                
-                # 添加测试支出数据
-                test_expenses = [
-                    {'year': 2025, 'month': 1, 'day': 15, 'amount': 50.00, 'category': 'food', 'description': 'Lunch'},
-                    {'year': 2025, 'month': 1, 'day': 20, 'amount': 25.50, 'category': 'transportation', 'description': 'Bus ticket'},
-                    {'year': 2025, 'month': 2, 'day': 5, 'amount': 100.00, 'category': 'shopping', 'description': 'Shopping'},
-                    {'year': 2025, 'month': 2, 'day': 12, 'amount': 80.00, 'category': 'entertainment', 'description': 'Movie'},
-                    {'year': 2025, 'month': 3, 'day': 3, 'amount': 150.00, 'category': 'bills', 'description': 'Electricity bill'},
-                ]
-                
-                for expense in test_expenses:
-                    iso_date = f"{expense['year']}-{expense['month']:02d}-{expense['day']:02d}"
-                    ledger_service.add_expense(
-                        ledger,
-                        iso_date,
-                        expense['amount'],
-                        expense['category'],
-                        expense['description']
-                    )
-                
-                # 添加测试收入数据
-                test_income = [
-                    {'year': 2025, 'month': 1, 'day': 1, 'amount': 5000.00, 'category': 'salary', 'description': 'Monthly salary'},
-                    {'year': 2025, 'month': 1, 'day': 15, 'amount': 500.00, 'category': 'bonus', 'description': 'Bonus'},
-                    {'year': 2025, 'month': 2, 'day': 1, 'amount': 5000.00, 'category': 'salary', 'description': 'Monthly salary'},
-                    {'year': 2025, 'month': 2, 'day': 28, 'amount': 200.00, 'category': 'gift', 'description': 'Gift'},
-                ]
-                
-                for income in test_income:
-                    iso_date = f"{income['year']}-{income['month']:02d}-{income['day']:02d}"
-                    ledger_service.add_income(
-                        ledger,
-                        iso_date,
-                        income['amount'],
-                        income['category'],
-                        income['description']
-                    )
-                
-                print(f"[OK] Added test data for {ledger_name}")
-                
-            except Exception as e:
-                print(f"[ERROR] Error creating ledger {ledger_name} for {username}: {e}")
+    # 测试支出数据
+    test_expenses = [
+        {'year': 2025, 'month': 1, 'day': 15, 'amount': 50.00, 'category': 'food', 'description': 'Lunch'},
+        {'year': 2025, 'month': 1, 'day': 20, 'amount': 25.50, 'category': 'transportation', 'description': 'Bus ticket'},
+        {'year': 2025, 'month': 2, 'day': 5, 'amount': 100.00, 'category': 'shopping', 'description': 'Shopping'},
+        {'year': 2025, 'month': 2, 'day': 12, 'amount': 80.00, 'category': 'entertainment', 'description': 'Movie'},
+        {'year': 2025, 'month': 3, 'day': 3, 'amount': 150.00, 'category': 'bills', 'description': 'Electricity bill'},
+    ]
+    
+    # 测试收入数据
+    test_income = [
+        {'year': 2025, 'month': 1, 'day': 1, 'amount': 5000.00, 'category': 'salary', 'description': 'Monthly salary'},
+        {'year': 2025, 'month': 1, 'day': 15, 'amount': 500.00, 'category': 'bonus', 'description': 'Bonus'},
+        {'year': 2025, 'month': 2, 'day': 1, 'amount': 5000.00, 'category': 'salary', 'description': 'Monthly salary'},
+        {'year': 2025, 'month': 2, 'day': 28, 'amount': 200.00, 'category': 'gift', 'description': 'Gift'},
+    ]
+    
+    # 转换为批量写入接口使用的 (日期, 金额, 类别, 描述) 元组，所有账本共用
+    expense_records = _to_records(test_expenses)
+    income_records = _to_records(test_income)
+    
+    # 为每个账户的每个账本并行创建并写入测试数据（各账本文件互不相关）
+    jobs = [
+        (username, ledger_name, currency)
+        for username, _ in test_users
+        for ledger_name, currency in ledger_configs
+    ]
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(
+            lambda job: _seed_ledger(ledger_service, *job, expense_records, income_records),
+            jobs
+        )
+        # 按任务顺序输出，保持日志顺序稳定
+        for messages in results:
+            for message in messages:
+                print(message)
     
     print("\n[DONE] Test data initialization completed!")
 
@@ -10,16 +10,66 @@ import sys
 import io
 from visual.login_view import LoginView
 from visual.register_view import RegisterView
-from visual.ledger_view import LedgerView
-from visual.transaction_view import TransactionView
-from visual.currency_view import CurrencyView
-from visual.statistics_view import StatisticsView
+# The remaining views are imported where their menus are first entered
 
 # Set UTF-8 encoding for Windows systems
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Menu state that ends the application loop
+EXIT = 'exit'
+
+# Main menu markup, printed in one call (the trailing newline leaves a blank line)
+MAIN_MENU = (
+    "[bold]Main Menu:[/bold]\n"
+    "[cyan]1.[/cyan] Create New Ledger\n"
+    "[cyan]2.[/cyan] View My Ledgers\n"
+    "[cyan]3.[/cyan] Select Ledger\n"
+    "[cyan]4.[/cyan] Currency Information\n"
+    "[cyan]5.[/cyan] View Statistics\n"
+    "[cyan]6.[/cyan] Logout/Exit\n"
+)
+
+
+def _ask(prompt: str) -> str:
+    """
+    Write a prompt and read one line from stdin (menu choices need no line editing)
+    
+    Raises:
+        EOFError: If stdin is exhausted, as input() would
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+# Default ledger per username (None for guest mode), created once per process
+_default_ledgers = {}
+
+
+def _get_default_ledger(username):
+    """
+    Get the default ledger for a user, creating it on first use
+    
+    Args:
+        username: Username, or None for guest mode
+        
+    Returns:
+        Ledger object, or None if it could not be created
+    """
+    ledger = _default_ledgers.get(username)
+    if ledger is None:
+        from control.ledger_service import LedgerService
+        # Ensure default ledger exists
+        ledger = LedgerService.instance().create_default_ledger(username, "AUD")
+        if ledger:
+            _default_ledgers[username] = ledger
+    return ledger
+
 
 def main():
     """Main function to run the Accounting Book application"""
@@ -27,6 +77,7 @@ def main():
     # Initialize views (share the same user_service instance)
     login_view = LoginView()
     register_view = RegisterView(login_view.user_service)
+    console = login_view.console
     
     # Load users data
     if not login_view.user_service.load_users():
@@ -36,289 +87,209 @@ def main():
     # Display welcome message
     login_view.display_welcome()
     
-    # Main application loop
-    while True:
-        # Display login menu
-        login_view.display_login_menu()
+    # Views created once the session starts or a submenu is entered
+    session = {}
+    
+    def start_session():
+        """Set up the main application after login, registration or guest mode"""
+        # Get current user from either login_view or register_view
+        current_user = None
+        if login_view.is_logged_in():
+            current_user = login_view.get_current_user()
+        elif register_view.is_registered():
+            current_user = register_view.get_current_user()
+        from visual.ledger_view import LedgerView
+        ledger_view = LedgerView(current_user)
         
-        # Get user choice
-        try:
-            choice = input("\nEnter your choice (1-4): ").strip()
-        except (EOFError, KeyboardInterrupt):
-            login_view.console.print("\n[bold yellow]Program interrupted. Goodbye![/bold yellow]\n")
-            break
+        # Initialize default ledger for current user/guest and auto-select it
+        default_ledger = _get_default_ledger(current_user.username if current_user else None)
         
-        if choice == '1':
-            # Continue as guest
-            if login_view.continue_as_guest():
-                print("\nEntering guest mode...")
-                print("Main menu will be implemented here...")
-                break  # Exit login loop
-                
-        elif choice == '2':
-            # Login
-            if login_view.login():
-                # Login successful, user is now logged in
-                current_user = login_view.get_current_user()
-                print(f"\nLogged in as: {current_user.username}")
-                print("Main menu will be implemented here...")
-                break  # Exit login loop
-                
-        elif choice == '3':
-            # Register
-            if register_view.register():
-                # Registration successful, user is now logged in
-                current_user = register_view.get_current_user()
-                print(f"\nRegistered and logged in as: {current_user.username}")
-                print("Main menu will be implemented here...")
-                break  # Exit login loop
-                
-        elif choice == '4':
-            # Exit
-            login_view.console.print("\n[bold yellow]Thank you for using Accounting Book! Goodbye![/bold yellow]\n")
-            return  # Exit the program completely
-            
+        if default_ledger:
+            ledger_view.set_current_ledger(default_ledger)
+        
+        if current_user:
+            console.print(f"\n[bold green]Welcome to Accounting Book, {current_user.username}![/bold green]\n")
+            if default_ledger:
+                console.print("[dim]Default ledger is ready for use.[/dim]\n")
         else:
-            login_view.console.print("\n[bold red]Invalid choice! Please enter 1, 2, 3, or 4.[/bold red]\n")
+            console.print("\n[bold green]Welcome to Accounting Book! (Guest Mode - Local storage only)[/bold green]\n")
+            if default_ledger:
+                console.print("[dim]Default ledger is ready for use.[/dim]\n")
+        
+        session['current_user'] = current_user
+        session['ledger_view'] = ledger_view
+        return 'main'
     
-    # Only reach here if user successfully logged in, registered, or chose guest mode
-    # After login/guest mode, main application menu
-    # Get current user from either login_view or register_view
-    current_user = None
-    if login_view.is_logged_in():
-        current_user = login_view.get_current_user()
-    elif register_view.is_registered():
-        current_user = register_view.get_current_user()
-    ledger_view = LedgerView(current_user)
+    # Login menu handlers
+    def continue_as_guest():
+        if login_view.continue_as_guest():
+            print("\nEntering guest mode...")
+            print("Main menu will be implemented here...")
+            return start_session()
     
-    # Initialize default ledger for current user/guest and auto-select it
-    from control.ledger_service import LedgerService
-    ledger_service = LedgerService()
+    def login():
+        if login_view.login():
+            # Login successful, user is now logged in
+            current_user = login_view.get_current_user()
+            print(f"\nLogged in as: {current_user.username}")
+            print("Main menu will be implemented here...")
+            return start_session()
     
-    # Ensure default ledger exists
-    default_ledger = ledger_service.create_default_ledger(
-        current_user.username if current_user else None,
-        "AUD"
-    )
+    def register():
+        if register_view.register():
+            # Registration successful, user is now logged in
+            current_user = register_view.get_current_user()
+            print(f"\nRegistered and logged in as: {current_user.username}")
+            print("Main menu will be implemented here...")
+            return start_session()
     
-    if default_ledger:
-        ledger_view.set_current_ledger(default_ledger)
+    def interrupt_login():
+        console.print("\n[bold yellow]Program interrupted. Goodbye![/bold yellow]\n")
+        # Carries on into the main menu in guest mode, as before
+        return start_session()
     
-    if current_user:
-        login_view.console.print(f"\n[bold green]Welcome to Accounting Book, {current_user.username}![/bold green]\n")
-        if default_ledger:
-            login_view.console.print("[dim]Default ledger is ready for use.[/dim]\n")
-    else:
-        login_view.console.print("\n[bold green]Welcome to Accounting Book! (Guest Mode - Local storage only)[/bold green]\n")
-        if default_ledger:
-            login_view.console.print("[dim]Default ledger is ready for use.[/dim]\n")
+    # Main menu handlers
+    def show_main_menu():
+        console.print(MAIN_MENU)
     
-    # Initialize currency view
-    currency_view = CurrencyView()
+    def create_ledger():
+        ledger = session['ledger_view'].create_new_ledger()
+        if ledger:
+            session['ledger_view'].set_current_ledger(ledger)
     
-    # Main application menu
-    while True:
-        login_view.console.print("[bold]Main Menu:[/bold]")
-        login_view.console.print("[cyan]1.[/cyan] Create New Ledger")
-        login_view.console.print("[cyan]2.[/cyan] View My Ledgers")
-        login_view.console.print("[cyan]3.[/cyan] Select Ledger")
-        login_view.console.print("[cyan]4.[/cyan] Currency Information")
-        login_view.console.print("[cyan]5.[/cyan] View Statistics")
-        login_view.console.print("[cyan]6.[/cyan] Logout/Exit")
-        login_view.console.print()
+    def select_ledger():
+        # Select ledger and enter ledger menu
+        ledger = session['ledger_view'].select_ledger()
+        if ledger:
+            session['ledger'] = ledger
+            from visual.transaction_view import TransactionView
+            session['transaction_view'] = TransactionView(ledger, console=console)
+            return 'ledger'
+    
+    def enter_currency():
+        if 'currency_view' not in session:
+            from visual.currency_view import CurrencyView
+            session['currency_view'] = CurrencyView()
+        return 'currency'
+    
+    def enter_statistics():
+        from visual.statistics_view import StatisticsView
+        current_user = session['current_user']
+        username = current_user.username if current_user else None
+        session['statistics_view'] = StatisticsView(username)
+        return 'stats'
+    
+    def goodbye():
+        console.print("\n[bold yellow]Thank you for using Accounting Book! Goodbye![/bold yellow]\n")
+        return EXIT
+    
+    def interrupt_main():
+        console.print("\n[bold yellow]Goodbye![/bold yellow]\n")
+        return EXIT
+    
+    # Submenu handlers
+    def leave_ledger():
+        # Update ledger_view with selected ledger
+        session['ledger_view'].set_current_ledger(session['ledger'])
+        return 'main'
+    
+    def interrupt_ledger():
+        console.print("\n[yellow]Returning to main menu...[/yellow]\n")
+        return leave_ledger()
+    
+    def returning_to(state, label):
+        def handler():
+            console.print(f"\n[yellow]Returning to {label}...[/yellow]\n")
+            return state
+        return handler
+    
+    def invalid_choice(options):
+        def handler():
+            console.print(f"\n[bold red]Invalid choice! Please enter {options}.[/bold red]\n")
+        return handler
+    
+    def action(view, method):
+        # Call a method on a session view and stay in the current menu
+        def handler():
+            getattr(session[view], method)()
+        return handler
+    
+    # state -> (show menu, prompt, handler on EOF/Ctrl+C, handler for unknown choices)
+    menus = {
+        'login': (login_view.display_login_menu, "\nEnter your choice (1-4): ",
+                  interrupt_login, invalid_choice("1, 2, 3, or 4")),
+        'main': (show_main_menu, "Enter your choice (1-6): ",
+                 interrupt_main, invalid_choice("1-6")),
+        'ledger': (action('transaction_view', 'display_ledger_menu'), "Enter your choice (1-5): ",
+                   interrupt_ledger, invalid_choice("1-5")),
+        'expenses': (action('transaction_view', 'display_expenses_menu'), "Enter your choice (1-6): ",
+                     returning_to('ledger', "ledger menu"), invalid_choice("1-6")),
+        'income': (action('transaction_view', 'display_income_menu'), "Enter your choice (1-6): ",
+                   returning_to('ledger', "ledger menu"), invalid_choice("1-6")),
+        'currency': (action('currency_view', 'display_currency_menu'), "Enter your choice (1-3): ",
+                     returning_to('main', "main menu"), invalid_choice("1-3")),
+        'stats': (action('statistics_view', 'display_statistics_menu'), "Enter your choice (1-4): ",
+                  returning_to('main', "main menu"), invalid_choice("1-4")),
+    }
+    
+    # (state, choice) -> handler; a handler returns the next state, or None to stay
+    handlers = {
+        ('login', '1'): continue_as_guest,
+        ('login', '2'): login,
+        ('login', '3'): register,
+        ('login', '4'): goodbye,
+        
+        ('main', '1'): create_ledger,
+        ('main', '2'): action('ledger_view', 'display_ledgers'),
+        ('main', '3'): select_ledger,
+        ('main', '4'): enter_currency,
+        ('main', '5'): enter_statistics,
+        ('main', '6'): goodbye,
+        
+        ('ledger', '1'): action('transaction_view', 'add_expense'),
+        ('ledger', '2'): action('transaction_view', 'add_income'),
+        ('ledger', '3'): lambda: 'expenses',
+        ('ledger', '4'): lambda: 'income',
+        ('ledger', '5'): leave_ledger,
+        
+        ('expenses', '1'): action('transaction_view', 'display_expenses_by_year'),
+        ('expenses', '2'): action('transaction_view', 'display_expenses_by_month'),
+        ('expenses', '3'): action('transaction_view', 'display_expenses_by_date'),
+        ('expenses', '4'): action('transaction_view', 'display_expenses'),
+        ('expenses', '5'): action('transaction_view', 'edit_delete_expense'),
+        ('expenses', '6'): lambda: 'ledger',
+        
+        ('income', '1'): action('transaction_view', 'display_income_by_year'),
+        ('income', '2'): action('transaction_view', 'display_income_by_month'),
+        ('income', '3'): action('transaction_view', 'display_income_by_date'),
+        ('income', '4'): action('transaction_view', 'display_income'),
+        ('income', '5'): action('transaction_view', 'edit_delete_income'),
+        ('income', '6'): lambda: 'ledger',
+        
+        ('currency', '1'): action('currency_view', 'display_exchange_rates'),
+        ('currency', '2'): action('currency_view', 'convert_currency'),
+        ('currency', '3'): lambda: 'main',
+        
+        ('stats', '1'): action('statistics_view', 'display_statistics_by_year'),
+        ('stats', '2'): action('statistics_view', 'display_statistics_by_month'),
+        ('stats', '3'): action('statistics_view', 'display_total_summary'),
+        ('stats', '4'): lambda: 'main',
+    }
+    
+    # Application loop: show the current menu, read a choice, dispatch it
+    state = 'login'
+    while state is not EXIT:
+        show_menu, prompt, on_interrupt, on_invalid = menus[state]
+        show_menu()
         
         try:
-            choice = input("Enter your choice (1-6): ").strip()
+            # Interned, so the handler-table key comparison is an identity check
+            choice = sys.intern(_ask(prompt).strip())
         except (EOFError, KeyboardInterrupt):
-            login_view.console.print("\n[bold yellow]Goodbye![/bold yellow]\n")
-            break
+            state = on_interrupt() or state
+            continue
         
-        if choice == '1':
-            # Create new ledger
-            ledger = ledger_view.create_new_ledger()
-            if ledger:
-                ledger_view.set_current_ledger(ledger)
-                
-        elif choice == '2':
-            # View all ledgers
-            ledger_view.display_ledgers()
-            
-        elif choice == '3':
-            # Select ledger and enter ledger menu
-            ledger = ledger_view.select_ledger()
-            if ledger:
-                # Enter ledger-specific menu
-                transaction_view = TransactionView(ledger)
-                
-                while True:
-                    transaction_view.display_ledger_menu()
-                    
-                    try:
-                        ledger_choice = input("Enter your choice (1-5): ").strip()
-                    except (EOFError, KeyboardInterrupt):
-                        login_view.console.print("\n[yellow]Returning to main menu...[/yellow]\n")
-                        break
-                    
-                    if ledger_choice == '1':
-                        # Add expense
-                        transaction_view.add_expense()
-                        
-                    elif ledger_choice == '2':
-                        # Add income
-                        transaction_view.add_income()
-                        
-                    elif ledger_choice == '3':
-                        # View expenses - show submenu
-                        while True:
-                            transaction_view.display_expenses_menu()
-                            
-                            try:
-                                expense_choice = input("Enter your choice (1-6): ").strip()
-                            except (EOFError, KeyboardInterrupt):
-                                login_view.console.print("\n[yellow]Returning to ledger menu...[/yellow]\n")
-                                break
-                            
-                            if expense_choice == '1':
-                                # View by year
-                                transaction_view.display_expenses_by_year()
-                                
-                            elif expense_choice == '2':
-                                # View by month
-                                transaction_view.display_expenses_by_month()
-                                
-                            elif expense_choice == '3':
-                                # View by date
-                                transaction_view.display_expenses_by_date()
-                                
-                            elif expense_choice == '4':
-                                # View all expenses
-                                transaction_view.display_expenses()
-                                
-                            elif expense_choice == '5':
-                                # Edit/Delete expense
-                                transaction_view.edit_delete_expense()
-                                
-                            elif expense_choice == '6':
-                                # Back to ledger menu
-                                break
-                                
-                            else:
-                                login_view.console.print("\n[bold red]Invalid choice! Please enter 1-6.[/bold red]\n")
-                        
-                    elif ledger_choice == '4':
-                        # View income - show submenu
-                        while True:
-                            transaction_view.display_income_menu()
-                            
-                            try:
-                                income_choice = input("Enter your choice (1-6): ").strip()
-                            except (EOFError, KeyboardInterrupt):
-                                login_view.console.print("\n[yellow]Returning to ledger menu...[/yellow]\n")
-                                break
-                            
-                            if income_choice == '1':
-                                # View by year
-                                transaction_view.display_income_by_year()
-                                
-                            elif income_choice == '2':
-                                # View by month
-                                transaction_view.display_income_by_month()
-                                
-                            elif income_choice == '3':
-                                # View by date
-                                transaction_view.display_income_by_date()
-                                
-                            elif income_choice == '4':
-                                # View all income
-                                transaction_view.display_income()
-                                
-                            elif income_choice == '5':
-                                # Edit/Delete income
-                                transaction_view.edit_delete_income()
-                                
-                            elif income_choice == '6':
-                                # Back to ledger menu
-                                break
-                                
-                            else:
-                                login_view.console.print("\n[bold red]Invalid choice! Please enter 1-6.[/bold red]\n")
-                        
-                    elif ledger_choice == '5':
-                        # Back to main menu
-                        break
-                        
-                    else:
-                        login_view.console.print("\n[bold red]Invalid choice! Please enter 1-5.[/bold red]\n")
-                
-                # Update ledger_view with selected ledger
-                ledger_view.set_current_ledger(ledger)
-            
-        elif choice == '4':
-            # Currency Information
-            while True:
-                currency_view.display_currency_menu()
-                
-                try:
-                    currency_choice = input("Enter your choice (1-3): ").strip()
-                except (EOFError, KeyboardInterrupt):
-                    login_view.console.print("\n[yellow]Returning to main menu...[/yellow]\n")
-                    break
-                
-                if currency_choice == '1':
-                    # View exchange rates
-                    currency_view.display_exchange_rates()
-                    
-                elif currency_choice == '2':
-                    # Currency converter
-                    currency_view.convert_currency()
-                    
-                elif currency_choice == '3':
-                    # Back to main menu
-                    break
-                    
-                else:
-                    login_view.console.print("\n[bold red]Invalid choice! Please enter 1-3.[/bold red]\n")
-                
-        elif choice == '5':
-            # View statistics
-            username = current_user.username if current_user else None
-            statistics_view = StatisticsView(username)
-            
-            while True:
-                statistics_view.display_statistics_menu()
-                
-                try:
-                    stats_choice = input("Enter your choice (1-4): ").strip()
-                except (EOFError, KeyboardInterrupt):
-                    login_view.console.print("\n[yellow]Returning to main menu...[/yellow]\n")
-                    break
-                
-                if stats_choice == '1':
-                    # Select by year
-                    statistics_view.display_statistics_by_year()
-                    
-                elif stats_choice == '2':
-                    # Select by month
-                    statistics_view.display_statistics_by_month()
-                    
-                elif stats_choice == '3':
-                    # Total summary
-                    statistics_view.display_total_summary()
-                    
-                elif stats_choice == '4':
-                    # Back to main menu
-                    break
-                    
-                else:
-                    login_view.console.print("\n[bold red]Invalid choice! Please enter 1-4.[/bold red]\n")
-                
-        elif choice == '6':
-            # Logout/Exit
-            login_view.console.print("\n[bold yellow]Thank you for using Accounting Book! Goodbye![/bold yellow]\n")
-            break
-            
-        else:
-            login_view.console.print("\n[bold red]Invalid choice! Please enter 1-6.[/bold red]\n")
+        state = handlers.get((state, choice), on_invalid)() or state
 
 
 if __name__ == "__main__":
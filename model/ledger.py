@@ -10,6 +10,9 @@ Date: 2025.10.18
 class Ledger:
     """Ledger model class for storing ledger information"""
     
+    __slots__ = ('ledger_name', 'currency', 'username', '_folder_path',
+                 '_expenses_file_path', '_income_file_path', '_meta_file_path')
+    
     def __init__(self, ledger_name: str, currency: str, username: str = None):
         """
         Initialize a Ledger object
@@ -23,6 +26,10 @@ class Ledger:
         self.currency = currency
         self.username = username  # None for guest mode
         self._folder_path = self._generate_folder_path()
+        # File paths are derived once here and reused by every getter
+        self._expenses_file_path = f"{self._folder_path}/expenses.csv"
+        self._income_file_path = f"{self._folder_path}/income.csv"
+        self._meta_file_path = f"{self._folder_path}/meta.json"
     
     def _generate_folder_path(self) -> str:
         """
@@ -31,12 +38,8 @@ class Ledger:
         Returns:
             Folder path string
         """
-        if self.username:
-            # Logged in user: username-ledger_name
-            return f"data/ledgers/{self.username}-{self.ledger_name}"
-        else:
-            # Guest mode: local-ledger_name
-            return f"data/ledgers/local-{self.ledger_name}"
+        # Logged in user: username-ledger_name, guest mode: local-ledger_name
+        return f"data/ledgers/{self.username or 'local'}-{self.ledger_name}"
     
     def get_folder_path(self) -> str:
         """Get the folder path for this ledger"""
@@ -44,11 +47,15 @@ class Ledger:
     
     def get_expenses_file_path(self) -> str:
         """Get the expenses CSV file path"""
-        return f"{self._folder_path}/expenses.csv"
+        return self._expenses_file_path
     
     def get_income_file_path(self) -> str:
         """Get the income CSV file path"""
-        return f"{self._folder_path}/income.csv"
+        return self._income_file_path
+    
+    def get_meta_file_path(self) -> str:
+        """Get the metadata JSON file path (stores the ledger currency)"""
+        return self._meta_file_path
     
     def __str__(self) -> str:
         """Returns a string representation of the Ledger object"""
@@ -0,0 +1,127 @@
+"""
+Ledger Records Class
+Column-oriented view of the transactions stored in a ledger CSV file
+
+Author: Rickey
+Date: 2026.10.15
+"""
+
+from array import array
+from bisect import bisect_left
+
+
+class LedgerRecords:
+    """Columnar (one array per field) representation of ledger rows"""
+
+    def __init__(self):
+        """Initialize empty record columns"""
+        self.year = array('h')
+        self.month = array('b')
+        self.day = array('b')
+        self.amount = array('d')
+        self.cents = array('q')  # Amounts as integer cents, for exact totals
+        self.category = []
+        self.category_code = array('h')
+        self.categories = []  # Category names, indexed by category_code
+        self.description = []
+        self.rows = []  # Original row dicts, aligned with the columns
+        self._codes = {}  # Category name -> category code
+        self._date_keys = None  # Sorted (year, month, day) keys, built on demand
+        self._date_order = None  # Record indices in the same order as _date_keys
+
+    @classmethod
+    def from_rows(cls, rows: list) -> 'LedgerRecords':
+        """
+        Build columns from the row dicts returned by csv.DictReader
+
+        Args:
+            rows: List of row dictionaries (year, month, day, amount, category, description)
+
+        Returns:
+            LedgerRecords object; rows with unparseable fields are skipped
+        """
+        records = cls()
+        for row in rows:
+            records.append_row(row)
+        return records
+
+    def append_row(self, row: dict) -> bool:
+        """
+        Parse one row dict and append it to the columns
+
+        Args:
+            row: Row dictionary (year, month, day, amount, category, description)
+
+        Returns:
+            True if the row was appended, False if a field could not be parsed
+        """
+        count = len(self.rows)
+        try:
+            year = int(row['year'])
+            month = int(row['month'])
+            day = int(row['day'])
+            amount = float(row['amount'])
+            cents = round(amount * 100)
+            category = row['category']
+            # Typed columns can reject out-of-range values, so they are all appended inside the guard
+            self.year.append(year)
+            self.month.append(month)
+            self.day.append(day)
+            self.amount.append(amount)
+            self.cents.append(cents)
+        except (ValueError, KeyError, TypeError, OverflowError):
+            # Drop any partially appended fields of the bad row so the columns stay aligned
+            for column in (self.year, self.month, self.day, self.amount, self.cents):
+                del column[count:]
+            return False
+
+        code = self._codes.get(category)
+        if code is None:
+            code = self._codes[category] = len(self.categories)
+            self.categories.append(category)
+
+        self.category.append(category)
+        self.category_code.append(code)
+        self.description.append(row.get('description') or '')
+        self.rows.append(row)
+        self._date_keys = None
+        return True
+
+    def indices_between(self, start: tuple, end: tuple) -> list:
+        """
+        Get the indices of records dated in [start, end) using a sorted date index
+
+        Args:
+            start: Inclusive lower bound, e.g. (2025,) or (2025, 3) or (2025, 3, 14)
+            end: Exclusive upper bound in the same form, e.g. (2026,)
+
+        Returns:
+            Record indices in file order
+        """
+        if self._date_keys is None:
+            # Stable sort, so records on the same date keep their file order
+            order = sorted(range(len(self.rows)), key=lambda i: (self.year[i], self.month[i], self.day[i]))
+            self._date_keys = [(self.year[i], self.month[i], self.day[i]) for i in order]
+            self._date_order = order
+
+        low = bisect_left(self._date_keys, start)
+        high = bisect_left(self._date_keys, end, low)
+        # The index is date-sorted; re-sort the hits so callers see file order,
+        # exactly as a plain scan would (e.g. category first-appearance order)
+        return sorted(self._date_order[low:high])
+
+    def to_list_of_dicts(self) -> list:
+        """Get the records as a list of row dictionaries"""
+        return list(self.rows)
+
+    def __len__(self) -> int:
+        """Returns the number of records"""
+        return len(self.rows)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the LedgerRecords object"""
+        return f"LedgerRecords(count={len(self.rows)})"
+
+    def __repr__(self) -> str:
+        """Returns a representation of the LedgerRecords object"""
+        return self.__str__()
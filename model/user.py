@@ -10,6 +10,8 @@ Date: 2025.10.15
 class User:
     """User model class for storing user information"""
     
+    __slots__ = ('username', 'password')
+    
     def __init__(self, username: str, password: str):
         """
         Initialize a User object
@@ -21,6 +23,16 @@ class User:
         self.username = username
         self.password = password
     
+    def __eq__(self, other) -> bool:
+        """Users are equal when their usernames are equal"""
+        if not isinstance(other, User):
+            return NotImplemented
+        return self.username == other.username
+    
+    def __hash__(self) -> int:
+        """Hash by username, consistent with __eq__"""
+        return hash(self.username)
+    
     def __str__(self) -> str:
         """Returns a string representation of the User object"""
         return f"User(username={self.username})"
@@ -0,0 +1,52 @@
+"""
+Prompt Helpers
+Input parsing and prompting shared by the interactive views
+
+Author: Rickey
+Date: 2026.10.15
+"""
+
+from rich.console import Console
+from rich.prompt import Prompt
+from rich.text import Text
+
+
+def parse_int(text: str, max_digits: int = 9) -> int:
+    """
+    Parse a whole-number input such as a year, month or menu choice
+
+    Args:
+        text: Stripped user input
+        max_digits: Longest accepted input; longer strings are rejected unparsed
+
+    Returns:
+        Integer value, or None if the input is not a plain run of digits
+    """
+    # Length and digit checks reject bad input without int() raising and being caught
+    if 0 < len(text) <= max_digits and text.isdecimal():
+        return int(text)
+    return None
+
+
+def ask_until(console: Console, prompt: str, validator) -> str:
+    """
+    Prompt repeatedly until the validator accepts the answer
+
+    Args:
+        console: Console used for the prompt and error messages
+        prompt: Prompt markup (": " is appended)
+        validator: Function taking the stripped answer and returning (is_valid, error),
+            where error is a message string (shown in red) or a prebuilt Text
+
+    Returns:
+        The accepted answer
+
+    Raises:
+        EOFError, KeyboardInterrupt: If the user cancels input
+    """
+    while True:
+        value = Prompt.ask(prompt, console=console)
+        is_valid, error = validator(value)
+        if is_valid:
+            return value
+        console.print(error if isinstance(error, Text) else f"[red]{error}[/red]")
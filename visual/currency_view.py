@@ -6,74 +6,80 @@ Author: Rickey
 Date: 2025.10.23
 """
 
+import re
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich import box
-from control.currency_service import CurrencyService
+from control.currency_service import default_service
+
+
+# Plain decimal amount (optionally signed, so negatives get their own message)
+_AMOUNT_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
+# Display names for supported currency codes
+_CURRENCY_NAMES = {
+    'AUD': 'Australian Dollar',
+    'USD': 'US Dollar',
+    'CNY': 'Chinese Yuan',
+    'EUR': 'Euro',
+    'GBP': 'British Pound',
+    'JPY': 'Japanese Yen',
+    'CAD': 'Canadian Dollar',
+    'HKD': 'Hong Kong Dollar'
+}
 
 
 class CurrencyView:
     """View class for handling currency information display"""
     
+    # Column specs: (header, style, justify, width)
+    _RATES_COLUMNS = (
+        ("Currency", "bold cyan", "left", 20),
+        ("Code", "bold yellow", "left", 12),
+        ("Rate to AUD", "green", "right", 18),
+        ("Rate from AUD", "magenta", "right", 18),
+    )
+    _CHOICE_COLUMNS = (
+        ("Choice", "cyan", "left", 10),
+        ("Currency Code", "yellow", "left", 15),
+    )
+    
     def __init__(self):
         """Initialize CurrencyView with console and currency service"""
         self.console = Console()
-        self.currency_service = CurrencyService()
+        self.currency_service = default_service
     
     def display_exchange_rates(self):
         """Display all exchange rates in a table"""
         self.console.print("\n[bold blue]========== Exchange Rates ==========[/bold blue]\n")
         
-        table = Table(title="Exchange Rates (Base: AUD)", box=box.ROUNDED, show_header=True)
-        table.add_column("Currency", style="bold cyan", width=20)
-        table.add_column("Code", style="bold yellow", width=12)
-        table.add_column("Rate to AUD", style="green", justify="right", width=18)
-        table.add_column("Rate from AUD", style="magenta", justify="right", width=18)
+        table = self._new_table("Exchange Rates (Base: AUD)", self._RATES_COLUMNS)
         
-        supported_currencies = self.currency_service.get_supported_currencies()
+        # Fetch every rate in one call; the service only returns supported currencies
+        rates = self.currency_service.get_all_rate_infos()
         
-        for currency in supported_currencies:
-            try:
-                info = self.currency_service.get_rate_info(currency)
-                rate_to_aud = info['rate_to_aud']
-                rate_from_aud = info['rate_from_aud']
-                
-                # Format currency name
-                currency_names = {
-                    'AUD': 'Australian Dollar',
-                    'USD': 'US Dollar',
-                    'CNY': 'Chinese Yuan',
-                    'EUR': 'Euro',
-                    'GBP': 'British Pound',
-                    'JPY': 'Japanese Yen',
-                    'CAD': 'Canadian Dollar',
-                    'HKD': 'Hong Kong Dollar'
-                }
-                
-                name = currency_names.get(currency, currency)
-                
-                # Use bold styling for currency name and code to make them larger/more prominent
-                if currency == 'AUD':
-                    table.add_row(
-                        f"[bold cyan]{name}[/bold cyan]",
-                        f"[bold yellow]{currency}[/bold yellow]",
-                        "[green]1.0000 (Base)[/green]",
-                        "[magenta]1.0000[/magenta]"
-                    )
-                else:
-                    table.add_row(
-                        f"[bold cyan]{name}[/bold cyan]",
-                        f"[bold yellow]{currency}[/bold yellow]",
-                        f"[green]{rate_to_aud:.4f}[/green]",
-                        f"[magenta]{rate_from_aud:.4f}[/magenta]"
-                    )
-                    
-            except Exception as e:
-                self.console.print(f"[red]Error getting rate for {currency}: {e}[/red]")
+        # Base currency row first; styled Text cells skip Rich's markup parser
+        base = self.currency_service.base_currency
+        table.add_row(
+            Text(_CURRENCY_NAMES.get(base, base), style="bold cyan"),
+            Text(base, style="bold yellow"),
+            Text("1.0000 (Base)", style="green"),
+            Text("1.0000", style="magenta")
+        )
+        
+        other_rates = ((currency, rate_pair) for currency, rate_pair in rates.items() if currency != base)
+        for currency, (rate_to_aud, rate_from_aud) in other_rates:
+            table.add_row(
+                Text(_CURRENCY_NAMES.get(currency, currency), style="bold cyan"),
+                Text(currency, style="bold yellow"),
+                Text(f"{rate_to_aud:.4f}", style="green"),
+                Text(f"{rate_from_aud:.4f}", style="magenta")
+            )
         
         self.console.print(table)
-        self.console.print(f"\n[dim]Last updated: {self.currency_service.last_updated.strftime('%Y-%m-%d %H:%M:%S')}[/dim]\n")
+        self.console.print(f"\n[dim]Last updated: {self.currency_service.last_updated_str}[/dim]\n")
     
     def convert_currency(self):
         """Interactive currency conversion"""
@@ -83,41 +89,35 @@ class CurrencyView:
         while True:
             try:
                 amount_str = input("Enter amount to convert: ").strip()
-                try:
-                    amount = float(amount_str)
-                    if amount < 0:
-                        self.console.print("[red]Amount cannot be negative![/red]")
-                        continue
-                    break
-                except ValueError:
+                if not _AMOUNT_RE.fullmatch(amount_str):
                     self.console.print("[red]Invalid amount! Please enter a number.[/red]")
+                    continue
+                amount = float(amount_str)
+                if amount < 0:
+                    self.console.print("[red]Amount cannot be negative![/red]")
+                    continue
+                break
             except (EOFError, KeyboardInterrupt):
                 self.console.print("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Display currency menu
-        currencies = self.currency_service.get_supported_currencies()
-        currency_map = {}
-        
-        table = Table(title="Select Source Currency", box=box.ROUNDED, show_header=True)
-        table.add_column("Choice", style="cyan", width=10)
-        table.add_column("Currency Code", style="yellow", width=15)
-        
-        for idx, currency in enumerate(currencies, 1):
-            table.add_row(str(idx), currency)
-            currency_map[str(idx)] = currency
+        currencies = tuple(self.currency_service.get_supported_currencies())
+        count = len(currencies)
         
         self.console.print("\n")
-        self.console.print(table)
+        self.console.print(self._build_currency_table("Select Source Currency", currencies))
         self.console.print()
         
         # Get source currency
         from_currency = None
         while True:
             try:
-                choice = input(f"Select source currency (1-{len(currency_map)}): ").strip()
-                if choice in currency_map:
-                    from_currency = currency_map[choice]
+                choice = input(f"Select source currency (1-{count}): ").strip()
+                # Parse once; anything that is not a menu number maps to -1
+                index = int(choice) - 1 if choice.isdecimal() else -1
+                if 0 <= index < count:
+                    from_currency = currencies[index]
                     break
                 else:
                     self.console.print("[red]Invalid choice! Please select a valid option.[/red]")
@@ -126,26 +126,19 @@ class CurrencyView:
                 return
         
         # Display target currency menu
-        table = Table(title="Select Target Currency", box=box.ROUNDED, show_header=True)
-        table.add_column("Choice", style="cyan", width=10)
-        table.add_column("Currency Code", style="yellow", width=15)
-        
-        currency_map.clear()
-        for idx, currency in enumerate(currencies, 1):
-            table.add_row(str(idx), currency)
-            currency_map[str(idx)] = currency
-        
         self.console.print("\n")
-        self.console.print(table)
+        self.console.print(self._build_currency_table("Select Target Currency", currencies))
         self.console.print()
         
         # Get target currency
         to_currency = None
         while True:
             try:
-                choice = input(f"Select target currency (1-{len(currency_map)}): ").strip()
-                if choice in currency_map:
-                    to_currency = currency_map[choice]
+                choice = input(f"Select target currency (1-{count}): ").strip()
+                # Parse once; anything that is not a menu number maps to -1
+                index = int(choice) - 1 if choice.isdecimal() else -1
+                if 0 <= index < count:
+                    to_currency = currencies[index]
                     break
                 else:
                     self.console.print("[red]Invalid choice! Please select a valid option.[/red]")
@@ -172,9 +165,43 @@ Exchange Rate: 1 {from_currency} = {rate:.4f} {to_currency}
             ))
             self.console.print()
             
-        except Exception as e:
+        except ValueError as e:
             self.console.print(f"\n[bold red]Error: {e}[/bold red]\n")
     
+    def _new_table(self, title: str, columns: tuple) -> Table:
+        """
+        Create an empty table with the given column specs
+        
+        Args:
+            title: Table title
+            columns: Tuple of (header, style, justify, width) column specs
+            
+        Returns:
+            Rich Table object
+        """
+        table = Table(title=title, box=box.ROUNDED, show_header=True)
+        for header, style, justify, width in columns:
+            table.add_column(header, style=style, justify=justify, width=width)
+        return table
+    
+    def _build_currency_table(self, title: str, currencies: tuple) -> Table:
+        """
+        Build a numbered currency selection table
+        
+        Args:
+            title: Table title
+            currencies: Currency codes in menu order
+            
+        Returns:
+            Rich Table object
+        """
+        table = self._new_table(title, self._CHOICE_COLUMNS)
+        
+        for idx, currency in enumerate(currencies, 1):
+            table.add_row(str(idx), currency)
+        
+        return table
+    
     def display_currency_menu(self):
         """Display currency menu options"""
         menu_text = """
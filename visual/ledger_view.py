@@ -6,18 +6,29 @@ Author: Rickey
 Date: 2025.10.20
 """
 
-from rich.console import Console
+from types import MappingProxyType
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich import box
 from control.ledger_service import LedgerService
 from model.ledger import Ledger
 from model.user import User
+from visual._prompts import ask_until
+
+
+# Header markup parsed once at import
+_CREATE_LEDGER_HEADER = Text.from_markup("\n[bold blue]========== Create New Ledger ==========[/bold blue]\n")
 
 
 class LedgerView:
     """View class for handling ledger interface"""
     
+    # Currency selection table and read-only choice -> code map, built on first use
+    _CURRENCY_TABLE = None
+    _CURRENCY_MAP = None
+    
     def __init__(self, current_user: User = None):
         """
         Initialize LedgerView
@@ -26,36 +37,41 @@ class LedgerView:
             current_user: Current logged in user, None for guest mode
         """
         self.console = Console()
-        self.ledger_service = LedgerService()
+        self.ledger_service = LedgerService.instance()
         self.current_user = current_user
         self.current_ledger: Ledger = None
+        self._ledgers_cache = None  # Ledgers listed for this user, cleared when one is created
     
     def display_currency_menu(self) -> dict:
         """
         Display currency selection menu
         
         Returns:
-            Dictionary mapping choice number to currency code
+            Read-only mapping of choice number to currency code
         """
-        currencies = LedgerService.SUPPORTED_CURRENCIES
-        currency_map = {}
-        
-        table = Table(title="Select Currency", box=box.ROUNDED, show_header=True)
-        table.add_column("Choice", style="cyan", width=10)
-        table.add_column("Currency Code", style="yellow", width=15)
-        table.add_column("Currency Name", style="green")
-        
-        choice_num = 1
-        for code, name in currencies.items():
-            table.add_row(str(choice_num), code, name)
-            currency_map[str(choice_num)] = code
-            choice_num += 1
+        # Supported currencies never change, so the table and map are built once per process
+        if LedgerView._CURRENCY_TABLE is None:
+            currencies = LedgerService.SUPPORTED_CURRENCIES
+            currency_map = {}
+            
+            table = Table(title="Select Currency", box=box.ROUNDED, show_header=True)
+            table.add_column("Choice", style="cyan", width=10)
+            table.add_column("Currency Code", style="yellow", width=15)
+            table.add_column("Currency Name", style="green")
+            
+            choice_num = 1
+            for code, name in currencies.items():
+                table.add_row(str(choice_num), code, name)
+                currency_map[str(choice_num)] = code
+                choice_num += 1
+            
+            LedgerView._CURRENCY_TABLE = table
+            LedgerView._CURRENCY_MAP = MappingProxyType(currency_map)
         
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print("\n[dim]Note: Currency cannot be changed after ledger creation![/dim]\n")
+        # One print call for the spacing, table and note
+        self.console.print(Group("\n", LedgerView._CURRENCY_TABLE, "\n[dim]Note: Currency cannot be changed after ledger creation![/dim]\n"))
         
-        return currency_map
+        return LedgerView._CURRENCY_MAP
     
     def create_new_ledger(self) -> Ledger:
         """
@@ -64,46 +80,43 @@ class LedgerView:
         Returns:
             Ledger object if created successfully, None otherwise
         """
-        self.console.print("\n[bold blue]========== Create New Ledger ==========[/bold blue]\n")
+        self.console.print(_CREATE_LEDGER_HEADER)
+        
+        # Existing names are collected once, so retries do not touch the filesystem
+        existing_names = {ledger.ledger_name for ledger in self.list_ledgers()}
+        
+        # Resolved once for the whole prompt loop and the create call below
+        username = self._current_username()
+        mode = f"for user '{username}'" if username else "in guest mode"
+        
+        def check_name(name):
+            if not name:
+                return False, "Ledger name cannot be empty! Please enter a name."
+            if name in existing_names:
+                return False, f"Ledger '{name}' already exists {mode}! Please choose a different name."
+            return True, None
         
         # Get ledger name - loop until valid
-        ledger_name = None
-        while True:
-            try:
-                ledger_name = input("Enter ledger name: ").strip()
-                if ledger_name:
-                    username = self.current_user.username if self.current_user else None
-                    if not self.ledger_service.ledger_exists(ledger_name, username):
-                        break
-                    else:
-                        mode = f"for user '{username}'" if username else "in guest mode"
-                        self.console.print(f"[red]Ledger '{ledger_name}' already exists {mode}! Please choose a different name.[/red]")
-                else:
-                    self.console.print("[red]Ledger name cannot be empty! Please enter a name.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
-                return None
-        
-        username = self.current_user.username if self.current_user else None
+        try:
+            ledger_name = ask_until(self.console, "Enter ledger name", check_name)
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]")
+            return None
         
         # Display currency selection
         currency_map = self.display_currency_menu()
         
         # Get currency choice - loop until valid
-        currency = None
-        while True:
-            try:
-                choice = input(f"\nSelect currency (1-{len(currency_map)}): ").strip()
-                
-                if choice in currency_map:
-                    currency = currency_map[choice]
-                    break
-                else:
-                    self.console.print("[red]Invalid choice! Please select a valid option.[/red]")
-                    
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
-                return None
+        try:
+            choice = ask_until(
+                self.console,
+                f"\nSelect currency (1-{len(currency_map)})",
+                lambda value: (value in currency_map, "Invalid choice! Please select a valid option.")
+            )
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]")
+            return None
+        currency = currency_map[choice]
         
         # Create ledger
         try:
@@ -111,11 +124,14 @@ class LedgerView:
             
             ledger = self.ledger_service.create_ledger(ledger_name, currency, username)
             
-            self.console.print(f"\n[bold green]Ledger '{ledger_name}' created successfully![/bold green]")
-            self.console.print(f"[dim]Folder: {ledger.get_folder_path()}[/dim]")
-            self.console.print(f"[dim]Currency: {currency}[/dim]")
+            self.console.print(
+                f"\n[bold green]Ledger '{ledger_name}' created successfully![/bold green]\n"
+                f"[dim]Folder: {ledger.get_folder_path()}[/dim]\n"
+                f"[dim]Currency: {currency}[/dim]"
+            )
             
             self.current_ledger = ledger
+            self._ledgers_cache = None
             return ledger
             
         except Exception as e:
@@ -127,18 +143,18 @@ class LedgerView:
         List all ledgers for current user/guest
         
         Returns:
-            List of Ledger objects
+            List of Ledger objects (cached for this view; do not modify)
         """
-        username = self.current_user.username if self.current_user else None
-        ledgers = self.ledger_service.list_user_ledgers(username)
-        return ledgers
+        if self._ledgers_cache is None:
+            username = self._current_username()
+            self._ledgers_cache = self.ledger_service.list_user_ledgers(username)
+        return self._ledgers_cache
     
     def display_ledgers(self):
         """Display all ledgers in a table"""
         ledgers = self.list_ledgers()
         
         if not ledgers:
-            mode = "logged in" if self.current_user else "guest mode"
             self.console.print("\n[yellow]No ledgers found. Create a new ledger to get started![/yellow]\n")
             return
         
@@ -148,13 +164,13 @@ class LedgerView:
         table.add_column("Currency", style="green", width=10)
         table.add_column("Mode", style="magenta", width=10)
         
+        # Plain Text cells skip markup parsing (and show names containing '[' literally)
+        add_row = table.add_row
         for idx, ledger in enumerate(ledgers, 1):
-            mode = f"User" if ledger.username else "Guest"
-            table.add_row(str(idx), ledger.ledger_name, ledger.currency, mode)
+            mode = "User" if ledger.username else "Guest"
+            add_row(Text(str(idx)), Text(ledger.ledger_name), Text(ledger.currency), Text(mode))
         
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print("\n")
+        self.console.print(Group("\n", table, "\n"))
     
     def select_ledger(self) -> Ledger:
         """
@@ -171,24 +187,36 @@ class LedgerView:
         
         self.display_ledgers()
         
-        while True:
+        # Built once; printed as-is on every out-of-range retry
+        range_error = Text.assemble(
+            ("Invalid choice! Please select a number between 1 and ", "red"),
+            (str(len(ledgers)), "red bold"),
+            (".", "red")
+        )
+        
+        def check_choice(value):
             try:
-                choice = input(f"Select ledger (1-{len(ledgers)}): ").strip()
-                idx = int(choice) - 1
-                
-                if 0 <= idx < len(ledgers):
-                    selected_ledger = ledgers[idx]
-                    self.current_ledger = selected_ledger
-                    self.console.print(f"\n[green]Selected ledger: {selected_ledger.ledger_name}[/green]\n")
-                    return selected_ledger
-                else:
-                    self.console.print("[red]Invalid choice! Please select a number between 1 and {}.[/red]".format(len(ledgers)))
-                    
+                idx = int(value) - 1
             except ValueError:
-                self.console.print("[red]Invalid input! Please enter a valid number.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
-                return None
+                return False, "Invalid input! Please enter a valid number."
+            if not 0 <= idx < len(ledgers):
+                return False, range_error
+            return True, None
+        
+        try:
+            choice = ask_until(self.console, f"Select ledger (1-{len(ledgers)})", check_choice)
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]")
+            return None
+        
+        selected_ledger = ledgers[int(choice) - 1]
+        self.current_ledger = selected_ledger
+        self.console.print(f"\n[green]Selected ledger: {selected_ledger.ledger_name}[/green]\n")
+        return selected_ledger
+    
+    def _current_username(self) -> str:
+        """Get the current user's username, or None in guest mode"""
+        return self.current_user.username if self.current_user else None
     
     def get_current_ledger(self) -> Ledger:
         """Get currently selected ledger"""
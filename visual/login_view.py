@@ -6,43 +6,64 @@ Author: Rickey
 Date: 2025.10.17
 """
 
+import os
+import time
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 from rich import box
 from control.user_service import UserService
+from control.ledger_service import LedgerService
 from model.user import User
 
 
+# Welcome banner and login menu markup (parsed once per LoginView)
+_WELCOME_TEXT = """
+╔════════════════════════════════════════════╗
+║     Accounting Book Management System      ║
+║         USyd COMP9001 Final Project        ║
+╚════════════════════════════════════════════╝
+        """
+
+_MENU_TEXT = """
+[bold]Please select an option:[/bold]
+[cyan]1.[/cyan] Continue as Guest (Local storage only)
+[cyan]2.[/cyan] Login (Sync to cloud)
+[cyan]3.[/cyan] Register
+[cyan]4.[/cyan] Exit
+        """
+
+# Header markup parsed once at import
+_LOGIN_HEADER = Text.from_markup("\n[bold blue]========== Login ==========[/bold blue]\n")
+
+
 class LoginView:
     """View class for handling login interface"""
     
+    # Local (guest) ledger file offered for cloud sync on login
+    LOCAL_LEDGER_PATH = "data/ledgers/local_accounts.csv"
+    # Nothing in the app creates or removes that file, so one stat per process is enough
+    _LOCAL_CHECKED = False
+    _LOCAL_EXISTS = False
+    
     def __init__(self):
         """Initialize LoginView with console and user service"""
         self.console = Console()
         self.user_service = UserService()
         self.current_user: User = None
+        # Markup is parsed once here; the display methods print the ready Text
+        self._welcome = Text.from_markup(_WELCOME_TEXT, style="bold cyan")
+        self._menu = self.console.render_str(_MENU_TEXT)  # Keeps the console's number highlighting
     
     def display_welcome(self):
         """Display welcome message"""
-        welcome_text = """
-╔════════════════════════════════════════════╗
-║     Accounting Book Management System      ║
-║         USyd COMP9001 Final Project        ║
-╚════════════════════════════════════════════╝
-        """
-        self.console.print(welcome_text, style="bold cyan")
+        self.console.print(self._welcome)
         print()
     
     def display_login_menu(self):
         """Display login menu options"""
-        menu_text = """
-[bold]Please select an option:[/bold]
-[cyan]1.[/cyan] Continue as Guest (Local storage only)
-[cyan]2.[/cyan] Login (Sync to cloud)
-[cyan]3.[/cyan] Register
-[cyan]4.[/cyan] Exit
-        """
-        self.console.print(menu_text)
+        self.console.print(self._menu)
     
     def get_user_input(self, prompt: str) -> str:
         """
@@ -66,7 +87,7 @@ class LoginView:
         Returns:
             True if login successful, False otherwise
         """
-        self.console.print("\n[bold blue]========== Login ==========[/bold blue]\n")
+        self.console.print(_LOGIN_HEADER)
         
         username = self.get_user_input("Enter username")
         if not username:
@@ -83,17 +104,12 @@ class LoginView:
             self.current_user = self.user_service.get_user(username)
             
             # Ensure default ledger exists for user
-            from control.ledger_service import LedgerService
-            ledger_service = LedgerService()
-            default_ledger = ledger_service.create_default_ledger(username, "AUD")
+            default_ledger = LedgerService.instance().create_default_ledger(username, "AUD")
             
             # Simulate checking for local ledger and syncing to cloud
-            import os
-            local_ledger_path = "data/ledgers/local_accounts.csv"
-            
-            if os.path.exists(local_ledger_path):
+            if self._local_ledger_exists():
                 self.console.print("\n[bold yellow]Found local ledger data...[/bold yellow]")
-                self._simulate_cloud_sync(local_ledger_path, username)
+                self._simulate_cloud_sync(self.LOCAL_LEDGER_PATH, username)
             
             self.console.print(f"\n[bold green]Login successful! Welcome, {username}![/bold green]\n")
             self.console.print("[dim]Your ledger data is now synced to cloud.[/dim]\n")
@@ -102,6 +118,19 @@ class LoginView:
             self.console.print("\n[bold red]Login failed! Invalid username or password.[/bold red]\n")
             return False
     
+    @classmethod
+    def _local_ledger_exists(cls) -> bool:
+        """
+        Check whether the local ledger file exists, probing the filesystem only once
+        
+        Returns:
+            True if the local ledger file exists, False otherwise
+        """
+        if not cls._LOCAL_CHECKED:
+            cls._LOCAL_EXISTS = os.path.exists(cls.LOCAL_LEDGER_PATH)
+            cls._LOCAL_CHECKED = True
+        return cls._LOCAL_EXISTS
+    
     def _simulate_cloud_sync(self, local_file: str, username: str):
         """
         Simulate syncing local ledger to cloud
@@ -110,28 +139,36 @@ class LoginView:
             local_file: Path to local ledger file
             username: Username for cloud storage
         """
-        import time
-        import os
-        
-        # Count records in local file
+        # Count records in local file; the caller has already checked it exists
         record_count = 0
-        if os.path.exists(local_file):
-            with open(local_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                record_count = len([l for l in lines if l.strip() and not l.startswith('#')]) - 1  # Subtract header
+        try:
+            # Stream raw lines; counting needs no decoding and no list of lines
+            with open(local_file, 'rb', buffering=1 << 20) as f:
+                record_count = sum(1 for l in f if l.strip() and not l.startswith(b'#')) - 1  # Subtract header
+        except FileNotFoundError:
+            pass  # Removed since the caller's check
         
         if record_count > 0:
             self.console.print(f"[cyan]Uploading {record_count} records to cloud...[/cyan]")
             
-            # Simulate upload progress
-            for i in range(3):
-                self.console.print(f"[dim]Syncing... [{'.' * (i+1)}][/dim]")
-                time.sleep(0.3)
+            # Simulate upload progress, updating one transient line in place
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[dim]Syncing... {task.fields[dots]}[/dim]"),
+                console=self.console,
+                transient=True
+            ) as progress:
+                task = progress.add_task("sync", dots="")
+                for i in range(3):
+                    progress.update(task, dots=f"[{'.' * (i+1)}]")
+                    time.sleep(0.3)
             
             # Move local file to user's cloud storage (simulate)
             user_ledger_path = f"data/ledgers/{username}_accounts.csv"
-            self.console.print(f"[green]✓ Successfully synced {record_count} records to cloud[/green]")
-            self.console.print(f"[dim]Data stored in: {user_ledger_path}[/dim]")
+            self.console.print(
+                f"[green]✓ Successfully synced {record_count} records to cloud[/green]\n"
+                f"[dim]Data stored in: {user_ledger_path}[/dim]"
+            )
             
             # In real implementation, you would copy/merge the data
             # For now, we just simulate the process
@@ -146,9 +183,7 @@ class LoginView:
             True to continue as guest
         """
         # Ensure default ledger exists for guest
-        from control.ledger_service import LedgerService
-        ledger_service = LedgerService()
-        default_ledger = ledger_service.create_default_ledger(None, "AUD")
+        default_ledger = LedgerService.instance().create_default_ledger(None, "AUD")
         
         self.console.print("\n[bold yellow]Continuing as Guest[/bold yellow]")
         self.console.print("[dim]Your data will be stored locally only.[/dim]")
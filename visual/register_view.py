@@ -7,9 +7,17 @@ Date: 2025.10.26
 """
 
 from rich.console import Console
+from rich.text import Text
 from control.user_service import UserService
 from control.ledger_service import LedgerService
 from model.user import User
+from visual._prompts import ask_until
+
+
+# Header and retry messages, built once at import
+_REGISTER_HEADER = Text.from_markup("\n[bold blue]========== Register ==========[/bold blue]\n")
+_EMPTY_PASSWORD_ERROR = Text("Password cannot be empty! Please enter a password.", style="red")
+_PASSWORD_MISMATCH_ERROR = Text("Passwords do not match! Please try again.", style="red")
 
 
 class RegisterView:
@@ -24,24 +32,9 @@ class RegisterView:
         """
         self.console = Console()
         self.user_service = user_service if user_service else UserService()
-        self.ledger_service = LedgerService()
+        self.ledger_service = LedgerService.instance()
         self.current_user: User = None
     
-    def get_user_input(self, prompt: str) -> str:
-        """
-        Get user input with prompt
-        
-        Args:
-            prompt: Prompt message to display
-            
-        Returns:
-            User input string
-        """
-        try:
-            return input(f"{prompt}: ").strip()
-        except (EOFError, KeyboardInterrupt):
-            raise
-    
     def register(self) -> bool:
         """
         Handle user registration process with automatic default ledger creation
@@ -49,48 +42,28 @@ class RegisterView:
         Returns:
             True if registration successful, False otherwise
         """
-        self.console.print("\n[bold blue]========== Register ==========[/bold blue]\n")
-        
-        # Get username - loop until valid
-        username = None
-        while True:
-            try:
-                username = self.get_user_input("Enter new username")
-                is_valid, error_message = self.user_service.validate_username(username)
-                
-                if is_valid:
-                    break
-                else:
-                    self.console.print(f"[red]{error_message}[/red]")
-                    
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
-                return False
-        
-        # Get password - loop until valid
-        password = None
-        while True:
-            try:
-                password = self.get_user_input("Enter password")
-                if not password:
-                    self.console.print("[red]Password cannot be empty! Please enter a password.[/red]")
-                else:
-                    break
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
-                return False
+        self.console.print(_REGISTER_HEADER)
         
-        # Confirm password - loop until valid
-        while True:
-            try:
-                confirm_password = self.get_user_input("Confirm password")
-                if password == confirm_password:
-                    break
-                else:
-                    self.console.print("[red]Passwords do not match! Please try again.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
-                return False
+        try:
+            # Get username - loop until valid
+            username = ask_until(self.console, "Enter new username", self.user_service.validate_username)
+            
+            # Get password - loop until valid
+            password = ask_until(
+                self.console,
+                "Enter password",
+                lambda value: (bool(value), _EMPTY_PASSWORD_ERROR)
+            )
+            
+            # Confirm password - loop until valid
+            ask_until(
+                self.console,
+                "Confirm password",
+                lambda value: (value == password, _PASSWORD_MISMATCH_ERROR)
+            )
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]")
+            return False
         
         # Register user
         if self.user_service.register_user(username, password):
@@ -9,12 +9,20 @@ Date: 2025.10.25
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich import box
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from control.statistics_service import StatisticsService
 from control.ledger_service import LedgerService
-from control.currency_service import CurrencyService
+from control.currency_service import default_service
 from model.ledger import Ledger
+from visual._prompts import parse_int
+
+
+# Category names repeat across screens, so their title-cased form is cached
+_title = lru_cache(maxsize=512)(str.title)
 
 
 class StatisticsView:
@@ -27,11 +35,19 @@ class StatisticsView:
         Args:
             username: Current user's username, None for guest
         """
-        self.console = Console()
-        self.statistics_service = StatisticsService()
-        self.ledger_service = LedgerService()
-        self.currency_service = CurrencyService()
+        # Highlighting is off: every cell is already styled by its column or markup
+        self.console = Console(highlight=False)
+        # Shared services, so row and totals caches survive between visits to the statistics menu
+        self.ledger_service = LedgerService.instance()
+        self.statistics_service = StatisticsService.instance()
+        self.currency_service = default_service
         self.username = username
+        # Currency menu is fixed for the session, so build it once
+        self._supported_currencies = self.currency_service.get_supported_currencies()
+        self._currency_map = {str(idx): curr for idx, curr in enumerate(self._supported_currencies, 1)}
+        self._currency_menu = "[bold]Select display currency:[/bold]\n" + "\n".join(
+            f"[cyan]{idx}.[/cyan] {curr}" for idx, curr in enumerate(self._supported_currencies, 1)
+        )
     
     def display_statistics_menu(self):
         """Display statistics menu"""
@@ -44,245 +60,182 @@ class StatisticsView:
         """
         self.console.print(menu_text)
     
-    def display_statistics_by_year(self):
-        """Display statistics for a specific year across all ledgers"""
-        self.console.print("\n[bold blue]========== Statistics by Year ==========[/bold blue]\n")
-        
-        # Get currency selection
-        supported_currencies = self.currency_service.get_supported_currencies()
-        
-        self.console.print("[bold]Select display currency:[/bold]")
-        currency_map = {}
-        for idx, curr in enumerate(supported_currencies, 1):
-            currency_map[str(idx)] = curr
-            self.console.print(f"[cyan]{idx}.[/cyan] {curr}")
-        
-        while True:
-            try:
-                choice = input(f"\nSelect currency (1-{len(supported_currencies)}): ").strip()
-                if choice in currency_map:
-                    target_currency = currency_map[choice]
-                    break
-                else:
-                    self.console.print(f"[red]Invalid choice! Please enter 1-{len(supported_currencies)}.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
-        
-        # Get year input
-        while True:
-            try:
-                year_str = input("Enter year (YYYY): ").strip()
-                year = int(year_str)
-                if 1900 <= year <= 2100:
-                    break
-                else:
-                    self.console.print("[red]Please enter a valid year (1900-2100).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid year format! Please enter a number.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
-        
-        # Get all ledgers for the user
-        ledgers = self.ledger_service.list_user_ledgers(self.username)
-        
-        if not ledgers:
-            self.console.print("\n[yellow]No ledgers found.[/yellow]\n")
-            return
-        
-        # Calculate totals across all ledgers (convert to target currency)
-        total_income = 0.0
-        total_expenses = 0.0
-        income_by_category = {}
-        expenses_by_category = {}
-        
-        # Store converted amounts for each ledger
-        ledger_summaries = []
+    def _ledger_rates(self, ledgers: list, target_currency: str) -> dict:
+        """
+        Get the conversion rate from each ledger currency to the display currency
         
-        for ledger in ledgers:
-            # Get year statistics for this ledger
-            income_stats = self.statistics_service.get_income_by_year(ledger, year)
-            expense_stats = self.statistics_service.get_expenses_by_year(ledger, year)
-            
-            ledger_income = income_stats['total']
-            ledger_expenses = expense_stats['total']
-            
-            # Convert to target currency
-            converted_income = self.currency_service.convert(ledger_income, ledger.currency, target_currency)
-            converted_expenses = self.currency_service.convert(ledger_expenses, ledger.currency, target_currency)
-            
-            total_income += converted_income
-            total_expenses += converted_expenses
-            
-            # Store for display
-            ledger_summaries.append({
-                'ledger': ledger,
-                'income': converted_income,
-                'expenses': converted_expenses,
-                'balance': converted_income - converted_expenses
-            })
-            
-            # Aggregate by category (convert to target currency)
-            for category, amount in income_stats['by_category'].items():
-                converted_amount = self.currency_service.convert(amount, ledger.currency, target_currency)
-                if category in income_by_category:
-                    income_by_category[category] += converted_amount
-                else:
-                    income_by_category[category] = converted_amount
+        Args:
+            ledgers: List of Ledger objects
+            target_currency: Display currency code
             
-            for category, amount in expense_stats['by_category'].items():
-                converted_amount = self.currency_service.convert(amount, ledger.currency, target_currency)
-                if category in expenses_by_category:
-                    expenses_by_category[category] += converted_amount
-                else:
-                    expenses_by_category[category] = converted_amount
-        
-        total_income = round(total_income, 2)
-        total_expenses = round(total_expenses, 2)
-        total_balance = round(total_income - total_expenses, 2)
-        
-        # Round category totals
-        for category in income_by_category:
-            income_by_category[category] = round(income_by_category[category], 2)
-        for category in expenses_by_category:
-            expenses_by_category[category] = round(expenses_by_category[category], 2)
-        
-        # Display total summary
-        summary_text = f"""
-Total Income: {target_currency} {total_income:.2f}
-Total Expenses: {target_currency} {total_expenses:.2f}
-Total Balance (Surplus): {target_currency} {total_balance:.2f}
-Year: {year}
+        Returns:
+            Dictionary mapping currency code to rate (1.0 without a lookup for the display currency)
         """
-        balance_color = "green" if total_balance >= 0 else "red"
-        panel = Panel(summary_text.strip(), title="Yearly Financial Summary", border_style=balance_color, box=box.ROUNDED)
-        self.console.print(panel)
-        self.console.print()
-        
-        # Display summary by ledger
-        self.console.print(f"\n[bold]Year {year} Summary by Ledger ({target_currency}):[/bold]\n")
-        summary_table = Table(title=f"Financial Summary by Ledger - {year}", box=box.ROUNDED, show_header=True)
-        summary_table.add_column("Ledger", style="cyan", width=20)
-        summary_table.add_column("Original Currency", style="yellow", width=15)
-        summary_table.add_column("Total Income", style="green", justify="right", width=18)
-        summary_table.add_column("Total Expenses", style="red", justify="right", width=18)
-        summary_table.add_column("Balance", style="magenta", justify="right", width=18)
+        return {
+            currency: 1.0 if currency == target_currency
+            else self.currency_service.get_exchange_rate(currency, target_currency)
+            for currency in {ledger.currency for ledger in ledgers}
+        }
+    
+    def _ledger_rows(self, ledger_summaries: list, target_currency: str) -> list:
+        """
+        Format the per-ledger summary rows in one pass
         
-        for summary in ledger_summaries:
-            ledger = summary['ledger']
-            income = summary['income']
-            expenses = summary['expenses']
-            balance = summary['balance']
+        Args:
+            ledger_summaries: List of (ledger, income, expenses, balance) tuples
+            target_currency: Display currency code
             
-            balance_color = "green" if balance >= 0 else "red"
-            summary_table.add_row(
+        Returns:
+            List of row tuples ready for Table.add_row (balance as a styled Text cell)
+        """
+        return [
+            (
                 ledger.ledger_name,
                 ledger.currency,
                 f"{target_currency} {income:.2f}",
                 f"{target_currency} {expenses:.2f}",
-                f"[{balance_color}]{target_currency} {balance:.2f}[/{balance_color}]"
+                Text(f"{target_currency} {balance:.2f}", style="green" if balance >= 0 else "red")
             )
+            for ledger, income, expenses, balance in ledger_summaries
+        ]
+    
+    def _category_rows(self, by_category: dict, total: float, target_currency: str) -> list:
+        """
+        Format category rows sorted by amount (descending) with their share of the total
         
-        self.console.print(summary_table)
-        self.console.print()
-        
-        # Display income by category
-        if income_by_category:
-            income_cat_table = Table(title=f"Income by Category - {year} ({target_currency})", box=box.ROUNDED, show_header=True)
-            income_cat_table.add_column("Category", style="yellow", width=20)
-            income_cat_table.add_column("Total Amount", style="green", justify="right", width=18)
-            income_cat_table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(income_by_category.items(), key=lambda x: x[1], reverse=True)
-            
-            for category, amount in sorted_categories:
-                percentage = (amount / total_income * 100) if total_income > 0 else 0
-                income_cat_table.add_row(
-                    category.title(),
-                    f"{target_currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
-            
-            self.console.print(income_cat_table)
-            self.console.print()
-        
-        # Display expenses by category
-        if expenses_by_category:
-            expense_cat_table = Table(title=f"Expenses by Category - {year} ({target_currency})", box=box.ROUNDED, show_header=True)
-            expense_cat_table.add_column("Category", style="yellow", width=20)
-            expense_cat_table.add_column("Total Amount", style="red", justify="right", width=18)
-            expense_cat_table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(expenses_by_category.items(), key=lambda x: x[1], reverse=True)
-            
-            for category, amount in sorted_categories:
-                percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
-                expense_cat_table.add_row(
-                    category.title(),
-                    f"{target_currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
+        Args:
+            by_category: Dictionary mapping category to amount
+            total: Total amount the percentages are relative to
+            target_currency: Display currency code
             
-            self.console.print(expense_cat_table)
-            self.console.print()
+        Returns:
+            List of row tuples ready for Table.add_row
+        """
+        # Zero-total check and division done once; each row is a single multiply
+        scale = 100.0 / total if total > 0 else 0.0
+        return [
+            (
+                _title(category),
+                f"{target_currency} {amount:.2f}",
+                f"{amount * scale:.1f}%"
+            )
+            for category, amount in sorted(by_category.items(), key=itemgetter(1), reverse=True)
+        ]
     
-    def display_statistics_by_month(self):
-        """Display statistics for a specific month across all ledgers"""
-        self.console.print("\n[bold blue]========== Statistics by Month ==========[/bold blue]\n")
+    def _prompt_currency(self) -> str:
+        """
+        Show the display-currency menu and ask for a choice
         
-        # Get currency selection
-        supported_currencies = self.currency_service.get_supported_currencies()
+        Returns:
+            Selected currency code, or None if cancelled
+        """
+        count = len(self._supported_currencies)
         
-        self.console.print("[bold]Select display currency:[/bold]")
-        currency_map = {}
-        for idx, curr in enumerate(supported_currencies, 1):
-            currency_map[str(idx)] = curr
-            self.console.print(f"[cyan]{idx}.[/cyan] {curr}")
+        # One render and one write for the whole menu
+        self.console.print(self._currency_menu)
         
         while True:
             try:
-                choice = input(f"\nSelect currency (1-{len(supported_currencies)}): ").strip()
-                if choice in currency_map:
-                    target_currency = currency_map[choice]
-                    break
-                else:
-                    self.console.print(f"[red]Invalid choice! Please enter 1-{len(supported_currencies)}.[/red]")
+                choice = input(f"\nSelect currency (1-{count}): ").strip()
+                if choice in self._currency_map:
+                    return self._currency_map[choice]
+                self.console.print(f"[red]Invalid choice! Please enter 1-{count}.[/red]")
             except (EOFError, KeyboardInterrupt):
                 self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
+                return None
+    
+    def _prompt_year(self) -> int:
+        """
+        Ask for a year between 1900 and 2100
         
-        # Get year input
+        Returns:
+            Year as an integer, or None if cancelled
+        """
         while True:
             try:
-                year_str = input("Enter year (YYYY): ").strip()
-                year = int(year_str)
-                if 1900 <= year <= 2100:
-                    break
+                year = parse_int(input("Enter year (YYYY): ").strip())
+                if year is None:
+                    self.console.print("[red]Invalid year format! Please enter a number.[/red]")
+                elif 1900 <= year <= 2100:
+                    return year
                 else:
                     self.console.print("[red]Please enter a valid year (1900-2100).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid year format! Please enter a number.[/red]")
             except (EOFError, KeyboardInterrupt):
                 self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
+                return None
+    
+    def _prompt_month(self) -> int:
+        """
+        Ask for a month between 1 and 12
         
-        # Get month input
+        Returns:
+            Month as an integer, or None if cancelled
+        """
         while True:
             try:
-                month_str = input("Enter month (1-12): ").strip()
-                month = int(month_str)
-                if 1 <= month <= 12:
-                    break
+                month = parse_int(input("Enter month (1-12): ").strip())
+                if month is None:
+                    self.console.print("[red]Invalid month format! Please enter a number.[/red]")
+                elif 1 <= month <= 12:
+                    return month
                 else:
                     self.console.print("[red]Please enter a valid month (1-12).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid month format! Please enter a number.[/red]")
             except (EOFError, KeyboardInterrupt):
                 self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
+                return None
+    
+    def display_statistics_by_year(self):
+        """Display statistics for a specific year across all ledgers"""
+        self.console.print("\n[bold blue]========== Statistics by Year ==========[/bold blue]\n")
+        
+        # Get currency selection
+        target_currency = self._prompt_currency()
+        if target_currency is None:
+            return
+        
+        # Get year input
+        year = self._prompt_year()
+        if year is None:
+            return
+        
+        # Get all ledgers for the user
+        ledgers = self.ledger_service.list_user_ledgers(self.username)
+        
+        if not ledgers:
+            self.console.print("\n[yellow]No ledgers found.[/yellow]\n")
+            return
+        
+        # Rate per ledger currency, looked up once; the service does the aggregation
+        rates = self._ledger_rates(ledgers, target_currency)
+        
+        # Calculate totals across all ledgers (converted to target currency) and display them
+        self._render_period(
+            self.statistics_service.aggregate_by_year(ledgers, year, rates),
+            target_currency,
+            summary_title="Yearly Financial Summary",
+            period_line=f"Year: {year}",
+            heading=f"Year {year}",
+            period_tag=f"{year}"
+        )
+    
+    def display_statistics_by_month(self):
+        """Display statistics for a specific month across all ledgers"""
+        self.console.print("\n[bold blue]========== Statistics by Month ==========[/bold blue]\n")
+        
+        # Get currency selection
+        target_currency = self._prompt_currency()
+        if target_currency is None:
+            return
+        
+        # Get year input
+        year = self._prompt_year()
+        if year is None:
+            return
+        
+        # Get month input
+        month = self._prompt_month()
+        if month is None:
+            return
         
         # Get all ledgers for the user
         ledgers = self.ledger_service.list_user_ledgers(self.username)
@@ -295,250 +248,130 @@ Year: {year}
                       'July', 'August', 'September', 'October', 'November', 'December']
         month_name = month_names[month]
         
-        # Calculate totals across all ledgers (convert to target currency)
-        total_income = 0.0
-        total_expenses = 0.0
-        income_by_category = {}
-        expenses_by_category = {}
+        # Rate per ledger currency, looked up once; the service does the aggregation
+        rates = self._ledger_rates(ledgers, target_currency)
+        
+        # Calculate totals across all ledgers (converted to target currency) and display them
+        self._render_period(
+            self.statistics_service.aggregate_by_month(ledgers, year, month, rates),
+            target_currency,
+            summary_title="Monthly Financial Summary",
+            period_line=f"Month: {month_name} {year}",
+            heading=f"{month_name} {year}",
+            period_tag=f"{month_name} {year}"
+        )
+    
+    def display_total_summary(self):
+        """Display total summary across all ledgers with currency conversion"""
+        self.console.print("\n[bold blue]========== Total Summary ==========[/bold blue]\n")
         
-        # Store converted amounts for each ledger
-        ledger_summaries = []
+        # Get currency selection
+        target_currency = self._prompt_currency()
+        if target_currency is None:
+            return
         
-        for ledger in ledgers:
-            # Get month statistics for this ledger
-            income_stats = self.statistics_service.get_income_by_month(ledger, year, month)
-            expense_stats = self.statistics_service.get_expenses_by_month(ledger, year, month)
-            
-            ledger_income = income_stats['total']
-            ledger_expenses = expense_stats['total']
-            
-            # Convert to target currency
-            converted_income = self.currency_service.convert(ledger_income, ledger.currency, target_currency)
-            converted_expenses = self.currency_service.convert(ledger_expenses, ledger.currency, target_currency)
-            
-            total_income += converted_income
-            total_expenses += converted_expenses
-            
-            # Store for display
-            ledger_summaries.append({
-                'ledger': ledger,
-                'income': converted_income,
-                'expenses': converted_expenses,
-                'balance': converted_income - converted_expenses
-            })
-            
-            # Aggregate by category (convert to target currency)
-            for category, amount in income_stats['by_category'].items():
-                converted_amount = self.currency_service.convert(amount, ledger.currency, target_currency)
-                if category in income_by_category:
-                    income_by_category[category] += converted_amount
-                else:
-                    income_by_category[category] = converted_amount
-            
-            for category, amount in expense_stats['by_category'].items():
-                converted_amount = self.currency_service.convert(amount, ledger.currency, target_currency)
-                if category in expenses_by_category:
-                    expenses_by_category[category] += converted_amount
-                else:
-                    expenses_by_category[category] = converted_amount
+        # Get all ledgers for the user
+        ledgers = self.ledger_service.list_user_ledgers(self.username)
         
-        total_income = round(total_income, 2)
-        total_expenses = round(total_expenses, 2)
-        total_balance = round(total_income - total_expenses, 2)
+        if not ledgers:
+            self.console.print("\n[yellow]No ledgers found.[/yellow]\n")
+            return
         
-        # Round category totals
-        for category in income_by_category:
-            income_by_category[category] = round(income_by_category[category], 2)
-        for category in expenses_by_category:
-            expenses_by_category[category] = round(expenses_by_category[category], 2)
+        # Rate per ledger currency, looked up once; totals come from the cached cent columns
+        rates = self._ledger_rates(ledgers, target_currency)
+        
+        # Calculate totals across all ledgers (converted to target currency)
+        total_income, total_expenses, _, expenses_by_category, _ = self.statistics_service.aggregate_all(ledgers, rates)
+        balance = round(total_income - total_expenses, 2)
+        
+        # Display total summary
+        summary_text = f"""
+Total Income: {target_currency} {total_income:.2f}
+Total Expenses: {target_currency} {total_expenses:.2f}
+Balance (Surplus): {target_currency} {balance:.2f}
+        """
+        balance_color = "green" if balance >= 0 else "red"
+        panel = Panel(summary_text.strip(), title="Total Financial Summary", border_style=balance_color, box=box.ROUNDED)
+        self.console.print(panel)
+        self.console.print()
+        
+        # Display expenses by category
+        self._print_category_table(f"Total Expenses by Category ({target_currency})",
+                                   expenses_by_category, total_expenses, target_currency, "red")
+    
+    def _render_period(self, result: tuple, target_currency: str, summary_title: str,
+                       period_line: str, heading: str, period_tag: str):
+        """
+        Display the summary panel, per-ledger table and category tables for one period
+        
+        Args:
+            result: Tuple returned by StatisticsService.aggregate_by_year/aggregate_by_month
+            target_currency: Display currency code
+            summary_title: Title of the summary panel
+            period_line: Last line of the summary panel (e.g. "Year: 2025")
+            heading: Period name used in the per-ledger heading (e.g. "Year 2025")
+            period_tag: Period name appended to table titles (e.g. "2025")
+        """
+        (total_income, total_expenses, income_by_category, expenses_by_category,
+         ledger_summaries) = result
+        total_balance = round(total_income - total_expenses, 2)
         
         # Display total summary
         summary_text = f"""
 Total Income: {target_currency} {total_income:.2f}
 Total Expenses: {target_currency} {total_expenses:.2f}
 Total Balance (Surplus): {target_currency} {total_balance:.2f}
-Month: {month_name} {year}
+{period_line}
         """
         balance_color = "green" if total_balance >= 0 else "red"
-        panel = Panel(summary_text.strip(), title="Monthly Financial Summary", border_style=balance_color, box=box.ROUNDED)
+        panel = Panel(summary_text.strip(), title=summary_title, border_style=balance_color, box=box.ROUNDED)
         self.console.print(panel)
         self.console.print()
         
         # Display summary by ledger
-        self.console.print(f"\n[bold]{month_name} {year} Summary by Ledger ({target_currency}):[/bold]\n")
-        summary_table = Table(title=f"Financial Summary by Ledger - {month_name} {year}", box=box.ROUNDED, show_header=True)
+        self.console.print(f"\n[bold]{heading} Summary by Ledger ({target_currency}):[/bold]\n")
+        summary_table = Table(title=f"Financial Summary by Ledger - {period_tag}", box=box.ROUNDED, show_header=True)
         summary_table.add_column("Ledger", style="cyan", width=20)
         summary_table.add_column("Original Currency", style="yellow", width=15)
         summary_table.add_column("Total Income", style="green", justify="right", width=18)
         summary_table.add_column("Total Expenses", style="red", justify="right", width=18)
         summary_table.add_column("Balance", style="magenta", justify="right", width=18)
         
-        for summary in ledger_summaries:
-            ledger = summary['ledger']
-            income = summary['income']
-            expenses = summary['expenses']
-            balance = summary['balance']
-            
-            balance_color = "green" if balance >= 0 else "red"
-            summary_table.add_row(
-                ledger.ledger_name,
-                ledger.currency,
-                f"{target_currency} {income:.2f}",
-                f"{target_currency} {expenses:.2f}",
-                f"[{balance_color}]{target_currency} {balance:.2f}[/{balance_color}]"
-            )
+        for row in self._ledger_rows(ledger_summaries, target_currency):
+            summary_table.add_row(*row)
         
         self.console.print(summary_table)
         self.console.print()
         
-        # Display income by category
-        if income_by_category:
-            income_cat_table = Table(title=f"Income by Category - {month_name} {year} ({target_currency})", box=box.ROUNDED, show_header=True)
-            income_cat_table.add_column("Category", style="yellow", width=20)
-            income_cat_table.add_column("Total Amount", style="green", justify="right", width=18)
-            income_cat_table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(income_by_category.items(), key=lambda x: x[1], reverse=True)
-            
-            for category, amount in sorted_categories:
-                percentage = (amount / total_income * 100) if total_income > 0 else 0
-                income_cat_table.add_row(
-                    category.title(),
-                    f"{target_currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
-            
-            self.console.print(income_cat_table)
-            self.console.print()
-        
-        # Display expenses by category
-        if expenses_by_category:
-            expense_cat_table = Table(title=f"Expenses by Category - {month_name} {year} ({target_currency})", box=box.ROUNDED, show_header=True)
-            expense_cat_table.add_column("Category", style="yellow", width=20)
-            expense_cat_table.add_column("Total Amount", style="red", justify="right", width=18)
-            expense_cat_table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(expenses_by_category.items(), key=lambda x: x[1], reverse=True)
-            
-            for category, amount in sorted_categories:
-                percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
-                expense_cat_table.add_row(
-                    category.title(),
-                    f"{target_currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
-            
-            self.console.print(expense_cat_table)
-            self.console.print()
+        # Display income and expenses by category
+        self._print_category_table(f"Income by Category - {period_tag} ({target_currency})",
+                                   income_by_category, total_income, target_currency, "green")
+        self._print_category_table(f"Expenses by Category - {period_tag} ({target_currency})",
+                                   expenses_by_category, total_expenses, target_currency, "red")
     
-    def display_total_summary(self):
-        """Display total summary across all ledgers with currency conversion"""
-        self.console.print("\n[bold blue]========== Total Summary ==========[/bold blue]\n")
-        
-        # Get currency selection
-        supported_currencies = self.currency_service.get_supported_currencies()
-        
-        self.console.print("[bold]Select display currency:[/bold]")
-        currency_map = {}
-        for idx, curr in enumerate(supported_currencies, 1):
-            currency_map[str(idx)] = curr
-            self.console.print(f"[cyan]{idx}.[/cyan] {curr}")
-        
-        while True:
-            try:
-                choice = input(f"\nSelect currency (1-{len(supported_currencies)}): ").strip()
-                if choice in currency_map:
-                    target_currency = currency_map[choice]
-                    break
-                else:
-                    self.console.print(f"[red]Invalid choice! Please enter 1-{len(supported_currencies)}.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
-        
-        # Get all ledgers for the user
-        ledgers = self.ledger_service.list_user_ledgers(self.username)
+    def _print_category_table(self, title: str, by_category: dict, total: float,
+                              target_currency: str, amount_style: str):
+        """
+        Display a category breakdown table (nothing is printed when there are no categories)
         
-        if not ledgers:
-            self.console.print("\n[yellow]No ledgers found.[/yellow]\n")
+        Args:
+            title: Table title
+            by_category: Dictionary mapping category to amount
+            total: Total amount the percentages are relative to
+            target_currency: Display currency code
+            amount_style: Style of the amount column
+        """
+        if not by_category:
             return
         
-        # Calculate totals across all ledgers (convert to target currency)
-        total_income = 0.0
-        total_expenses = 0.0
-        expenses_by_category = {}
+        table = Table(title=title, box=box.ROUNDED, show_header=True)
+        table.add_column("Category", style="yellow", width=20)
+        table.add_column("Total Amount", style=amount_style, justify="right", width=18)
+        table.add_column("Percentage", style="cyan", justify="right", width=12)
         
-        for ledger in ledgers:
-            # Get all expenses and income
-            expenses = self.ledger_service.get_expenses(ledger)
-            income = self.ledger_service.get_income(ledger)
-            
-            # Convert and sum expenses
-            for expense in expenses:
-                try:
-                    amount = float(expense['amount'])
-                    # Convert to target currency
-                    converted_amount = self.currency_service.convert(amount, ledger.currency, target_currency)
-                    total_expenses += converted_amount
-                    
-                    # Aggregate by category
-                    category = expense['category']
-                    if category in expenses_by_category:
-                        expenses_by_category[category] += converted_amount
-                    else:
-                        expenses_by_category[category] = converted_amount
-                except (ValueError, KeyError):
-                    continue
-            
-            # Convert and sum income
-            for inc in income:
-                try:
-                    amount = float(inc['amount'])
-                    # Convert to target currency
-                    converted_amount = self.currency_service.convert(amount, ledger.currency, target_currency)
-                    total_income += converted_amount
-                except (ValueError, KeyError):
-                    continue
-        
-        total_income = round(total_income, 2)
-        total_expenses = round(total_expenses, 2)
-        balance = round(total_income - total_expenses, 2)
+        # Rows come sorted by amount descending
+        for row in self._category_rows(by_category, total, target_currency):
+            table.add_row(*row)
         
-        # Round category totals
-        for category in expenses_by_category:
-            expenses_by_category[category] = round(expenses_by_category[category], 2)
-        
-        # Display total summary
-        summary_text = f"""
-Total Income: {target_currency} {total_income:.2f}
-Total Expenses: {target_currency} {total_expenses:.2f}
-Balance (Surplus): {target_currency} {balance:.2f}
-        """
-        balance_color = "green" if balance >= 0 else "red"
-        panel = Panel(summary_text.strip(), title="Total Financial Summary", border_style=balance_color, box=box.ROUNDED)
-        self.console.print(panel)
+        self.console.print(table)
         self.console.print()
-        
-        # Display expenses by category
-        if expenses_by_category:
-            expense_cat_table = Table(title=f"Total Expenses by Category ({target_currency})", box=box.ROUNDED, show_header=True)
-            expense_cat_table.add_column("Category", style="yellow", width=20)
-            expense_cat_table.add_column("Total Amount", style="red", justify="right", width=18)
-            expense_cat_table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(expenses_by_category.items(), key=lambda x: x[1], reverse=True)
-            
-            for category, amount in sorted_categories:
-                percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
-                expense_cat_table.add_row(
-                    category.title(),
-                    f"{target_currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
-            
-            self.console.print(expense_cat_table)
-            self.console.print()
-
@@ -6,14 +6,70 @@ Author: Rickey
 Date: 2025.10.21
 """
 
-from rich.console import Console
+import re
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich import box
-from datetime import datetime
+from datetime import date, datetime
+from functools import cached_property, lru_cache
+from math import fsum, isfinite
+from operator import itemgetter
 from control.ledger_service import LedgerService
 from control.statistics_service import StatisticsService
 from model.ledger import Ledger
+from visual._prompts import parse_int
+
+
+# Plain unsigned decimal amount (rejects exponents, inf and nan before float() is called)
+_AMOUNT_RE = re.compile(r'(?:\d+(?:\.\d*)?|\.\d+)')
+
+# Largest accepted amount; keeps the integer-cent totals well inside int64
+_MAX_AMOUNT = 1e12
+
+# Month names indexed by month number (index 0 unused)
+_MONTH_NAMES = ('', 'January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+
+_LEDGER_MENU_TEXT = """
+[bold]Ledger Menu:[/bold]
+[cyan]1.[/cyan] Add Expense
+[cyan]2.[/cyan] Add Income
+[cyan]3.[/cyan] View Expenses
+[cyan]4.[/cyan] View Income
+[cyan]5.[/cyan] Back to Main Menu
+"""
+
+_ACTION_MENU_TEXT = """
+[bold]Action:[/bold]
+[cyan]1.[/cyan] Edit
+[cyan]2.[/cyan] Delete
+[cyan]3.[/cyan] Cancel"""
+_ACTION_CHOICES = {'1': '1', '2': '2', '3': '3'}
+
+# Footer label for total rows, built once instead of parsing markup on every table
+_TOTAL_LABEL = Text("Total", style="bold")
+
+# Categories come from small closed sets, so their title-cased form is cached
+_title = lru_cache(maxsize=512)(str.title)
+
+
+def _choose(options: tuple, text: str):
+    """
+    Look up a 1-based menu choice
+    
+    Args:
+        options: Menu options in display order
+        text: Stripped user input
+        
+    Returns:
+        The chosen option, or None if the input is not a listed number
+    """
+    index = parse_int(text)
+    if index is not None and 0 < index <= len(options):
+        return options[index - 1]
+    return None
 
 
 class TransactionView:
@@ -46,18 +102,45 @@ class TransactionView:
         "other"
     ]
     
-    def __init__(self, ledger: Ledger):
+    # (title, categories) -> selection table, built on first use
+    _CATEGORY_MENUS = {}
+    
+    # Listings longer than this are printed as plain text instead of a Rich table
+    COMPACT_ROW_LIMIT = 200
+    # Plain-text listings are printed in pages of this many lines
+    PAGE_SIZE = 500
+    
+    def __init__(self, ledger: Ledger, console: Console = None,
+                 ledger_service: LedgerService = None, statistics_service: StatisticsService = None):
         """
         Initialize TransactionView
         
         Args:
             ledger: Current selected ledger
+            console: Console to print to (a new one if omitted)
+            ledger_service: LedgerService to use (the shared instance if omitted)
+            statistics_service: StatisticsService to use (the shared instance if omitted)
         """
-        self.console = Console()
-        self.ledger_service = LedgerService()
-        self.statistics_service = StatisticsService()
+        if console is not None:
+            self.console = console  # Otherwise created by the console property on first print
+        # Shared services keep their parsed-record and totals caches across views
+        self.ledger_service = ledger_service or LedgerService.instance()
+        if statistics_service is None:
+            # A caller-supplied LedgerService gets its own StatisticsService built on it
+            statistics_service = StatisticsService.instance() if ledger_service is None else StatisticsService(ledger_service)
+        self.statistics_service = statistics_service
         self.ledger = ledger
     
+    @cached_property
+    def console(self) -> Console:
+        """Console for this view, created on first use when none was passed in"""
+        return Console()
+    
+    @cached_property
+    def _menu(self) -> Text:
+        """Ledger menu parsed once per view; keeps the console's number highlighting"""
+        return self.console.render_str(_LEDGER_MENU_TEXT)
+    
     def display_ledger_menu(self):
         """Display ledger-specific menu"""
         mode = f"User: {self.ledger.username}" if self.ledger.username else "Guest"
@@ -68,16 +151,10 @@ Currency: {self.ledger.currency}
 Mode: {mode}
         """
         
-        self.console.print(Panel(panel_text, title="Current Ledger", border_style="cyan"))
-        self.console.print("\n[bold]Ledger Menu:[/bold]")
-        self.console.print("[cyan]1.[/cyan] Add Expense")
-        self.console.print("[cyan]2.[/cyan] Add Income")
-        self.console.print("[cyan]3.[/cyan] View Expenses")
-        self.console.print("[cyan]4.[/cyan] View Income")
-        self.console.print("[cyan]5.[/cyan] Back to Main Menu")
-        self.console.print()
+        # Panel and menu are rendered in a single print
+        self.console.print(Group(Panel(panel_text, title="Current Ledger", border_style="cyan"), self._menu))
     
-    def display_category_menu(self, categories: list, title: str) -> dict:
+    def display_category_menu(self, categories: list, title: str) -> tuple:
         """
         Display category selection menu
         
@@ -86,23 +163,26 @@ Mode: {mode}
             title: Menu title
             
         Returns:
-            Dictionary mapping choice number to category name
+            Category names in choice order (choice n is index n - 1)
         """
-        category_map = {}
-        
-        table = Table(title=title, box=box.ROUNDED, show_header=True)
-        table.add_column("Choice", style="cyan", width=10)
-        table.add_column("Category", style="yellow")
-        
-        for idx, category in enumerate(categories, 1):
-            table.add_row(str(idx), category.title())
-            category_map[str(idx)] = category
+        # Category lists are fixed, so each menu's table is built once per process
+        options = tuple(categories)
+        key = (title, options)
+        table = TransactionView._CATEGORY_MENUS.get(key)
+        if table is None:
+            table = Table(title=title, box=box.ROUNDED, show_header=True)
+            table.add_column("Choice", style="cyan", width=10)
+            table.add_column("Category", style="yellow")
+            
+            for idx, category in enumerate(categories, 1):
+                table.add_row(str(idx), _title(category))
+            
+            TransactionView._CATEGORY_MENUS[key] = table
         
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print()
+        # One print call for the spacing and table
+        self.console.print("\n", table, "")
         
-        return category_map
+        return options
     
     def validate_date(self, date_str: str) -> tuple:
         """
@@ -114,19 +194,34 @@ Mode: {mode}
         Returns:
             Tuple (is_valid: bool, iso_date: str or None)
         """
+        # Fast path: fixed-width DD/MM/YYYY or YYYY-MM-DD, parsed by slicing
+        if len(date_str) == 10:
+            if date_str[2] == '/' and date_str[5] == '/':
+                day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+            elif date_str[4] == '-' and date_str[7] == '-':
+                year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+            else:
+                year = month = day = ''
+            if (year + month + day).isdecimal():
+                try:
+                    # date() rejects out-of-range days and months, including Feb 29 in non-leap years
+                    date_obj = date(int(year), int(month), int(day))
+                except ValueError:
+                    return (False, None)
+                return (True, date_obj.isoformat())
+        
+        # Non-padded forms (e.g. 5/3/2025) still go through strptime
         try:
             # Parse DD/MM/YYYY format
             date_obj = datetime.strptime(date_str, "%d/%m/%Y")
-            # Convert to ISO format (YYYY-MM-DD) for storage
-            iso_date = date_obj.strftime("%Y-%m-%d")
-            return (True, iso_date)
         except ValueError:
             try:
                 # Also accept YYYY-MM-DD format for backward compatibility
                 date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                return (True, date_str)
             except ValueError:
                 return (False, None)
+        # Always return zero-padded ISO format (YYYY-MM-DD); strftime does not pad years below 1000
+        return (True, date_obj.date().isoformat())
     
     def validate_amount(self, amount_str: str) -> float:
         """
@@ -138,13 +233,13 @@ Mode: {mode}
         Returns:
             Float amount if valid, None otherwise
         """
-        try:
-            amount = float(amount_str)
-            if amount <= 0:
-                return None
-            return amount
-        except ValueError:
+        if not _AMOUNT_RE.fullmatch(amount_str):
             return None
+        # Very long digit strings still overflow float() to inf
+        amount = float(amount_str)
+        if not (isfinite(amount) and 0 < amount <= _MAX_AMOUNT):
+            return None
+        return amount
     
     def get_expense_input(self) -> dict:
         """
@@ -153,51 +248,56 @@ Mode: {mode}
         Returns:
             Dictionary with expense data or None if cancelled
         """
-        self.console.print("\n[bold blue]========== Add Expense ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        validate_date = self.validate_date
+        validate_amount = self.validate_amount
+        
+        echo("\n[bold blue]========== Add Expense ==========[/bold blue]\n")
         
         # Get date - loop until valid
         while True:
             try:
                 date_input = input("Enter date (DD/MM/YYYY): ").strip()
-                is_valid, date = self.validate_date(date_input)
+                is_valid, date = validate_date(date_input)
                 if is_valid:
                     break
                 else:
-                    self.console.print("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
+                    echo("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
+                echo("\n[yellow]Cancelled.[/yellow]")
                 return None
         
         # Get amount - loop until valid
         while True:
             try:
                 amount_str = input("Enter amount: ").strip()
-                amount = self.validate_amount(amount_str)
+                amount = validate_amount(amount_str)
                 if amount is not None:
                     break
                 else:
-                    self.console.print("[red]Invalid amount! Please enter a positive number.[/red]")
+                    echo("[red]Invalid amount! Please enter a positive number.[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
+                echo("\n[yellow]Cancelled.[/yellow]")
                 return None
         
         # Display category menu
-        category_map = self.display_category_menu(self.EXPENSE_CATEGORIES, "Select Expense Category")
+        category_options = self.display_category_menu(self.EXPENSE_CATEGORIES, "Select Expense Category")
         
         # Get category choice - loop until valid
         category = None
         while True:
             try:
-                choice = input(f"Select category (1-{len(category_map)}): ").strip()
+                choice = input(f"Select category (1-{len(category_options)}): ").strip()
                 
-                if choice in category_map:
-                    category = category_map[choice]
+                category = _choose(category_options, choice)
+                if category is not None:
                     break
                 else:
-                    self.console.print("[red]Invalid category choice! Please select a valid option.[/red]")
+                    echo("[red]Invalid category choice! Please select a valid option.[/red]")
                     
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
+                echo("\n[yellow]Cancelled.[/yellow]")
                 return None
         
         # Get description (optional)
@@ -221,51 +321,56 @@ Mode: {mode}
         Returns:
             Dictionary with income data or None if cancelled
         """
-        self.console.print("\n[bold blue]========== Add Income ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        validate_date = self.validate_date
+        validate_amount = self.validate_amount
+        
+        echo("\n[bold blue]========== Add Income ==========[/bold blue]\n")
         
         # Get date - loop until valid
         while True:
             try:
                 date_input = input("Enter date (DD/MM/YYYY): ").strip()
-                is_valid, date = self.validate_date(date_input)
+                is_valid, date = validate_date(date_input)
                 if is_valid:
                     break
                 else:
-                    self.console.print("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
+                    echo("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
+                echo("\n[yellow]Cancelled.[/yellow]")
                 return None
         
         # Get amount - loop until valid
         while True:
             try:
                 amount_str = input("Enter amount: ").strip()
-                amount = self.validate_amount(amount_str)
+                amount = validate_amount(amount_str)
                 if amount is not None:
                     break
                 else:
-                    self.console.print("[red]Invalid amount! Please enter a positive number.[/red]")
+                    echo("[red]Invalid amount! Please enter a positive number.[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
+                echo("\n[yellow]Cancelled.[/yellow]")
                 return None
         
         # Display category menu
-        category_map = self.display_category_menu(self.INCOME_CATEGORIES, "Select Income Category")
+        category_options = self.display_category_menu(self.INCOME_CATEGORIES, "Select Income Category")
         
         # Get category choice - loop until valid
         category = None
         while True:
             try:
-                choice = input(f"Select category (1-{len(category_map)}): ").strip()
+                choice = input(f"Select category (1-{len(category_options)}): ").strip()
                 
-                if choice in category_map:
-                    category = category_map[choice]
+                category = _choose(category_options, choice)
+                if category is not None:
                     break
                 else:
-                    self.console.print("[red]Invalid category choice! Please select a valid option.[/red]")
+                    echo("[red]Invalid category choice! Please select a valid option.[/red]")
                     
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
+                echo("\n[yellow]Cancelled.[/yellow]")
                 return None
         
         # Get description (optional)
@@ -306,9 +411,12 @@ Mode: {mode}
             if success:
                 currency = self.ledger.currency
                 # Convert ISO date back to DD/MM/YYYY for display
-                display_date = datetime.strptime(transaction_data['date'], "%Y-%m-%d").strftime("%d/%m/%Y")
-                self.console.print(f"\n[bold green]Expense added successfully![/bold green]")
-                self.console.print(f"[dim]{currency} {transaction_data['amount']:.2f} - {transaction_data['category']} on {display_date}[/dim]\n")
+                iso_date = transaction_data['date']
+                display_date = f"{iso_date[8:10]}/{iso_date[5:7]}/{iso_date[0:4]}"
+                self.console.print(
+                    f"\n[bold green]Expense added successfully![/bold green]\n"
+                    f"[dim]{currency} {transaction_data['amount']:.2f} - {transaction_data['category']} on {display_date}[/dim]\n"
+                )
             else:
                 self.console.print("\n[bold red]Failed to add expense![/bold red]\n")
             
@@ -342,9 +450,12 @@ Mode: {mode}
             if success:
                 currency = self.ledger.currency
                 # Convert ISO date back to DD/MM/YYYY for display
-                display_date = datetime.strptime(transaction_data['date'], "%Y-%m-%d").strftime("%d/%m/%Y")
-                self.console.print(f"\n[bold green]Income added successfully![/bold green]")
-                self.console.print(f"[dim]{currency} {transaction_data['amount']:.2f} - {transaction_data['category']} on {display_date}[/dim]\n")
+                iso_date = transaction_data['date']
+                display_date = f"{iso_date[8:10]}/{iso_date[5:7]}/{iso_date[0:4]}"
+                self.console.print(
+                    f"\n[bold green]Income added successfully![/bold green]\n"
+                    f"[dim]{currency} {transaction_data['amount']:.2f} - {transaction_data['category']} on {display_date}[/dim]\n"
+                )
             else:
                 self.console.print("\n[bold red]Failed to add income![/bold red]\n")
             
@@ -379,6 +490,14 @@ Mode: {mode}
             self.console.print("\n[yellow]No expenses found.[/yellow]\n")
             return expenses
         
+        currency = self.ledger.currency
+        prefix = f"{currency} "
+        
+        # Very long listings skip the Rich table layout and are streamed as plain text pages
+        if len(expenses) > self.COMPACT_ROW_LIMIT:
+            self._print_plain_rows(f"All Expenses - {self.ledger.ledger_name}", expenses, prefix, show_index)
+            return expenses
+        
         table = Table(title=f"All Expenses - {self.ledger.ledger_name}", box=box.ROUNDED, show_header=True)
         if show_index:
             table.add_column("#", style="cyan", width=5)
@@ -387,40 +506,19 @@ Mode: {mode}
         table.add_column("Category", style="yellow", width=15)
         table.add_column("Description", style="white")
         
-        currency = self.ledger.currency
-        
-        for idx, expense in enumerate(expenses):
-            # Reconstruct date from year, month, day
-            try:
-                year = expense.get('year', '')
-                month = expense.get('month', '')
-                day = expense.get('day', '')
-                display_date = f"{day}/{month}/{year}" if all([year, month, day]) else "N/A"
-            except:
-                display_date = "N/A"
-            
-            amount_str = f"{currency} {float(expense['amount']):.2f}"
-            row_data = []
-            if show_index:
-                row_data.append(str(idx + 1))
-            row_data.extend([
-                display_date,
-                amount_str,
-                expense['category'].title(),
-                expense.get('description', '')
-            ])
+        # Rows and total are built in one pass, each amount is parsed once
+        # (user-entered cells are passed as Text, so they are shown verbatim and never parsed for markup)
+        total = 0.0
+        for row_data, amount in self._listing_rows(expenses, prefix, show_index, True):
+            total += amount
             table.add_row(*row_data)
-        
-        # Calculate total
-        total = sum(float(exp['amount']) for exp in expenses)
         if show_index:
-            table.add_row("", "", "", "[bold]Total[/bold]", f"[bold red]{currency} {total:.2f}[/bold red]")
+            table.add_row("", "", "", _TOTAL_LABEL, Text(f"{currency} {total:.2f}", style="bold red"))
         else:
-            table.add_row("", "", "[bold]Total[/bold]", f"[bold red]{currency} {total:.2f}[/bold red]")
+            table.add_row("", "", _TOTAL_LABEL, Text(f"{currency} {total:.2f}", style="bold red"))
         
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print("\n")
+        # Spacing and table go out in a single render pass
+        self.console.print("\n", table, "\n")
         
         return expenses
     
@@ -449,6 +547,14 @@ Mode: {mode}
             self.console.print("\n[yellow]No income found.[/yellow]\n")
             return income
         
+        currency = self.ledger.currency
+        prefix = f"{currency} "
+        
+        # Very long listings skip the Rich table layout and are streamed as plain text pages
+        if len(income) > self.COMPACT_ROW_LIMIT:
+            self._print_plain_rows(f"All Income - {self.ledger.ledger_name}", income, prefix, show_index)
+            return income
+        
         table = Table(title=f"All Income - {self.ledger.ledger_name}", box=box.ROUNDED, show_header=True)
         if show_index:
             table.add_column("#", style="cyan", width=5)
@@ -457,67 +563,179 @@ Mode: {mode}
         table.add_column("Category", style="yellow", width=15)
         table.add_column("Description", style="white")
         
-        currency = self.ledger.currency
+        # Rows and total are built in one pass, each amount is parsed once
+        # (user-entered cells are passed as Text, so they are shown verbatim and never parsed for markup)
+        total = 0.0
+        for row_data, amount in self._listing_rows(income, prefix, show_index, True):
+            total += amount
+            table.add_row(*row_data)
+        if show_index:
+            table.add_row("", "", "", _TOTAL_LABEL, Text(f"{currency} {total:.2f}", style="bold green"))
+        else:
+            table.add_row("", "", _TOTAL_LABEL, Text(f"{currency} {total:.2f}", style="bold green"))
+        
+        # Spacing and table go out in a single render pass
+        self.console.print("\n", table, "\n")
+        
+        return income
+    
+    def _listing_rows(self, records: list, prefix: str, show_index: bool, verbatim: bool = False):
+        """
+        Build the cells of the all-expenses/all-income listing one record at a time
         
-        for idx, inc in enumerate(income):
+        Args:
+            records: Record dictionaries from LedgerService
+            prefix: Currency prefix for amounts (e.g. "AUD ")
+            show_index: Whether rows start with an index number
+            verbatim: Wrap category and description in Text so Rich does not parse them as markup
+            
+        Yields:
+            Tuple (row cell list, amount) for each record
+        """
+        for idx, record in enumerate(records):
             # Reconstruct date from year, month, day
-            try:
-                year = inc.get('year', '')
-                month = inc.get('month', '')
-                day = inc.get('day', '')
-                display_date = f"{day}/{month}/{year}" if all([year, month, day]) else "N/A"
-            except:
-                display_date = "N/A"
+            year = record.get('year', '')
+            month = record.get('month', '')
+            day = record.get('day', '')
+            display_date = f"{day}/{month}/{year}" if year and month and day else "N/A"
             
-            amount_str = f"{currency} {float(inc['amount']):.2f}"
+            amount = float(record['amount'])
             row_data = []
             if show_index:
                 row_data.append(str(idx + 1))
+            category = _title(record['category'])
+            description = record.get('description', '')
+            if verbatim:
+                category = Text(category)
+                description = Text(description or '')
             row_data.extend([
                 display_date,
-                amount_str,
-                inc['category'].title(),
-                inc.get('description', '')
+                prefix + format(amount, '.2f'),
+                category,
+                description
             ])
-            table.add_row(*row_data)
+            yield row_data, amount
+    
+    def _print_plain_rows(self, title: str, records: list, prefix: str, show_index: bool):
+        """
+        Print a long transaction listing as plain aligned text, one page of lines at a time
         
-        # Calculate total
-        total = sum(float(inc['amount']) for inc in income)
-        if show_index:
-            table.add_row("", "", "", "[bold]Total[/bold]", f"[bold green]{currency} {total:.2f}[/bold green]")
-        else:
-            table.add_row("", "", "[bold]Total[/bold]", f"[bold green]{currency} {total:.2f}[/bold green]")
+        Args:
+            title: Listing title
+            records: Record dictionaries from LedgerService
+            prefix: Currency prefix for amounts (e.g. "AUD ")
+            show_index: Whether rows start with an index number
+        """
+        # Pages are printed as they fill, so the total and the widest amount are worked out first
+        amounts = [float(record['amount']) for record in records]
+        total = fsum(amounts)
+        amount_width = max(15, *(len(prefix) + len(format(value, '.2f')) for value in (min(amounts), max(amounts), total)))
+        index_width = len(str(len(records))) if show_index else 0
+        
+        def line(index, date, amount, category, description):
+            index_cell = f"{index:>{index_width}}  " if show_index else ""
+            return f"{index_cell}{date:<12}{amount:>{amount_width}}  {category:<15}{description or ''}".rstrip()
+        
+        header = line("#", "Date", "Amount", "Category", "Description")
+        separator = "-" * len(header)
+        # Blank lines before the title match the spacing of the table view
+        lines = ["\n", title, header, separator]
+        
+        for row_data, _ in self._listing_rows(records, prefix, show_index):
+            lines.append(line(*row_data) if show_index else line("", *row_data))
+            # Flush each full page, so at most PAGE_SIZE lines are held at once
+            if len(lines) >= self.PAGE_SIZE:
+                # Text is not parsed for markup, so descriptions are printed verbatim
+                self.console.print(Text("\n".join(lines)))
+                lines = []
+        
+        lines += [separator, line("", "", f"{prefix}{total:.2f}", "Total", ""), "\n"]
+        self.console.print(Text("\n".join(lines)))
+    
+    def _category_rows(self, by_category: dict, total: float, currency: str) -> list:
+        """
+        Format category rows sorted by amount (descending) with their share of the total
+        
+        Args:
+            by_category: Dictionary mapping category to amount
+            total: Total amount the percentages are relative to
+            currency: Ledger currency code
+            
+        Returns:
+            List of row tuples ready for Table.add_row
+        """
+        ordered = sorted(by_category.items(), key=itemgetter(1), reverse=True)
+        # A zero total (all-zero records) has no meaningful share
+        if total <= 0:
+            return [(Text(_title(category)), f"{currency} {amount:.2f}", "—") for category, amount in ordered]
+        # Division done once; each row is a single multiply
+        scale = 100.0 / total
+        return [
+            (Text(_title(category)), f"{currency} {amount:.2f}", f"{amount * scale:.1f}%")
+            for category, amount in ordered
+        ]
+    
+    def _category_table(self, title: str, amount_style: str) -> Table:
+        """
+        Create the empty by-category summary table shared by the year and month views
         
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print("\n")
+        Args:
+            title: Table title
+            amount_style: Style of the amount column ("red" for expenses, "green" for income)
+            
+        Returns:
+            Table with Category, Amount and Percentage columns
+        """
+        table = Table(title=title, box=box.ROUNDED, show_header=True)
+        table.add_column("Category", style="yellow", width=20)
+        table.add_column("Amount", style=amount_style, justify="right", width=18)
+        table.add_column("Percentage", style="cyan", justify="right", width=12)
+        return table
+    
+    def _date_table(self, title: str, amount_style: str) -> Table:
+        """
+        Create the empty single-day listing table shared by the by-date views
         
-        return income
+        Args:
+            title: Table title
+            amount_style: Style of the amount column ("red" for expenses, "green" for income)
+            
+        Returns:
+            Table with Amount, Category and Description columns
+        """
+        table = Table(title=title, box=box.ROUNDED, show_header=True)
+        table.add_column("Amount", style=amount_style, justify="right", width=18)
+        table.add_column("Category", style="yellow", width=20)
+        table.add_column("Description", style="white")
+        return table
     
     def display_expenses_by_year(self):
         """Display expenses statistics by year"""
-        self.console.print("\n[bold blue]========== View Expenses by Year ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        
+        echo("\n[bold blue]========== View Expenses by Year ==========[/bold blue]\n")
         
         # Get year input
         while True:
             try:
                 year_str = input("Enter year (YYYY): ").strip()
-                year = int(year_str)
-                if 1900 <= year <= 2100:
+                year = parse_int(year_str)
+                if year is None:
+                    echo("[red]Invalid year format! Please enter a number.[/red]")
+                elif 1900 <= year <= 2100:
                     break
                 else:
-                    self.console.print("[red]Please enter a valid year (1900-2100).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid year format! Please enter a number.[/red]")
+                    echo("[red]Please enter a valid year (1900-2100).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get statistics
         stats = self.statistics_service.get_expenses_by_year(self.ledger, year)
         
         if stats['total'] == 0:
-            self.console.print(f"\n[yellow]No expenses found for year {year}.[/yellow]\n")
+            echo(f"\n[yellow]No expenses found for year {year}.[/yellow]\n")
             return
         
         currency = self.ledger.currency
@@ -527,125 +745,108 @@ Mode: {mode}
 Total Expenses: {currency} {stats['total']:.2f}
 Year: {year}
         """
-        self.console.print(Panel(summary_text.strip(), title="Yearly Summary", border_style="red", box=box.ROUNDED))
-        self.console.print()
+        # Summary and category table are collected and printed in one call
+        output = [Panel(summary_text.strip(), title="Yearly Summary", border_style="red", box=box.ROUNDED), ""]
         
         # Display by category
         if stats['by_category']:
-            table = Table(title=f"Expenses by Category - {year}", box=box.ROUNDED, show_header=True)
-            table.add_column("Category", style="yellow", width=20)
-            table.add_column("Amount", style="red", justify="right", width=18)
-            table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(stats['by_category'].items(), key=lambda x: x[1], reverse=True)
+            table = self._category_table(f"Expenses by Category - {year}", "red")
             
-            for category, amount in sorted_categories:
-                percentage = (amount / stats['total']) * 100
-                table.add_row(
-                    category.title(),
-                    f"{currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
+            # Rows are formatted (sorted by amount descending) before any Rich call
+            for row in self._category_rows(stats['by_category'], stats['total'], currency):
+                table.add_row(*row)
             
-            self.console.print(table)
-            self.console.print()
+            output += [table, ""]
+        
+        echo(Group(*output))
     
     def display_expenses_by_month(self):
         """Display expenses statistics by month"""
-        self.console.print("\n[bold blue]========== View Expenses by Month ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        
+        echo("\n[bold blue]========== View Expenses by Month ==========[/bold blue]\n")
         
         # Get year input
         while True:
             try:
                 year_str = input("Enter year (YYYY): ").strip()
-                year = int(year_str)
-                if 1900 <= year <= 2100:
+                year = parse_int(year_str)
+                if year is None:
+                    echo("[red]Invalid year format! Please enter a number.[/red]")
+                elif 1900 <= year <= 2100:
                     break
                 else:
-                    self.console.print("[red]Please enter a valid year (1900-2100).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid year format! Please enter a number.[/red]")
+                    echo("[red]Please enter a valid year (1900-2100).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get month input
         while True:
             try:
                 month_str = input("Enter month (1-12): ").strip()
-                month = int(month_str)
-                if 1 <= month <= 12:
+                month = parse_int(month_str)
+                if month is None:
+                    echo("[red]Invalid month format! Please enter a number.[/red]")
+                elif 1 <= month <= 12:
                     break
                 else:
-                    self.console.print("[red]Please enter a valid month (1-12).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid month format! Please enter a number.[/red]")
+                    echo("[red]Please enter a valid month (1-12).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get statistics
         stats = self.statistics_service.get_expenses_by_month(self.ledger, year, month)
         
         if stats['total'] == 0:
-            month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            self.console.print(f"\n[yellow]No expenses found for {month_names[month]} {year}.[/yellow]\n")
+            echo(f"\n[yellow]No expenses found for {_MONTH_NAMES[month]} {year}.[/yellow]\n")
             return
         
         currency = self.ledger.currency
-        month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
         
         # Display summary
         summary_text = f"""
 Total Expenses: {currency} {stats['total']:.2f}
-Month: {month_names[month]} {year}
+Month: {_MONTH_NAMES[month]} {year}
         """
-        self.console.print(Panel(summary_text.strip(), title="Monthly Summary", border_style="red", box=box.ROUNDED))
-        self.console.print()
+        # Summary and category table are collected and printed in one call
+        output = [Panel(summary_text.strip(), title="Monthly Summary", border_style="red", box=box.ROUNDED), ""]
         
         # Display by category
         if stats['by_category']:
-            table = Table(title=f"Expenses by Category - {month_names[month]} {year}", box=box.ROUNDED, show_header=True)
-            table.add_column("Category", style="yellow", width=20)
-            table.add_column("Amount", style="red", justify="right", width=18)
-            table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(stats['by_category'].items(), key=lambda x: x[1], reverse=True)
+            table = self._category_table(f"Expenses by Category - {_MONTH_NAMES[month]} {year}", "red")
             
-            for category, amount in sorted_categories:
-                percentage = (amount / stats['total']) * 100
-                table.add_row(
-                    category.title(),
-                    f"{currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
+            # Rows are formatted (sorted by amount descending) before any Rich call
+            for row in self._category_rows(stats['by_category'], stats['total'], currency):
+                table.add_row(*row)
             
-            self.console.print(table)
-            self.console.print()
+            output += [table, ""]
+        
+        echo(Group(*output))
     
     def display_expenses_by_date(self):
         """Display expenses for a specific date"""
-        self.console.print("\n[bold blue]========== View Expenses by Date ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        validate_date = self.validate_date
+        
+        echo("\n[bold blue]========== View Expenses by Date ==========[/bold blue]\n")
         
         # Get date input
         while True:
             try:
                 date_input = input("Enter date (DD/MM/YYYY): ").strip()
-                is_valid, iso_date = self.validate_date(date_input)
+                is_valid, iso_date = validate_date(date_input)
                 if is_valid:
-                    date_obj = datetime.strptime(iso_date, "%Y-%m-%d")
-                    year = date_obj.year
-                    month = date_obj.month
-                    day = date_obj.day
+                    # validate_date always returns zero-padded YYYY-MM-DD, so the fields can be sliced
+                    year, month, day = int(iso_date[0:4]), int(iso_date[5:7]), int(iso_date[8:10])
                     break
                 else:
-                    self.console.print("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
+                    echo("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get expenses for that date
@@ -653,57 +854,62 @@ Month: {month_names[month]} {year}
         
         if not expenses:
             display_date = f"{day}/{month}/{year}"
-            self.console.print(f"\n[yellow]No expenses found for {display_date}.[/yellow]\n")
+            echo(f"\n[yellow]No expenses found for {display_date}.[/yellow]\n")
             return
         
         currency = self.ledger.currency
         display_date = f"{day}/{month}/{year}"
+        prefix = f"{currency} "
         
-        table = Table(title=f"Expenses for {display_date}", box=box.ROUNDED, show_header=True)
-        table.add_column("Amount", style="red", justify="right", width=18)
-        table.add_column("Category", style="yellow", width=20)
-        table.add_column("Description", style="white")
+        # Very long results are streamed as plain text pages like the full listings
+        if len(expenses) > self.COMPACT_ROW_LIMIT:
+            self._print_plain_rows(f"Expenses for {display_date}", expenses, prefix, False)
+            return
         
-        total = 0.0
-        for expense in expenses:
-            amount = float(expense['amount'])
-            total += amount
+        table = self._date_table(f"Expenses for {display_date}", "red")
+        
+        # Amounts are parsed once; the total is a single exactly-rounded sum outside the row loop
+        amounts = [float(expense['amount']) for expense in expenses]
+        total = fsum(amounts)
+        for amount, expense in zip(amounts, expenses):
             table.add_row(
-                f"{currency} {amount:.2f}",
-                expense['category'].title(),
-                expense.get('description', '')
+                prefix + format(amount, '.2f'),
+                Text(_title(expense['category'])),
+                Text(expense.get('description') or '')
             )
         
-        table.add_row(f"[bold red]{currency} {total:.2f}[/bold red]", "[bold]Total[/bold]", "")
+        table.add_row(Text(f"{currency} {total:.2f}", style="bold red"), _TOTAL_LABEL, "")
         
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print()
+        # Spacing and table go out in a single render pass
+        echo("\n", table, "")
     
     def display_income_by_year(self):
         """Display income statistics by year"""
-        self.console.print("\n[bold blue]========== View Income by Year ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        
+        echo("\n[bold blue]========== View Income by Year ==========[/bold blue]\n")
         
         # Get year input
         while True:
             try:
                 year_str = input("Enter year (YYYY): ").strip()
-                year = int(year_str)
-                if 1900 <= year <= 2100:
+                year = parse_int(year_str)
+                if year is None:
+                    echo("[red]Invalid year format! Please enter a number.[/red]")
+                elif 1900 <= year <= 2100:
                     break
                 else:
-                    self.console.print("[red]Please enter a valid year (1900-2100).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid year format! Please enter a number.[/red]")
+                    echo("[red]Please enter a valid year (1900-2100).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get statistics
         stats = self.statistics_service.get_income_by_year(self.ledger, year)
         
         if stats['total'] == 0:
-            self.console.print(f"\n[yellow]No income found for year {year}.[/yellow]\n")
+            echo(f"\n[yellow]No income found for year {year}.[/yellow]\n")
             return
         
         currency = self.ledger.currency
@@ -713,125 +919,108 @@ Month: {month_names[month]} {year}
 Total Income: {currency} {stats['total']:.2f}
 Year: {year}
         """
-        self.console.print(Panel(summary_text.strip(), title="Yearly Summary", border_style="green", box=box.ROUNDED))
-        self.console.print()
+        # Summary and category table are collected and printed in one call
+        output = [Panel(summary_text.strip(), title="Yearly Summary", border_style="green", box=box.ROUNDED), ""]
         
         # Display by category
         if stats['by_category']:
-            table = Table(title=f"Income by Category - {year}", box=box.ROUNDED, show_header=True)
-            table.add_column("Category", style="yellow", width=20)
-            table.add_column("Amount", style="green", justify="right", width=18)
-            table.add_column("Percentage", style="cyan", justify="right", width=12)
-            
-            # Sort by amount descending
-            sorted_categories = sorted(stats['by_category'].items(), key=lambda x: x[1], reverse=True)
+            table = self._category_table(f"Income by Category - {year}", "green")
             
-            for category, amount in sorted_categories:
-                percentage = (amount / stats['total']) * 100
-                table.add_row(
-                    category.title(),
-                    f"{currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
+            # Rows are formatted (sorted by amount descending) before any Rich call
+            for row in self._category_rows(stats['by_category'], stats['total'], currency):
+                table.add_row(*row)
             
-            self.console.print(table)
-            self.console.print()
+            output += [table, ""]
+        
+        echo(Group(*output))
     
     def display_income_by_month(self):
         """Display income statistics by month"""
-        self.console.print("\n[bold blue]========== View Income by Month ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        
+        echo("\n[bold blue]========== View Income by Month ==========[/bold blue]\n")
         
         # Get year input
         while True:
             try:
                 year_str = input("Enter year (YYYY): ").strip()
-                year = int(year_str)
-                if 1900 <= year <= 2100:
+                year = parse_int(year_str)
+                if year is None:
+                    echo("[red]Invalid year format! Please enter a number.[/red]")
+                elif 1900 <= year <= 2100:
                     break
                 else:
-                    self.console.print("[red]Please enter a valid year (1900-2100).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid year format! Please enter a number.[/red]")
+                    echo("[red]Please enter a valid year (1900-2100).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get month input
         while True:
             try:
                 month_str = input("Enter month (1-12): ").strip()
-                month = int(month_str)
-                if 1 <= month <= 12:
+                month = parse_int(month_str)
+                if month is None:
+                    echo("[red]Invalid month format! Please enter a number.[/red]")
+                elif 1 <= month <= 12:
                     break
                 else:
-                    self.console.print("[red]Please enter a valid month (1-12).[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid month format! Please enter a number.[/red]")
+                    echo("[red]Please enter a valid month (1-12).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get statistics
         stats = self.statistics_service.get_income_by_month(self.ledger, year, month)
         
         if stats['total'] == 0:
-            month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            self.console.print(f"\n[yellow]No income found for {month_names[month]} {year}.[/yellow]\n")
+            echo(f"\n[yellow]No income found for {_MONTH_NAMES[month]} {year}.[/yellow]\n")
             return
         
         currency = self.ledger.currency
-        month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
         
         # Display summary
         summary_text = f"""
 Total Income: {currency} {stats['total']:.2f}
-Month: {month_names[month]} {year}
+Month: {_MONTH_NAMES[month]} {year}
         """
-        self.console.print(Panel(summary_text.strip(), title="Monthly Summary", border_style="green", box=box.ROUNDED))
-        self.console.print()
+        # Summary and category table are collected and printed in one call
+        output = [Panel(summary_text.strip(), title="Monthly Summary", border_style="green", box=box.ROUNDED), ""]
         
         # Display by category
         if stats['by_category']:
-            table = Table(title=f"Income by Category - {month_names[month]} {year}", box=box.ROUNDED, show_header=True)
-            table.add_column("Category", style="yellow", width=20)
-            table.add_column("Amount", style="green", justify="right", width=18)
-            table.add_column("Percentage", style="cyan", justify="right", width=12)
+            table = self._category_table(f"Income by Category - {_MONTH_NAMES[month]} {year}", "green")
             
-            # Sort by amount descending
-            sorted_categories = sorted(stats['by_category'].items(), key=lambda x: x[1], reverse=True)
-            
-            for category, amount in sorted_categories:
-                percentage = (amount / stats['total']) * 100
-                table.add_row(
-                    category.title(),
-                    f"{currency} {amount:.2f}",
-                    f"{percentage:.1f}%"
-                )
+            # Rows are formatted (sorted by amount descending) before any Rich call
+            for row in self._category_rows(stats['by_category'], stats['total'], currency):
+                table.add_row(*row)
             
-            self.console.print(table)
-            self.console.print()
+            output += [table, ""]
+        
+        echo(Group(*output))
     
     def display_income_by_date(self):
         """Display income for a specific date"""
-        self.console.print("\n[bold blue]========== View Income by Date ==========[/bold blue]\n")
+        # Bound once; the retry loops below look these up on every attempt
+        echo = self.console.print
+        validate_date = self.validate_date
+        
+        echo("\n[bold blue]========== View Income by Date ==========[/bold blue]\n")
         
         # Get date input
         while True:
             try:
                 date_input = input("Enter date (DD/MM/YYYY): ").strip()
-                is_valid, iso_date = self.validate_date(date_input)
+                is_valid, iso_date = validate_date(date_input)
                 if is_valid:
-                    date_obj = datetime.strptime(iso_date, "%Y-%m-%d")
-                    year = date_obj.year
-                    month = date_obj.month
-                    day = date_obj.day
+                    # validate_date always returns zero-padded YYYY-MM-DD, so the fields can be sliced
+                    year, month, day = int(iso_date[0:4]), int(iso_date[5:7]), int(iso_date[8:10])
                     break
                 else:
-                    self.console.print("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
+                    echo("[red]Invalid date format! Please use DD/MM/YYYY format (e.g., 15/10/2025).[/red]")
             except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+                echo("\n[yellow]Cancelled.[/yellow]\n")
                 return
         
         # Get income for that date
@@ -839,32 +1028,59 @@ Month: {month_names[month]} {year}
         
         if not income:
             display_date = f"{day}/{month}/{year}"
-            self.console.print(f"\n[yellow]No income found for {display_date}.[/yellow]\n")
+            echo(f"\n[yellow]No income found for {display_date}.[/yellow]\n")
             return
         
         currency = self.ledger.currency
         display_date = f"{day}/{month}/{year}"
+        prefix = f"{currency} "
         
-        table = Table(title=f"Income for {display_date}", box=box.ROUNDED, show_header=True)
-        table.add_column("Amount", style="green", justify="right", width=18)
-        table.add_column("Category", style="yellow", width=20)
-        table.add_column("Description", style="white")
+        # Very long results are streamed as plain text pages like the full listings
+        if len(income) > self.COMPACT_ROW_LIMIT:
+            self._print_plain_rows(f"Income for {display_date}", income, prefix, False)
+            return
         
-        total = 0.0
-        for inc in income:
-            amount = float(inc['amount'])
-            total += amount
-            table.add_row(
-                f"{currency} {amount:.2f}",
-                inc['category'].title(),
-                inc.get('description', '')
-            )
+        table = self._date_table(f"Income for {display_date}", "green")
         
-        table.add_row(f"[bold green]{currency} {total:.2f}[/bold green]", "[bold]Total[/bold]", "")
+        # Amounts and cell strings are prepared first, then handed to Rich in a tight loop
+        amounts = [float(inc['amount']) for inc in income]
+        cells = [
+            (prefix + format(amount, '.2f'), Text(_title(inc['category'])), Text(inc.get('description') or ''))
+            for amount, inc in zip(amounts, income)
+        ]
+        for row in cells:
+            table.add_row(*row)
+        total = fsum(amounts)
         
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print()
+        table.add_row(Text(f"{currency} {total:.2f}", style="bold green"), _TOTAL_LABEL, "")
+        
+        # Spacing and table go out in a single render pass
+        echo("\n", table, "")
+    
+    def _prompt_validated(self, prompt: str, parse, error: str, default=None):
+        """
+        Prompt repeatedly until the input parses
+        
+        Args:
+            prompt: Input prompt
+            parse: Function taking the stripped input and returning the value, or None if invalid
+            error: Message markup printed after invalid input
+            default: Value returned for empty input (None: empty input is parsed like any other)
+            
+        Returns:
+            The parsed value
+            
+        Raises:
+            EOFError, KeyboardInterrupt: If the user cancels input
+        """
+        while True:
+            text = input(prompt).strip()
+            if not text and default is not None:
+                return default
+            value = parse(text)
+            if value is not None:
+                return value
+            self.console.print(error)
     
     def edit_delete_expense(self):
         """Edit or delete an expense record"""
@@ -898,21 +1114,15 @@ Month: {month_names[month]} {year}
         selected_expense = expenses[index]
         
         # Display action menu
-        self.console.print("\n[bold]Action:[/bold]")
-        self.console.print("[cyan]1.[/cyan] Edit")
-        self.console.print("[cyan]2.[/cyan] Delete")
-        self.console.print("[cyan]3.[/cyan] Cancel")
+        self.console.print(_ACTION_MENU_TEXT)
         
-        while True:
-            try:
-                action = input("\nSelect action (1-3): ").strip()
-                if action in ['1', '2', '3']:
-                    break
-                else:
-                    self.console.print("[red]Invalid choice! Please enter 1-3.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
+        try:
+            action = self._prompt_validated(
+                "\nSelect action (1-3): ", _ACTION_CHOICES.get, "[red]Invalid choice! Please enter 1-3.[/red]"
+            )
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+            return
         
         if action == '1':
             # Edit expense
@@ -928,6 +1138,7 @@ Month: {month_names[month]} {year}
         # Get current values
         try:
             current_date_str = f"{current_expense['day']}/{current_expense['month']}/{current_expense['year']}"
+            current_iso_date = f"{int(current_expense['year']):04d}-{int(current_expense['month']):02d}-{int(current_expense['day']):02d}"
             current_amount = float(current_expense['amount'])
             current_category = current_expense['category']
             current_description = current_expense.get('description', '')
@@ -935,61 +1146,32 @@ Month: {month_names[month]} {year}
             self.console.print("[red]Error reading current expense data![/red]")
             return
         
-        # Get date
-        while True:
-            try:
-                date_input = input(f"Enter date (DD/MM/YYYY) [{current_date_str}]: ").strip()
-                if not date_input:
-                    # Use current date
-                    date_obj = datetime(int(current_expense['year']), int(current_expense['month']), int(current_expense['day']))
-                    iso_date = date_obj.strftime("%Y-%m-%d")
-                    break
-                
-                is_valid, iso_date = self.validate_date(date_input)
-                if is_valid:
-                    break
-                else:
-                    self.console.print("[red]Invalid date format! Please use DD/MM/YYYY format.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
-        
-        # Get amount
-        while True:
-            try:
-                amount_str = input(f"Enter amount [{current_amount:.2f}]: ").strip()
-                if not amount_str:
-                    amount = current_amount
-                    break
-                
-                amount = self.validate_amount(amount_str)
-                if amount is not None:
-                    break
-                else:
-                    self.console.print("[red]Invalid amount! Please enter a positive number.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
-        
-        # Display category menu
-        category_map = self.display_category_menu(self.EXPENSE_CATEGORIES, "Select Expense Category")
-        
-        # Get category
-        while True:
-            try:
-                choice = input(f"Select category (1-{len(category_map)}) [current: {current_category}]: ").strip()
-                if not choice:
-                    category = current_category
-                    break
-                
-                if choice in category_map:
-                    category = category_map[choice]
-                    break
-                else:
-                    self.console.print("[red]Invalid category choice! Please select a valid option.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
+        # Empty input keeps the current value
+        try:
+            iso_date = self._prompt_validated(
+                f"Enter date (DD/MM/YYYY) [{current_date_str}]: ",
+                lambda text: self.validate_date(text)[1],
+                "[red]Invalid date format! Please use DD/MM/YYYY format.[/red]",
+                current_iso_date
+            )
+            amount = self._prompt_validated(
+                f"Enter amount [{current_amount:.2f}]: ",
+                self.validate_amount,
+                "[red]Invalid amount! Please enter a positive number.[/red]",
+                current_amount
+            )
+            
+            # Display category menu
+            category_options = self.display_category_menu(self.EXPENSE_CATEGORIES, "Select Expense Category")
+            category = self._prompt_validated(
+                f"Select category (1-{len(category_options)}) [current: {current_category}]: ",
+                lambda text: _choose(category_options, text),
+                "[red]Invalid category choice! Please select a valid option.[/red]",
+                current_category
+            )
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+            return
         
         # Get description
         try:
@@ -1010,9 +1192,11 @@ Month: {month_names[month]} {year}
         )
         
         if success:
-            display_date = datetime.strptime(iso_date, "%Y-%m-%d").strftime("%d/%m/%Y")
-            self.console.print(f"\n[bold green]Expense updated successfully![/bold green]")
-            self.console.print(f"[dim]{self.ledger.currency} {amount:.2f} - {category} on {display_date}[/dim]\n")
+            display_date = f"{iso_date[8:10]}/{iso_date[5:7]}/{iso_date[0:4]}"
+            self.console.print(
+                f"\n[bold green]Expense updated successfully![/bold green]\n"
+                f"[dim]{self.ledger.currency} {amount:.2f} - {category} on {display_date}[/dim]\n"
+            )
         else:
             self.console.print("\n[bold red]Failed to update expense![/bold red]\n")
     
@@ -1057,21 +1241,15 @@ Month: {month_names[month]} {year}
         selected_income = income[index]
         
         # Display action menu
-        self.console.print("\n[bold]Action:[/bold]")
-        self.console.print("[cyan]1.[/cyan] Edit")
-        self.console.print("[cyan]2.[/cyan] Delete")
-        self.console.print("[cyan]3.[/cyan] Cancel")
+        self.console.print(_ACTION_MENU_TEXT)
         
-        while True:
-            try:
-                action = input("\nSelect action (1-3): ").strip()
-                if action in ['1', '2', '3']:
-                    break
-                else:
-                    self.console.print("[red]Invalid choice! Please enter 1-3.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
+        try:
+            action = self._prompt_validated(
+                "\nSelect action (1-3): ", _ACTION_CHOICES.get, "[red]Invalid choice! Please enter 1-3.[/red]"
+            )
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+            return
         
         if action == '1':
             # Edit income
@@ -1087,6 +1265,7 @@ Month: {month_names[month]} {year}
         # Get current values
         try:
             current_date_str = f"{current_income['day']}/{current_income['month']}/{current_income['year']}"
+            current_iso_date = f"{int(current_income['year']):04d}-{int(current_income['month']):02d}-{int(current_income['day']):02d}"
             current_amount = float(current_income['amount'])
             current_category = current_income['category']
             current_description = current_income.get('description', '')
@@ -1094,61 +1273,32 @@ Month: {month_names[month]} {year}
             self.console.print("[red]Error reading current income data![/red]")
             return
         
-        # Get date
-        while True:
-            try:
-                date_input = input(f"Enter date (DD/MM/YYYY) [{current_date_str}]: ").strip()
-                if not date_input:
-                    # Use current date
-                    date_obj = datetime(int(current_income['year']), int(current_income['month']), int(current_income['day']))
-                    iso_date = date_obj.strftime("%Y-%m-%d")
-                    break
-                
-                is_valid, iso_date = self.validate_date(date_input)
-                if is_valid:
-                    break
-                else:
-                    self.console.print("[red]Invalid date format! Please use DD/MM/YYYY format.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
-        
-        # Get amount
-        while True:
-            try:
-                amount_str = input(f"Enter amount [{current_amount:.2f}]: ").strip()
-                if not amount_str:
-                    amount = current_amount
-                    break
-                
-                amount = self.validate_amount(amount_str)
-                if amount is not None:
-                    break
-                else:
-                    self.console.print("[red]Invalid amount! Please enter a positive number.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
-        
-        # Display category menu
-        category_map = self.display_category_menu(self.INCOME_CATEGORIES, "Select Income Category")
-        
-        # Get category
-        while True:
-            try:
-                choice = input(f"Select category (1-{len(category_map)}) [current: {current_category}]: ").strip()
-                if not choice:
-                    category = current_category
-                    break
-                
-                if choice in category_map:
-                    category = category_map[choice]
-                    break
-                else:
-                    self.console.print("[red]Invalid category choice! Please select a valid option.[/red]")
-            except (EOFError, KeyboardInterrupt):
-                self.console.print("\n[yellow]Cancelled.[/yellow]\n")
-                return
+        # Empty input keeps the current value
+        try:
+            iso_date = self._prompt_validated(
+                f"Enter date (DD/MM/YYYY) [{current_date_str}]: ",
+                lambda text: self.validate_date(text)[1],
+                "[red]Invalid date format! Please use DD/MM/YYYY format.[/red]",
+                current_iso_date
+            )
+            amount = self._prompt_validated(
+                f"Enter amount [{current_amount:.2f}]: ",
+                self.validate_amount,
+                "[red]Invalid amount! Please enter a positive number.[/red]",
+                current_amount
+            )
+            
+            # Display category menu
+            category_options = self.display_category_menu(self.INCOME_CATEGORIES, "Select Income Category")
+            category = self._prompt_validated(
+                f"Select category (1-{len(category_options)}) [current: {current_category}]: ",
+                lambda text: _choose(category_options, text),
+                "[red]Invalid category choice! Please select a valid option.[/red]",
+                current_category
+            )
+        except (EOFError, KeyboardInterrupt):
+            self.console.print("\n[yellow]Cancelled.[/yellow]\n")
+            return
         
         # Get description
         try:
@@ -1169,9 +1319,11 @@ Month: {month_names[month]} {year}
         )
         
         if success:
-            display_date = datetime.strptime(iso_date, "%Y-%m-%d").strftime("%d/%m/%Y")
-            self.console.print(f"\n[bold green]Income updated successfully![/bold green]")
-            self.console.print(f"[dim]{self.ledger.currency} {amount:.2f} - {category} on {display_date}[/dim]\n")
+            display_date = f"{iso_date[8:10]}/{iso_date[5:7]}/{iso_date[0:4]}"
+            self.console.print(
+                f"\n[bold green]Income updated successfully![/bold green]\n"
+                f"[dim]{self.ledger.currency} {amount:.2f} - {category} on {display_date}[/dim]\n"
+            )
         else:
             self.console.print("\n[bold red]Failed to update income![/bold red]\n")
     